@@ -21,7 +21,11 @@ for use within Abydos, including implementations of the following:
 
         - :py:class:`.Arithmetic` for arithmetic coding
         - :py:class:`.BWT` for Burrows-Wheeler Transform
+        - :py:class:`.RangeCoder` for fixed-precision integer arithmetic
+          (range) coding
         - :py:class:`.RLE` for Run-Length Encoding
+        - :py:class:`.StreamingRLE` for streaming, byte-oriented Run-Length
+          Encoding
 
 
 Each class exposes ``encode`` and ``decode`` methods for performing and
@@ -39,12 +43,16 @@ performed by creating a :py:class:`.BWT` object and then calling
 
 from ._arithmetic import Arithmetic
 from ._bwt import BWT
+from ._range_coder import RangeCoder
 from ._rle import RLE
+from ._streaming_rle import StreamingRLE
 
 __all__ = [
     'Arithmetic',
     'BWT',
+    'RangeCoder',
     'RLE',
+    'StreamingRLE',
 ]
 
 
@@ -19,6 +19,15 @@
 Burrows-Wheeler Transform encoder/decoder
 """
 
+from typing import List
+
+from numpy import concatenate as np_concatenate
+from numpy import cumsum as np_cumsum
+from numpy import empty as np_empty
+from numpy import fromiter as np_fromiter
+from numpy import int64 as np_int64
+from numpy import lexsort as np_lexsort
+
 __all__ = ['BWT']
 
 
@@ -29,9 +38,18 @@ class BWT:
     together to improve compression.
     Cf. :cite:`Burrows:1994`.
 
+    Since the terminator occurs exactly once, sorting the rotations of a word
+    is equivalent to sorting its suffixes. Words longer than a few hundred
+    characters are therefore sorted by a prefix-doubling suffix array
+    construction in O(n log n) time and space rather than by materialising
+    every rotation, and decoding inverts the transform by its last-to-first
+    column mapping, so megabyte-sized inputs can be transformed.
+
     .. versionadded:: 0.3.6
     """
 
+    _suffix_sort_min_len = 256
+
     def __init__(self, terminator: str = '\0') -> None:
         """Initialize BWT instance.
 
@@ -91,10 +109,12 @@ class BWT:
                 )
             else:
                 word += self._terminator
-                wordlist = sorted(
-                    word[i:] + word[:i] for i in range(len(word))
-                )
-                return ''.join([w[-1] for w in wordlist])
+                if len(word) < self._suffix_sort_min_len:
+                    wordlist = sorted(
+                        word[i:] + word[:i] for i in range(len(word))
+                    )
+                    return ''.join([w[-1] for w in wordlist])
+                return ''.join([word[i - 1] for i in self._suffix_array(word)])
         else:
             return self._terminator
 
@@ -142,16 +162,68 @@ class BWT:
                     )
                 )
             else:
-                wordlist = [''] * len(code)
-                for i in range(len(code)):
-                    wordlist = sorted(
-                        code[i] + wordlist[i] for i in range(len(code))
-                    )
-                rows = [w for w in wordlist if w[-1] == self._terminator][0]
-                return rows.rstrip(self._terminator)
+                # The stable sort of the last column gives the first column;
+                # the rotation ending in code[i] begins at row lf_map[i].
+                lf_map = [0] * len(code)
+                for row, i in enumerate(
+                    sorted(range(len(code)), key=code.__getitem__)
+                ):
+                    lf_map[i] = row
+
+                row = code.index(self._terminator)
+                letters = []
+                for _ in range(len(code)):
+                    letters.append(code[row])
+                    row = lf_map[row]
+                return ''.join(reversed(letters)).rstrip(self._terminator)
         else:
             return ''
 
+    def _suffix_array(self, word: str) -> List[int]:
+        """Return the suffix array of a word by prefix doubling.
+
+        Parameters
+        ----------
+        word : str
+            The word (including its terminator) to sort the suffixes of
+
+        Returns
+        -------
+        list
+            The starting positions of the suffixes of word in sorted order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        length = len(word)
+        rank = np_fromiter(map(ord, word), dtype=np_int64, count=length)
+        step = 1
+        while True:
+            # Sort by (rank of the first step characters, rank of the next
+            # step characters), with -1 standing in past the end of the word.
+            second = np_empty(length, dtype=np_int64)
+            second[: length - step] = rank[step:]
+            second[length - step :] = -1
+            order = np_lexsort((second, rank))
+
+            sorted_rank = rank[order]
+            sorted_second = second[order]
+            new_rank = np_empty(length, dtype=np_int64)
+            new_rank[order] = np_concatenate(
+                (
+                    [0],
+                    np_cumsum(
+                        (sorted_rank[1:] != sorted_rank[:-1])
+                        | (sorted_second[1:] != sorted_second[:-1])
+                    ),
+                )
+            )
+            rank = new_rank
+            if rank[order[-1]] == length - 1 or step >= length:
+                return order.tolist()
+            step <<= 1
+
 
 if __name__ == '__main__':
     import doctest
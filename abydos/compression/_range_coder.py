@@ -0,0 +1,476 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.compression._range_coder.
+
+Fixed-precision integer range coder/decoder
+"""
+
+from bisect import bisect_right
+from collections import Counter
+from fractions import Fraction
+from math import gcd, log2
+from typing import Dict, List, Tuple, Union
+
+__all__ = ['RangeCoder']
+
+
+class RangeCoder:
+    """Range Coder.
+
+    This is a fixed-precision integer implementation of arithmetic coding,
+    following the renormalisation scheme of :cite:`Witten:1987`. Unlike
+    :py:class:`.Arithmetic`, whose rational intervals grow with the length of
+    the message, all interval arithmetic here is performed on integers of
+    ``precision`` bits, so encoding time is linear in the length of the text.
+
+    The model is the same 0-order model used by :py:class:`.Arithmetic` and is
+    exposed through the same ``train``, ``get_probs``, and ``set_probs``
+    methods, so the two coders can share trained models.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        text: Union[str, None] = None,
+        precision: int = 32,
+        adaptive: bool = False,
+    ) -> None:
+        """Initialize range coder object.
+
+        Parameters
+        ----------
+        text : str or None
+            The training text
+        precision : int
+            The number of bits of the coder's registers (e.g. 32 or 64)
+        adaptive : bool
+            If True, the symbol frequencies are updated after each symbol is
+            coded, starting from the trained frequencies. The encoder and
+            decoder must use the same setting.
+
+        Raises
+        ------
+        ValueError
+            Precision must be at least 16 bits.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if precision < 16:
+            raise ValueError('Precision must be at least 16 bits.')
+        self._precision = precision
+        self._adaptive = adaptive
+
+        self._full = 1 << precision
+        self._half = self._full >> 1
+        self._quarter = self._half >> 1
+        # The total frequency must not exceed a quarter of the range so that
+        # every symbol retains a non-empty interval after renormalisation.
+        self._max_total = self._quarter
+
+        self._symbols = []  # type: List[str]
+        self._counts = []  # type: List[int]
+        self._cum = {}  # type: Dict[str, Tuple[int, int]]
+        self._highs = []  # type: List[int]
+        self._total = 0
+
+        if text is not None:
+            self.train(text)
+
+    def get_probs(self) -> Dict[str, Tuple[Fraction, Fraction]]:
+        """Return the probs dictionary.
+
+        Returns
+        -------
+        dict
+            The dictionary of probabilities
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            char: (Fraction(low, self._total), Fraction(high, self._total))
+            for char, (low, high) in self._cum.items()
+        }
+
+    def set_probs(self, probs: Dict[str, Tuple[Fraction, Fraction]]) -> None:
+        """Set the probs dictionary.
+
+        The probabilities are converted to integer frequencies over their
+        common denominator and rescaled, if necessary, to fit the precision of
+        the coder.
+
+        Parameters
+        ----------
+        probs : dict
+            The dictionary of probabilities, as returned by
+            :py:meth:`.Arithmetic.get_probs` or :py:meth:`.get_probs`
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        denom = 1
+        for low, high in probs.values():
+            for frac in (Fraction(low), Fraction(high)):
+                denom = (
+                    denom * frac.denominator // gcd(denom, frac.denominator)
+                )
+
+        items = sorted(probs.items(), key=lambda x: Fraction(x[1][0]))
+        self._set_counts(
+            [char for char, _ in items],
+            [
+                int((Fraction(high) - Fraction(low)) * denom)
+                for _, (low, high) in items
+            ],
+        )
+
+    def train(self, text: str) -> None:
+        r"""Generate a frequency table from the provided text.
+
+        Text to 0-order probability statistics
+
+        Parameters
+        ----------
+        text : str
+            The text data over which to calculate probability statistics. This
+            must not contain the NUL (0x00) character because that is used to
+            indicate the end of data.
+
+        Example
+        -------
+        >>> from abydos.compression import Arithmetic
+        >>> rc = RangeCoder()
+        >>> rc.train('the quick brown fox jumped over the lazy dog')
+        >>> rc.get_probs() == Arithmetic(
+        ...     'the quick brown fox jumped over the lazy dog').get_probs()
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if '\x00' in text:
+            text = text.replace('\x00', ' ')
+        counts = Counter(text)
+        counts['\x00'] = 1
+
+        items = sorted(
+            counts.items(), key=lambda x: (x[1], x[0]), reverse=True
+        )
+        self._set_counts(
+            [char for char, _ in items], [count for _, count in items]
+        )
+
+    def _set_counts(self, symbols: List[str], counts: List[int]) -> None:
+        """Store symbol frequencies and build the cumulative tables.
+
+        Parameters
+        ----------
+        symbols : list
+            The symbols of the model, in interval order
+        counts : list
+            The frequency of each symbol
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counts = [max(count, 1) for count in counts]
+        total = sum(counts)
+        if total > self._max_total:
+            counts = [
+                max(count * self._max_total // total, 1) for count in counts
+            ]
+            while sum(counts) > self._max_total:
+                counts = [max(count >> 1, 1) for count in counts]
+
+        self._symbols = symbols
+        self._counts = counts
+        self._cum = {}
+        self._highs = []
+        low = 0
+        for char, count in zip(symbols, counts):
+            self._cum[char] = (low, low + count)
+            low += count
+            self._highs.append(low)
+        self._total = low
+
+    def _adaptive_update(
+        self, counts: List[int], index: Dict[str, int], char: str
+    ) -> None:
+        """Increment a symbol's count, halving all counts when full.
+
+        Parameters
+        ----------
+        counts : list
+            The working frequency list of an adaptive pass
+        index : dict
+            A map from each symbol to its position in counts
+        char : str
+            The symbol that was just coded
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counts[index[char]] += 1
+        if sum(counts) > self._max_total:
+            for i in range(len(counts)):
+                counts[i] = max(counts[i] >> 1, 1)
+
+    def encode(self, text: str) -> Tuple[int, int]:
+        """Encode a text using range coding.
+
+        Text and the 0-order probability statistics -> longval, nbits
+
+        Parameters
+        ----------
+        text : str
+            A string to encode
+
+        Returns
+        -------
+        tuple
+            The range coded text, as an integer and its length in bits
+
+        Example
+        -------
+        >>> rc = RangeCoder('the quick brown fox jumped over the lazy dog')
+        >>> rc.encode('align')
+        (16720586179, 34)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if '\x00' in text:
+            text = text.replace('\x00', ' ')
+
+        half = self._half
+        quarter = self._quarter
+        three_quarters = half + quarter
+
+        cum = self._cum
+        total = self._total
+        counts = self._counts[:]
+        index = {char: i for i, char in enumerate(self._symbols)}
+
+        low = 0
+        high = self._full - 1
+        pending = 0
+        bits = []  # type: List[str]
+
+        for char in text + '\x00':
+            span = high - low + 1
+            if self._adaptive:
+                pos = index[char]
+                sym_low = sum(counts[:pos])
+                sym_high = sym_low + counts[pos]
+                total = sum(counts)
+            else:
+                sym_low, sym_high = cum[char]
+            high = low + span * sym_high // total - 1
+            low = low + span * sym_low // total
+
+            while True:
+                if high < half:
+                    bits.append('0' + '1' * pending)
+                    pending = 0
+                elif low >= half:
+                    bits.append('1' + '0' * pending)
+                    pending = 0
+                    low -= half
+                    high -= half
+                elif low >= quarter and high < three_quarters:
+                    pending += 1
+                    low -= quarter
+                    high -= quarter
+                else:
+                    break
+                low <<= 1
+                high = (high << 1) | 1
+
+            if self._adaptive:
+                self._adaptive_update(counts, index, char)
+
+        pending += 1
+        if low < quarter:
+            bits.append('0' + '1' * pending)
+        else:
+            bits.append('1' + '0' * pending)
+
+        # Trailing zeros are implied by the decoder, so they are dropped.
+        code = ''.join(bits).rstrip('0') or '0'
+        return int(code, 2), len(code)
+
+    def decode(self, longval: int, nbits: int) -> str:
+        """Decode the number to a string using the given statistics.
+
+        Parameters
+        ----------
+        longval : int
+            The first part of an encoded tuple from encode
+        nbits : int
+            The second part of an encoded tuple from encode
+
+        Returns
+        -------
+        str
+            The range decoded text
+
+        Example
+        -------
+        >>> rc = RangeCoder('the quick brown fox jumped over the lazy dog')
+        >>> rc.decode(16720586179, 34)
+        'align'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._symbols or nbits <= 0:
+            return ''
+
+        precision = self._precision
+        half = self._half
+        quarter = self._quarter
+        three_quarters = half + quarter
+
+        code = format(longval, '0{}b'.format(nbits))
+        if len(code) < precision:
+            code += '0' * (precision - len(code))
+        value = int(code[:precision], 2)
+        pos = precision
+        code_len = len(code)
+
+        symbols = self._symbols
+        highs = self._highs
+        total = self._total
+        counts = self._counts[:]
+        index = {char: i for i, char in enumerate(symbols)}
+
+        low = 0
+        high = self._full - 1
+        letters = []
+
+        while True:
+            span = high - low + 1
+            if self._adaptive:
+                total = sum(counts)
+                target = ((value - low + 1) * total - 1) // span
+                sym_low = 0
+                for i, count in enumerate(counts):
+                    if target < sym_low + count:
+                        break
+                    sym_low += count
+                char = symbols[i]
+                sym_high = sym_low + count
+            else:
+                target = ((value - low + 1) * total - 1) // span
+                i = bisect_right(highs, target)
+                char = symbols[i]
+                sym_low, sym_high = self._cum[char]
+
+            if char == '\x00':
+                break
+            letters.append(char)
+
+            high = low + span * sym_high // total - 1
+            low = low + span * sym_low // total
+
+            while True:
+                if high < half:
+                    pass
+                elif low >= half:
+                    low -= half
+                    high -= half
+                    value -= half
+                elif low >= quarter and high < three_quarters:
+                    low -= quarter
+                    high -= quarter
+                    value -= quarter
+                else:
+                    break
+                low <<= 1
+                high = (high << 1) | 1
+                value <<= 1
+                if pos < code_len:
+                    value |= code[pos] == '1'
+                    pos += 1
+
+            if self._adaptive:
+                self._adaptive_update(counts, index, char)
+
+        return ''.join(letters)
+
+    def code_length(self, text: str) -> float:
+        """Return the ideal code length of a text in bits.
+
+        This is the sum of -log2 p over the symbols of the text (including
+        the end-of-data symbol), under the current model. It estimates the
+        length of the encoded text without producing any output, which is
+        considerably faster than :py:meth:`.encode`.
+
+        Parameters
+        ----------
+        text : str
+            A string to measure
+
+        Returns
+        -------
+        float
+            The code length in bits
+
+        Example
+        -------
+        >>> rc = RangeCoder('the quick brown fox jumped over the lazy dog')
+        >>> round(rc.code_length('align'), 6)
+        32.951119
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if '\x00' in text:
+            text = text.replace('\x00', ' ')
+
+        if self._adaptive:
+            counts = self._counts[:]
+            index = {char: i for i, char in enumerate(self._symbols)}
+            length = 0.0
+            for char in text + '\x00':
+                length += log2(sum(counts)) - log2(counts[index[char]])
+                self._adaptive_update(counts, index, char)
+            return length
+
+        cum = self._cum
+        length = (len(text) + 1) * log2(self._total)
+        for char, count in Counter(text + '\x00').items():
+            sym_low, sym_high = cum[char]
+            length -= count * log2(sym_high - sym_low)
+        return length
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
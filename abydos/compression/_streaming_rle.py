@@ -0,0 +1,296 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.compression._streaming_rle.
+
+Streaming, byte-oriented Run-Length Encoding encoder/decoder
+"""
+
+import re
+from typing import Iterable, Iterator, Match, Union
+
+__all__ = ['StreamingRLE']
+
+_Bytes = Union[bytes, bytearray, memoryview]
+
+
+class StreamingRLE:
+    """Streaming Run-Length Encoding.
+
+    This produces the same encoding as :py:class:`.RLE`, but operates
+    incrementally on bytes-like objects: a run (or a run count) that is split
+    across chunk boundaries is carried over to the next call, so a stream can
+    be encoded or decoded chunk by chunk in bounded memory. Within a chunk,
+    runs are found, and literal stretches copied, by the regular expression
+    engine rather than character by character.
+
+    As with :py:class:`.RLE`, the digits 0-9 cannot be in the data.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _digit_bytes = b'0123456789'
+    _long_run = re.compile(rb'(.)\1\1+', re.DOTALL)
+    _count = re.compile(rb'([0-9]+)([^0-9])')
+
+    def __init__(self) -> None:
+        """Initialize StreamingRLE instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._run_byte = b''
+        self._run_len = 0
+        self._digits = b''
+
+    def reset(self) -> None:
+        """Discard any run or count carried over from previous chunks.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._run_byte = b''
+        self._run_len = 0
+        self._digits = b''
+
+    def encode(self, data: _Bytes, final: bool = True) -> bytes:
+        r"""Perform run-length encoding of a chunk of bytes.
+
+        Parameters
+        ----------
+        data : bytes, bytearray, or memoryview
+            A chunk of data to encode
+        final : bool
+            If False, the run at the end of the chunk is held back, since it
+            may continue into the next chunk
+
+        Returns
+        -------
+        bytes
+            The encoded chunk
+
+        Examples
+        --------
+        >>> rle = StreamingRLE()
+        >>> rle.encode(b'aaabaabababa')
+        b'3abaabababa'
+        >>> rle.encode(b'aaab', final=False)
+        b'3a'
+        >>> rle.encode(b'bbbb')
+        b'5b'
+
+        Paired with :py:class:`.BWT`:
+
+        >>> from abydos.compression import BWT
+        >>> rle.encode(BWT().encode('aaabaabababa').encode('utf-8'))
+        b'ab\x00abbab5a'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        data = bytes(data)
+        encoded = []
+
+        if self._run_byte:
+            rest = data.lstrip(self._run_byte)
+            self._run_len += len(data) - len(rest)
+            data = rest
+            if data or final:
+                encoded.append(self._encode_run(self._run_byte, self._run_len))
+                self._run_byte = b''
+                self._run_len = 0
+
+        if data and not final:
+            self._run_byte = data[-1:]
+            body = data.rstrip(self._run_byte)
+            self._run_len = len(data) - len(body)
+            data = body
+
+        encoded.append(self._long_run.sub(self._encode_match, data))
+        return b''.join(encoded)
+
+    @staticmethod
+    def _encode_run(byte: bytes, length: int) -> bytes:
+        """Return the encoding of a single run.
+
+        Parameters
+        ----------
+        byte : bytes
+            The byte of the run
+        length : int
+            The length of the run
+
+        Returns
+        -------
+        bytes
+            The encoded run
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if length > 2:
+            return b'%d' % length + byte
+        return byte * length
+
+    @staticmethod
+    def _encode_match(match: Match[bytes]) -> bytes:
+        """Return the encoding of a matched run of three or more bytes.
+
+        Parameters
+        ----------
+        match : re.Match
+            The matched run
+
+        Returns
+        -------
+        bytes
+            The encoded run
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return b'%d' % (match.end() - match.start()) + match.group(1)
+
+    def decode(self, data: _Bytes, final: bool = True) -> bytes:
+        r"""Perform decoding of a chunk of run-length encoded bytes.
+
+        Parameters
+        ----------
+        data : bytes, bytearray, or memoryview
+            A chunk of data to decode
+        final : bool
+            If False, a count at the end of the chunk is held back, since its
+            byte (or further digits) will arrive in the next chunk
+
+        Returns
+        -------
+        bytes
+            The decoded chunk
+
+        Examples
+        --------
+        >>> rle = StreamingRLE()
+        >>> rle.decode(b'3abaabababa')
+        b'aaabaabababa'
+        >>> rle.decode(b'3a1', final=False)
+        b'aaa'
+        >>> rle.decode(b'2b')
+        b'bbbbbbbbbbbb'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        data = self._digits + bytes(data)
+        body = data.rstrip(self._digit_bytes)
+        # As in RLE.decode, a count with no following byte at the end of the
+        # data is discarded.
+        self._digits = b'' if final else data[len(body) :]
+
+        return self._count.sub(self._decode_match, body)
+
+    @staticmethod
+    def _decode_match(match: Match[bytes]) -> bytes:
+        """Return the expansion of a matched count and byte.
+
+        Parameters
+        ----------
+        match : re.Match
+            The matched count and byte
+
+        Returns
+        -------
+        bytes
+            The expanded run
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return match.group(2) * int(match.group(1))
+
+    def iterencode(self, chunks: Iterable[_Bytes]) -> Iterator[bytes]:
+        r"""Run-length encode an iterable of chunks.
+
+        Parameters
+        ----------
+        chunks : iterable
+            An iterable of bytes-like chunks to encode
+
+        Yields
+        ------
+        bytes
+            The non-empty encoded chunks
+
+        Examples
+        --------
+        >>> rle = StreamingRLE()
+        >>> b''.join(rle.iterencode([b'WWWWWWWWWWWWB', b'WWW', b'WWWWWWWWW']))
+        b'12WB12W'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.reset()
+        for chunk in chunks:
+            encoded = self.encode(chunk, final=False)
+            if encoded:
+                yield encoded
+        encoded = self.encode(b'')
+        if encoded:
+            yield encoded
+
+    def iterdecode(self, chunks: Iterable[_Bytes]) -> Iterator[bytes]:
+        r"""Decode an iterable of run-length encoded chunks.
+
+        Parameters
+        ----------
+        chunks : iterable
+            An iterable of bytes-like chunks to decode
+
+        Yields
+        ------
+        bytes
+            The non-empty decoded chunks
+
+        Examples
+        --------
+        >>> rle = StreamingRLE()
+        >>> b''.join(rle.iterdecode([b'1', b'2WB1', b'2W']))
+        b'WWWWWWWWWWWWBWWWWWWWWWWWW'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.reset()
+        for chunk in chunks:
+            decoded = self.decode(chunk, final=False)
+            if decoded:
+                yield decoded
+        decoded = self.decode(b'')
+        if decoded:
+            yield decoded
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -20,9 +20,28 @@ The Corpus class is a container for linguistic corpora and includes various
 functions for corpus statistics, language modeling, etc.
 """
 
+from array import array
+from codecs import open as c_open
 from math import log
-from typing import Callable, List, Optional, Set, Tuple, Union
-
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from numpy import empty as np_empty
+from numpy import frombuffer as np_frombuffer
+from numpy import searchsorted as np_searchsorted
+from numpy import uint32 as np_uint32
+from numpy import unique as np_unique
+
+from ._vocabulary import _Vocabulary
 from ..tokenizer import _Tokenizer
 
 __all__ = ['Corpus']
@@ -36,6 +55,16 @@ class Corpus:
     documents. And each sentence is an ordered list of words that make up that
     sentence.
 
+    A corpus may instead be streamed from a file or an iterable of documents,
+    using :py:meth:`from_file` or :py:meth:`from_iterable`, in which case its
+    documents are read & tokenized each time they are iterated over, and never
+    held in memory all at once. The ``iter_`` methods iterate over any corpus
+    lazily; the other methods return lists.
+
+    Calling :py:meth:`compact` replaces a corpus's lists of words with a
+    vocabulary and an array of word ids, which takes a fraction of the
+    memory.
+
     .. versionadded:: 0.1.0
     """
 
@@ -87,28 +116,315 @@ class Corpus:
         self.doc_split = doc_split
         self.sent_split = sent_split
 
+        self._filter_chars = set(filter_chars)
+        self._stop_words = set(stop_words) if stop_words else set()
+        self._word_tokenizer = word_tokenizer
+        # For a streamed corpus, a function returning an iterator over the
+        # text of its documents
+        self._source = None  # type: Optional[Callable[[], Iterable[str]]]
+        # For a compacted corpus, the vocabulary, the word ids of all of its
+        # words, the end (in words) of each sentence, and the end (in
+        # sentences) of each document
+        self._vocab = None  # type: Optional[_Vocabulary]
+        self._tokens = array('I')
+        self._sent_ends = array('Q')
+        self._doc_ends = array('Q')
+
         for document in corpus_text.split(doc_split):
-            doc = []  # type: List[List[str]]
-            for sentence in document.split(sent_split):
-                if word_tokenizer:
-                    word_tokenizer.tokenize(sentence)
-                    sentence_words = word_tokenizer.get_list()
-                else:
-                    sentence_words = sentence.split()
-
-                if stop_words:
-                    for word in set(stop_words):
-                        while word in sentence_words:
-                            sentence_words.remove(word)
-                for char in set(filter_chars):
-                    sentence_words = [
-                        word.replace(char, '') for word in sentence_words
-                    ]
-                if sentence_words:
-                    doc.append(sentence_words)
+            doc = self._tokenize_doc(document)
             if doc:
                 self.corpus.append(doc)
 
+    def _tokenize_doc(self, document: str) -> List[List[str]]:
+        """Split a document into sentences of filtered words.
+
+        Parameters
+        ----------
+        document : str
+            The text of the document
+
+        Returns
+        -------
+        [[str]]
+            The non-empty sentences of the document
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        doc = []  # type: List[List[str]]
+        for sentence in document.split(self.sent_split):
+            if self._word_tokenizer:
+                self._word_tokenizer.tokenize(sentence)
+                sentence_words = self._word_tokenizer.get_list()
+            else:
+                sentence_words = sentence.split()
+
+            if self._stop_words:
+                sentence_words = [
+                    word
+                    for word in sentence_words
+                    if word not in self._stop_words
+                ]
+            for char in self._filter_chars:
+                sentence_words = [
+                    word.replace(char, '') for word in sentence_words
+                ]
+            if sentence_words:
+                doc.append(sentence_words)
+        return doc
+
+    @classmethod
+    def from_iterable(
+        cls,
+        documents: Iterable[str],
+        sent_split: str = '\n',
+        filter_chars: Union[str, List[str], Set[str], Tuple[str]] = '',
+        stop_words: Optional[Union[List[str], Set[str], Tuple[str]]] = None,
+        word_tokenizer: Optional[_Tokenizer] = None,
+    ) -> 'Corpus':
+        r"""Return a corpus streamed from an iterable of documents.
+
+        The documents are tokenized each time the corpus is iterated over, so
+        if documents is an iterator, rather than e.g. a list, the corpus can be
+        iterated over only once.
+
+        Parameters
+        ----------
+        documents : iterable
+            The text of each document
+        sent_split : str
+            A character or string used to split documents into sentences
+        filter_chars : list or set or tuple or str
+            A list of characters (as a string, tuple, set, or list) to filter
+            out of the corpus text
+        stop_words : list or set or tuple
+            A list of words (as a tuple, set, or list) to filter out of the
+            corpus text
+        word_tokenizer : _Tokenizer
+            A tokenizer to apply to each sentence in order to retrieve the
+            individual "word" tokens. If set to none, str.split() will be used.
+
+        Returns
+        -------
+        Corpus
+            The streamed corpus
+
+        Example
+        -------
+        >>> docs = ['The quick brown fox.\nIt jumped.', 'The lazy dog slept.']
+        >>> corp = Corpus.from_iterable(docs, stop_words=['The'])
+        >>> list(corp.iter_sents())
+        [['quick', 'brown', 'fox.'], ['It', 'jumped.'], ['lazy', 'dog',
+        'slept.']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        corpus = cls(
+            '',
+            sent_split=sent_split,
+            filter_chars=filter_chars,
+            stop_words=stop_words,
+            word_tokenizer=word_tokenizer,
+        )
+        corpus._source = lambda: documents
+        return corpus
+
+    @classmethod
+    def from_file(
+        cls,
+        filename: str,
+        doc_split: str = '\n\n',
+        sent_split: str = '\n',
+        filter_chars: Union[str, List[str], Set[str], Tuple[str]] = '',
+        stop_words: Optional[Union[List[str], Set[str], Tuple[str]]] = None,
+        word_tokenizer: Optional[_Tokenizer] = None,
+        encoding: str = 'utf-8',
+        chunk_size: int = 1 << 20,
+    ) -> 'Corpus':
+        r"""Return a corpus streamed from a text file.
+
+        The file is read, in chunks, each time the corpus is iterated over,
+        so only one document at a time is held in memory. It is split into
+        documents, sentences, and words exactly as :py:class:`Corpus` splits
+        corpus_text.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file containing the corpus text
+        doc_split : str
+            A character or string used to split the text into documents
+        sent_split : str
+            A character or string used to split documents into sentences
+        filter_chars : list or set or tuple or str
+            A list of characters (as a string, tuple, set, or list) to filter
+            out of the corpus text
+        stop_words : list or set or tuple
+            A list of words (as a tuple, set, or list) to filter out of the
+            corpus text
+        word_tokenizer : _Tokenizer
+            A tokenizer to apply to each sentence in order to retrieve the
+            individual "word" tokens. If set to none, str.split() will be used.
+        encoding : str
+            The encoding of the file
+        chunk_size : int
+            The number of characters to read from the file at a time
+
+        Returns
+        -------
+        Corpus
+            The streamed corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+        def _documents() -> Iterator[str]:
+            with c_open(filename, 'r', encoding=encoding) as corpus_file:
+                chunks = iter(lambda: corpus_file.read(chunk_size), '')
+                yield from _split_stream(chunks, doc_split)
+
+        corpus = cls.from_iterable(
+            (),
+            sent_split=sent_split,
+            filter_chars=filter_chars,
+            stop_words=stop_words,
+            word_tokenizer=word_tokenizer,
+        )
+        corpus.doc_split = doc_split
+        corpus._source = _documents
+        return corpus
+
+    def iter_docs(self) -> Iterator[List[List[str]]]:
+        r"""Iterate over the docs in the corpus.
+
+        Yields
+        ------
+        [[str]]
+            Each doc in the corpus, as a list of sentences, each of which is a
+            list of words
+
+        Example
+        -------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> corp = Corpus(tqbf)
+        >>> for doc in corp.iter_docs():
+        ...     print(doc)
+        [['The', 'quick', 'brown', 'fox', 'jumped', 'over', 'the', 'lazy',
+        'dog.']]
+        [['And', 'then', 'it', 'slept.'], ['And', 'the', 'dog', 'ran',
+        'off.']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._vocab is not None:
+            words = self._vocab.words()
+            tokens = self._tokens
+            sent_ends = self._sent_ends
+            sent = start = 0
+            for doc_end in self._doc_ends:
+                doc = []
+                for end in sent_ends[sent:doc_end]:
+                    doc.append([words[i] for i in tokens[start:end]])
+                    start = end
+                sent = doc_end
+                yield doc
+            return
+        if self._source is None:
+            yield from self.corpus
+            return
+        for document in self._source():
+            doc = self._tokenize_doc(document)
+            if doc:
+                yield doc
+
+    def compact(self) -> None:
+        r"""Store the corpus as an array of word ids.
+
+        Each word is replaced by its id in a sorted vocabulary, and the
+        boundaries of sentences & documents are kept as arrays of offsets. A
+        streamed corpus is read once, and thereafter held in memory in this
+        form.
+
+        Example
+        -------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> corp = Corpus(tqbf)
+        >>> corp.compact()
+        >>> corp.sents()[1]
+        ['And', 'then', 'it', 'slept.']
+        >>> round(corp.idf('dog'), 10)
+        0.6931471806
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # Ids are first assigned in order of appearance, then remapped to
+        # their words' positions in the sorted vocabulary.
+        ids = {}  # type: Dict[str, int]
+        tokens = array('I')
+        sent_ends = array('Q')
+        doc_ends = array('Q')
+        for doc in self.iter_docs():
+            for sent in doc:
+                tokens.extend(
+                    [ids.setdefault(word, len(ids)) for word in sent]
+                )
+                sent_ends.append(len(tokens))
+            doc_ends.append(len(sent_ends))
+
+        vocab = _Vocabulary(ids)
+        remap = np_empty(len(ids), dtype=np_uint32)
+        for word_id, word in enumerate(vocab.words()):
+            remap[ids[word]] = word_id
+        self._tokens = array(
+            'I', remap[np_frombuffer(tokens, dtype=np_uint32)].tobytes()
+        )
+        self._sent_ends = sent_ends
+        self._doc_ends = doc_ends
+        self._vocab = vocab
+        self.corpus = []
+        self._source = None
+
+    def iter_sents(self) -> Iterator[List[str]]:
+        r"""Iterate over the sentences in the corpus.
+
+        Yields
+        ------
+        [str]
+            Each sentence in the corpus, as a list of words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for doc in self.iter_docs():
+            yield from doc
+
+    def iter_words(self) -> Iterator[str]:
+        r"""Iterate over the words in the corpus.
+
+        Yields
+        ------
+        str
+            Each word in the corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for sent in self.iter_sents():
+            yield from sent
+
     def docs(self) -> List[List[List[str]]]:
         r"""Return the docs in the corpus.
 
@@ -136,7 +452,9 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        return self.corpus
+        if self._source is None and self._vocab is None:
+            return self.corpus
+        return list(self.iter_docs())
 
     def paras(self) -> List[List[List[str]]]:
         r"""Return the paragraphs in the corpus.
@@ -192,7 +510,7 @@ class Corpus:
         3
 
         """
-        return [words for sents in self.corpus for words in sents]
+        return list(self.iter_sents())
 
     def words(self) -> List[str]:
         r"""Return the words in the corpus as a single list.
@@ -218,7 +536,7 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        return [words for sents in self.sents() for words in sents]
+        return list(self.iter_words())
 
     def docs_of_words(self) -> List[List[str]]:
         r"""Return the docs in the corpus, with sentences flattened.
@@ -248,7 +566,8 @@ class Corpus:
 
         """
         return [
-            [words for sents in doc for words in sents] for doc in self.corpus
+            [words for sents in doc for words in sents]
+            for doc in self.iter_docs()
         ]
 
     def raw(self) -> str:
@@ -279,7 +598,7 @@ class Corpus:
 
         """
         doc_list = []
-        for doc in self.corpus:
+        for doc in self.iter_docs():
             sent_list = []
             for sent in doc:
                 sent_list.append(' '.join(sent))
@@ -324,23 +643,99 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
+        if self._vocab is not None and not transform:
+            return self._compact_idf(term)
+
+        docs = 0
         docs_with_term = 0
-        docs = self.docs_of_words()
-        for doc in docs:
-            doc_set = set(doc)
+        for doc in self.iter_docs():
+            docs += 1
             if transform:
-                transformed_doc = []
-                for word in doc_set:
-                    transformed_doc.append(transform(word))
-                doc_set = set(transformed_doc)
-
-            if term in doc_set:
+                if any(
+                    transform(word) == term for sent in doc for word in sent
+                ):
+                    docs_with_term += 1
+            elif any(term in sent for sent in doc):
                 docs_with_term += 1
 
         if docs_with_term == 0:
             return float('inf')
 
-        return log(len(docs) / docs_with_term)
+        return log(docs / docs_with_term)
+
+    def _compact_idf(self, term: str) -> float:
+        """Calculate the IDF of a term in a compacted corpus.
+
+        Parameters
+        ----------
+        term : str
+            The term to calculate the IDF of
+
+        Returns
+        -------
+        float
+            The IDF
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        term_id = self._vocab.id(term)  # type: ignore
+        if term_id < 0:
+            return float('inf')
+
+        # Find the documents holding each occurrence of the term from the
+        # word offsets at which documents end.
+        tokens = np_frombuffer(self._tokens, dtype=np_uint32)
+        doc_ends = np_frombuffer(self._sent_ends, dtype='Q')[
+            np_frombuffer(self._doc_ends, dtype='Q').astype('int64') - 1
+        ]
+        docs = np_searchsorted(
+            doc_ends, (tokens == term_id).nonzero()[0], side='right'
+        )
+        return log(len(self._doc_ends) / len(np_unique(docs)))
+
+
+def _split_stream(chunks: Iterable[str], sep: str) -> Iterator[str]:
+    """Split a stream of text on a separator.
+
+    Parameters
+    ----------
+    chunks : iterable
+        The text, in consecutive chunks
+    sep : str
+        The separator
+
+    Yields
+    ------
+    str
+        Each part of the text, as str.split would return them
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # The text since the last separator is carried over in pieces, and only
+    # its last len(sep) - 1 characters, which may begin a separator, are
+    # searched again with each new chunk.
+    keep = len(sep) - 1
+    pieces = []  # type: List[str]
+    carried = 0
+    tail = ''
+    for chunk in chunks:
+        window = tail + chunk
+        parts = window.split(sep)
+        if len(parts) == 1:
+            pieces.append(chunk)
+            carried += len(chunk)
+            tail = window[-keep:] if keep else ''
+            continue
+        yield ''.join(pieces)[: carried - len(tail)] + parts[0]
+        yield from parts[1:-1]
+        pieces = [parts[-1]]
+        carried = len(parts[-1])
+        tail = parts[-1][-keep:] if keep else ''
+    yield ''.join(pieces)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,247 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._gng.
+
+The corpus._gng module defines functions for importing Google NGram corpora
+that are split into shards, parsing the shards in parallel into sorted count
+tables, which are then merged.
+"""
+
+import gzip
+from codecs import open as c_open
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..util._parallel import _parallel_map
+
+__all__ = []  # type: List[str]
+
+
+def _open_shard(path: str) -> IO[str]:
+    """Open a shard file, which may be gzip-compressed, for reading.
+
+    Parameters
+    ----------
+    path : str
+        The path of the shard
+
+    Returns
+    -------
+    file
+        The shard, opened as UTF-8 text
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    with open(path, 'rb') as shard:
+        magic = shard.read(2)
+    if magic == b'\x1f\x8b':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return c_open(path, 'r', encoding='utf-8')
+
+
+def _parse_unigram_shard(path: str) -> Tuple[int, List[Tuple[Any, ...]]]:
+    """Count the terms of a Google NGram 1-gram shard.
+
+    Part-of-speech tags (e.g. the ``_NOUN`` of ``time_NOUN``) are removed
+    from terms, and the counts of each term over all years are summed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the shard
+
+    Returns
+    -------
+    tuple
+        The number of lines in the shard, and a list of (term, count, document
+        count) tuples, sorted by term
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    counts = {}  # type: Dict[str, List[int]]
+    lines = 0
+    with _open_shard(path) as gng:
+        for line in gng:
+            lines += 1
+            word, _, count, doc_count = line.rstrip().split('\t')
+            if '_' in word:
+                word = word[: word.find('_')]
+            totals = counts.get(word)
+            if totals is None:
+                counts[word] = [int(count), int(doc_count)]
+            else:
+                totals[0] += int(count)
+                totals[1] += int(doc_count)
+    return (
+        lines,
+        sorted((word, count, docs) for word, (count, docs) in counts.items()),
+    )
+
+
+def _parse_ngram_shard(path: str) -> Tuple[int, List[Tuple[Any, ...]]]:
+    """Count the n-grams of a Google NGram shard.
+
+    The counts of each n-gram over all years are summed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the shard
+
+    Returns
+    -------
+    tuple
+        The number of lines in the shard, and a list of (n-gram, count)
+        tuples, sorted by n-gram, each n-gram being a tuple of words
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    counts = {}  # type: Dict[Tuple[str, ...], int]
+    lines = 0
+    with _open_shard(path) as gng:
+        for line in gng:
+            lines += 1
+            line_parts = line.rstrip().split('\t')
+            ngram = tuple(line_parts[0].split())
+            if ngram:
+                counts[ngram] = counts.get(ngram, 0) + int(line_parts[2])
+    return lines, sorted(counts.items())
+
+
+def _import_shards(
+    parse: Callable[[str], Tuple[int, List[Tuple[Any, ...]]]],
+    paths: Sequence[str],
+    n_jobs: Optional[int] = 1,
+) -> Tuple[int, Iterator[Tuple[Any, ...]]]:
+    """Parse shards, in parallel, and merge their count tables.
+
+    Parameters
+    ----------
+    parse : function
+        A function that parses a shard into its number of lines and a sorted
+        list of (key, count, ...) tuples
+    paths : list
+        The paths of the shards
+    n_jobs : int or None
+        The number of worker processes to parse with. If 1 (default), the
+        shards are parsed in this process; if None or less than 1, one
+        process per CPU is used.
+
+    Returns
+    -------
+    tuple
+        The total number of lines in the shards, and an iterator over the
+        merged (key, count, ...) tuples, sorted by key, in which the counts of
+        each key are summed over all shards
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    parsed = _parallel_map(parse, paths, n_jobs)
+
+    lines = sum(shard_lines for shard_lines, _ in parsed)
+    return lines, _merge_tables([table for _, table in parsed])
+
+
+def _merge_tables(
+    tables: List[List[Tuple[Any, ...]]]
+) -> Iterator[Tuple[Any, ...]]:
+    """Merge sorted count tables, summing the counts of equal keys.
+
+    Parameters
+    ----------
+    tables : list
+        Lists of (key, count, ...) tuples, each sorted by key
+
+    Yields
+    ------
+    tuple
+        Each distinct key, followed by its summed counts, in order of key
+
+    Examples
+    --------
+    >>> list(_merge_tables([[('a', 1), ('c', 2)], [('b', 3), ('c', 4)]]))
+    [('a', 1), ('b', 3), ('c', 6)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    for key, group in groupby(merge(*tables), key=itemgetter(0)):
+        entries = list(group)
+        if len(entries) == 1:
+            yield entries[0]
+        else:
+            yield (key,) + tuple(
+                sum(counts)
+                for counts in zip(*(entry[1:] for entry in entries))
+            )
+
+
+def _import_stats(files: int, lines: int, seconds: float) -> Dict[str, float]:
+    """Return the statistics of an import.
+
+    Parameters
+    ----------
+    files : int
+        The number of files imported
+    lines : int
+        The number of lines imported
+    seconds : float
+        The time taken, in seconds
+
+    Returns
+    -------
+    dict
+        The number of files (``files``) & lines (``lines``) imported, the
+        time taken (``seconds``), and the throughput (``lines_per_second``)
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return {
+        'files': files,
+        'lines': lines,
+        'seconds': seconds,
+        'lines_per_second': lines / seconds if seconds else 0.0,
+    }
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
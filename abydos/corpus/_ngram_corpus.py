@@ -20,10 +20,34 @@ The NGram class is a container for an n-gram corpus
 """
 
 from codecs import open as c_open
-from collections import Counter
-from typing import Any, Counter as TCounter, List, Optional, Union, cast
+from collections import Counter, defaultdict
+from itertools import chain
+from time import perf_counter
+from typing import (
+    Any,
+    Counter as TCounter,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from numpy import add as np_add
+from numpy import array as np_array
+from numpy import concatenate as np_concatenate
+from numpy import int64 as np_int64
+from numpy import ndarray as np_ndarray
+from numpy import searchsorted as np_searchsorted
 
 from ._corpus import Corpus
+from ._gng import _import_shards, _import_stats, _parse_ngram_shard
+from ._vocabulary import _Vocabulary
 
 __all__ = ['NGramCorpus']
 
@@ -42,6 +66,13 @@ class NGramCorpus:
     the trigram frequency of 'colorless green ideas' would be the value stored
     in ``self.ngcorpus['colorless']['green']['ideas'][None]``.
 
+    Calling :py:meth:`compact` moves the n-grams out of these dicts into, for
+    each n, a sorted array of n-grams, each packed from the ids of its words
+    in a sorted vocabulary, and an array of their counts, which take a
+    fraction of the memory and are searched by bisection. N-grams added after
+    that are again held in dicts until the next call to :py:meth:`compact`,
+    and :py:meth:`get_count` sums the counts held in each form.
+
     .. versionadded:: 0.3.0
     """
 
@@ -71,6 +102,11 @@ class NGramCorpus:
 
         """
         self.ngcorpus = Counter()  # type: TCounter[Optional[str]]
+        # The compacted n-grams: the vocabulary, and for each n, the sorted,
+        # packed n-grams and their counts
+        self._vocab = None  # type: Optional[_Vocabulary]
+        self._keys = {}  # type: Dict[int, np_ndarray]
+        self._counts = {}  # type: Dict[int, np_ndarray]
 
         if corpus is None:
             return
@@ -122,9 +158,7 @@ class NGramCorpus:
         if not corpus or not isinstance(corpus, Corpus):
             raise TypeError('Corpus argument of the Corpus class required.')
 
-        sentences = corpus.sents()
-
-        for sent in sentences:
+        for sent in corpus.iter_sents():
             ngs = Counter(sent)
             for key in ngs.keys():
                 self._add_to_ngcorpus(self.ngcorpus, [key], ngs[key])
@@ -133,7 +167,7 @@ class NGramCorpus:
                 if bos and bos != '':
                     sent = [bos] + sent
                 if eos and eos != '':
-                    sent += [eos]
+                    sent = sent + [eos]
                 for i in range(2, n_val + 1):
                     for j in range(len(sent) - i + 1):
                         self._add_to_ngcorpus(
@@ -173,6 +207,10 @@ class NGramCorpus:
         .. versionadded:: 0.3.0
 
         """
+        if corpus is None and self._vocab is not None:
+            return self._compact_count(ngram) + self.get_count(
+                ngram, self.ngcorpus
+            )
         if not corpus:
             corpus = self.ngcorpus
 
@@ -194,6 +232,151 @@ class NGramCorpus:
             )
         return 0
 
+    def _compact_count(self, ngram: Union[str, List[str]]) -> int:
+        """Get the count of an n-gram in the compacted n-grams.
+
+        Parameters
+        ----------
+        ngram : str or List[str]
+            The n-gram to retrieve the count of
+
+        Returns
+        -------
+        int
+            The n-gram count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(ngram, str):
+            ngram = ngram.split()
+        if len(ngram) not in self._keys:
+            return 0
+
+        word_ids = [self._vocab.id(word) for word in ngram]  # type: ignore
+        if -1 in word_ids:
+            return 0
+        keys = self._keys[len(ngram)]
+        key = self._vocab.pack(np_array([word_ids]))  # type: ignore
+        pos = np_searchsorted(keys, key)[0]
+        if pos < len(keys) and keys[pos] == key[0]:
+            return int(self._counts[len(ngram)][pos])
+        return 0
+
+    def _iter_ngcorpus(
+        self, corpus: Any, prefix: Tuple[str, ...] = ()
+    ) -> Iterator[Tuple[Tuple[str, ...], int]]:
+        """Iterate over the n-grams held in dicts.
+
+        Parameters
+        ----------
+        corpus : Counter
+            The corpus, or a level of it
+        prefix : tuple
+            The words leading to this level
+
+        Yields
+        ------
+        tuple
+            Each n-gram, as a tuple of words, & its count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for word, sub_corpus in corpus.items():
+            if word is None:
+                if sub_corpus:
+                    yield prefix, sub_corpus
+            else:
+                yield from self._iter_ngcorpus(sub_corpus, prefix + (word,))
+
+    def compact(self) -> None:
+        r"""Move the n-grams into sorted arrays of packed word ids.
+
+        Example
+        -------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> ngcorp.compact()
+        >>> ngcorp.get_count('the'), ngcorp.get_count('the dog')
+        (2, 1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._compact_from(self._iter_ngcorpus(self.ngcorpus))
+
+    def _compact_from(
+        self, new_ngrams: Iterable[Tuple[Tuple[str, ...], int]]
+    ) -> None:
+        """Merge n-grams into the compacted n-grams.
+
+        The n-grams held in dicts are discarded, so should be included in
+        new_ngrams.
+
+        Parameters
+        ----------
+        new_ngrams : iterable
+            Each n-gram to add, as a tuple of words, & its count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ngrams = defaultdict(list)  # type: DefaultDict[int, List[Any]]
+        counts = defaultdict(list)  # type: DefaultDict[int, List[int]]
+        for ngram, count in new_ngrams:
+            ngrams[len(ngram)].append(ngram)
+            counts[len(ngram)].append(count)
+
+        old_vocab = self._vocab
+        words = set(old_vocab.words()) if old_vocab is not None else set()
+        for n_grams in ngrams.values():
+            words.update(word for ngram in n_grams for word in ngram)
+        vocab = _Vocabulary(words)
+
+        for n_val, n_grams in ngrams.items():
+            ngrams[n_val] = np_array(
+                [[vocab.id(word) for word in ngram] for ngram in n_grams],
+                dtype=np_int64,
+            )
+        if old_vocab is not None:
+            # renumber the compacted n-grams with the new vocabulary's ids
+            remap = np_array(
+                [vocab.id(word) for word in old_vocab.words()], dtype=np_int64
+            )
+            for n_val, keys in self._keys.items():
+                old_ids = remap[old_vocab.unpack(keys, n_val)]
+                if n_val in ngrams:
+                    ngrams[n_val] = np_concatenate([old_ids, ngrams[n_val]])
+                else:
+                    ngrams[n_val] = old_ids
+                counts[n_val] = np_concatenate(
+                    [self._counts[n_val], np_array(counts[n_val], np_int64)]
+                )
+
+        self._keys = {}
+        self._counts = {}
+        for n_val in ngrams:
+            keys = vocab.pack(ngrams[n_val])
+            order = keys.argsort(kind='stable')
+            keys = keys[order]
+            n_counts = np_array(counts[n_val], dtype=np_int64)[order]
+
+            # sum the counts of any n-gram that appears more than once
+            firsts = np_concatenate([[True], keys[1:] != keys[:-1]])
+            starts = firsts.nonzero()[0]
+            self._keys[n_val] = keys[starts]
+            self._counts[n_val] = np_add.reduceat(n_counts, starts)
+
+        self._vocab = vocab
+        self.ngcorpus = Counter()
+
     def _add_to_ngcorpus(
         self, corpus: Any, words: List[str], count: int
     ) -> None:
@@ -240,6 +423,55 @@ class NGramCorpus:
 
                 self._add_to_ngcorpus(self.ngcorpus, words, int(line_parts[2]))
 
+    def gng_importer_many(
+        self,
+        corpus_files: Sequence[str],
+        n_jobs: Optional[int] = 1,
+        compact: bool = False,
+    ) -> Dict[str, float]:
+        """Fill in self.ngcorpus from the shards of a Google NGram corpus.
+
+        Each shard, which may be gzip-compressed, is parsed by a worker process
+        into a table of the counts of its distinct n-grams, and the tables are
+        merged. The resulting counts are those that :py:meth:`gng_importer`
+        would produce from each shard in turn.
+
+        Parameters
+        ----------
+        corpus_files : list
+            The Google NGram files from which to initialize the n-gram corpus
+        n_jobs : int or None
+            The number of worker processes to parse with. If 1 (default), the
+            shards are parsed in this process; if None or less than 1, one
+            process per CPU is used.
+        compact : bool
+            If True, the merged n-grams are compacted (see :py:meth:`compact`)
+            without first being added to dicts
+
+        Returns
+        -------
+        dict
+            The number of files (``files``) & lines (``lines``) imported, the
+            time taken (``seconds``), and the throughput
+            (``lines_per_second``)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        start = perf_counter()
+        lines, ngrams = _import_shards(
+            _parse_ngram_shard, corpus_files, n_jobs
+        )
+        if compact:
+            self._compact_from(
+                chain(self._iter_ngcorpus(self.ngcorpus), ngrams)
+            )
+        else:
+            for ngram, count in ngrams:
+                self._add_to_ngcorpus(self.ngcorpus, list(ngram), count)
+        return _import_stats(len(corpus_files), lines, perf_counter() - start)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,12 +19,33 @@
 Unigram Corpus
 """
 
+import mmap
 import pickle  # noqa: S403
+import struct
 from codecs import open as c_open
 from collections import Counter, defaultdict
 from math import log1p
-from typing import Any, Callable, DefaultDict, Optional, Tuple
-
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from zlib import crc32
+
+from numpy import array as np_array
+from numpy import cumsum as np_cumsum
+from numpy import frombuffer as np_frombuffer
+from numpy import int64 as np_int64
+from numpy import ndarray
+
+from ._gng import _import_shards, _import_stats, _parse_unigram_shard
 from ..tokenizer import _Tokenizer
 
 __all__ = ['UnigramCorpus']
@@ -34,6 +55,324 @@ def _dd_default(*args: Any) -> Tuple[int, int]:
     return 0, 0
 
 
+class _UnigramTable(Mapping[str, Tuple[int, int]]):
+    """Read-only, memory-mapped unigram corpus table.
+
+    The table file holds the terms as a pool of UTF-8 strings, sorted
+    bytewise, arrays of the offset of each term in the pool and of the count
+    & document count of each term, and an open-addressing hash index of the
+    terms. Terms are found through the index, in place, so the file is never
+    read into a dict.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _magic = b'ABUNIG01'
+    # magic, number of terms, number of hash slots, number of documents
+    _header = struct.Struct('<8sQQQ')
+
+    def __init__(self, path: str) -> None:
+        """Initialize _UnigramTable instance.
+
+        Parameters
+        ----------
+        path : str
+            The path of a table, as written by :py:meth:`write`
+
+        Raises
+        ------
+        ValueError
+            The file is not a unigram corpus table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._path = path
+        with open(path, 'rb') as table_file:
+            self._buffer = mmap.mmap(
+                table_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        try:
+            (
+                magic,
+                n_terms,
+                n_slots,
+                self.doc_count,
+            ) = self._header.unpack_from(self._buffer)
+        except struct.error:
+            magic = b''
+        if magic != self._magic:
+            self._buffer.close()
+            raise ValueError('{} is not a unigram corpus table.'.format(path))
+
+        pos = self._header.size
+        self._offsets = self._view(pos, '<u8', n_terms + 1)
+        pos += 8 * (n_terms + 1)
+        self._counts = self._view(pos, '<i8', n_terms)
+        pos += 8 * n_terms
+        self._doc_counts = self._view(pos, '<i8', n_terms)
+        pos += 8 * n_terms
+        self._slots = self._view(pos, '<u4', n_slots)
+        self._start = pos + 4 * n_slots
+        self._mask = n_slots - 1
+        self._len = n_terms
+
+    def _view(self, pos: int, dtype: str, count: int) -> ndarray:
+        """Return an array in the table, without copying it.
+
+        Parameters
+        ----------
+        pos : int
+            The position of the array in the file
+        dtype : str
+            The little-endian NumPy dtype of the array's items, as written by
+            :py:meth:`write`
+        count : int
+            The number of items
+
+        Returns
+        -------
+        numpy.ndarray
+            The array, which NumPy reads in the file's byte order whatever the
+            byte order of the machine
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np_frombuffer(
+            self._buffer, dtype=dtype, count=count, offset=pos
+        )
+
+    @classmethod
+    def write(
+        cls, path: str, corpus: Mapping[str, Tuple[int, int]], doc_count: int
+    ) -> None:
+        """Write a table.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to write
+        corpus : dict
+            A dict of terms to their counts & document counts
+        doc_count : int
+            The number of documents in the corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        terms = sorted(
+            (term.encode('utf-8'), counts) for term, counts in corpus.items()
+        )
+
+        # The hash index has at least twice as many slots as terms, each
+        # holding 0 or the index of a term plus 1.
+        n_slots = 1
+        while n_slots < 2 * len(terms):
+            n_slots <<= 1
+        slots = [0] * n_slots
+        for index, (term, _) in enumerate(terms):
+            slot = crc32(term) & (n_slots - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (n_slots - 1)
+            slots[slot] = index + 1
+
+        with open(path, 'wb') as table_file:
+            table_file.write(
+                cls._header.pack(cls._magic, len(terms), n_slots, doc_count)
+            )
+            table_file.write(
+                np_cumsum([0] + [len(term) for term, _ in terms])
+                .astype('<u8')
+                .tobytes()
+            )
+            for column in range(2):
+                table_file.write(
+                    np_array(
+                        [counts[column] for _, counts in terms], dtype=np_int64
+                    )
+                    .astype('<i8')
+                    .tobytes()
+                )
+            table_file.write(np_array(slots, dtype='<u4').tobytes())
+            table_file.write(b''.join(term for term, _ in terms))
+
+    def _term(self, index: int) -> bytes:
+        """Return a term from the pool.
+
+        Parameters
+        ----------
+        index : int
+            The index of the term
+
+        Returns
+        -------
+        bytes
+            The UTF-8 encoded term
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._buffer[
+            self._start
+            + self._offsets.item(index) : self._start
+            + self._offsets.item(index + 1)
+        ]
+
+    def _index(self, term: object) -> int:
+        """Return the index of a term in the table, or -1.
+
+        Parameters
+        ----------
+        term : str
+            The term to find
+
+        Returns
+        -------
+        int
+            The index of the term, or -1 if it is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(term, str):
+            return -1
+        key = term.encode('utf-8')
+        slots = self._slots
+        slot = crc32(key) & self._mask
+        index = slots.item(slot) - 1
+        while index >= 0:
+            if self._term(index) == key:
+                return index
+            slot = (slot + 1) & self._mask
+            index = slots.item(slot) - 1
+        return -1
+
+    def __getitem__(self, term: str) -> Tuple[int, int]:
+        """Return the count & document count of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term
+
+        Returns
+        -------
+        tuple
+            The number of times the term appeared and the number of distinct
+            documents in which it appeared
+
+        Raises
+        ------
+        KeyError
+            The term is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        index = self._index(term)
+        if index < 0:
+            raise KeyError(term)
+        return self._counts.item(index), self._doc_counts.item(index)
+
+    def __contains__(self, term: object) -> bool:
+        """Return True if a term is in the table.
+
+        Parameters
+        ----------
+        term : str
+            The term
+
+        Returns
+        -------
+        bool
+            True if the term is in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._index(term) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the terms, in order of their UTF-8 encodings.
+
+        Yields
+        ------
+        str
+            Each term
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for index in range(self._len):
+            yield self._term(index).decode('utf-8')
+
+    def __len__(self) -> int:
+        """Return the number of terms in the table.
+
+        Returns
+        -------
+        int
+            The number of terms
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._len
+
+    def close(self) -> None:
+        """Close the table's memory map.
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The arrays are views of the buffer, which must be dropped before it
+        # can be closed.
+        del self._offsets, self._counts, self._doc_counts, self._slots
+        self._buffer.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the table for pickling.
+
+        The table is pickled as its path, and reopened when unpickled, so that
+        processes share the file rather than copies of it.
+
+        Returns
+        -------
+        dict
+            The path of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {'path': self._path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Reopen a pickled table.
+
+        Parameters
+        ----------
+        state : dict
+            The path of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__init__(state['path'])  # type: ignore
+
+
 class UnigramCorpus:
     """Unigram corpus class.
 
@@ -43,6 +382,11 @@ class UnigramCorpus:
     of the number of times a term appeared and the number of distinct documents
     in which it appeared.
 
+    A corpus may be saved with :py:meth:`save_table` to a binary table, which
+    :py:meth:`load_table` opens with :py:mod:`mmap` rather than reading, and
+    searches in place. A loaded table is read-only, and any number of
+    processes that load the same table share a single copy of it.
+
     .. versionadded:: 0.4.0
     """
 
@@ -84,6 +428,9 @@ class UnigramCorpus:
         self.corpus = defaultdict(
             _dd_default
         )  # type: DefaultDict[str, Tuple[int, int]]
+        # Incremented whenever counts change, so that users of the corpus can
+        # tell when values they have derived from it are stale
+        self._version = 0
         self.transform = word_transform
         self.tokenizer = word_tokenizer
         self.doc_count = documents
@@ -145,12 +492,73 @@ class UnigramCorpus:
             self.corpus = pickle.load(pkl)  # noqa: S301
         self._update_doc_count()
 
+    def save_table(self, filename: str) -> None:
+        """Save the corpus to a binary table.
+
+        The table holds the terms, sorted, with their counts & document counts
+        in arrays, and the number of documents in the corpus. Other
+        parameters of the corpus, such as its word_tokenizer, are not saved.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the corpus to.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        doc_count = self.doc_count
+        if self.corpus:
+            doc_count = max(
+                doc_count, max(docs for _, docs in self.corpus.values())
+            )
+        _UnigramTable.write(filename, self.corpus, doc_count)
+
+    def load_table(self, filename: str) -> None:
+        r"""Load the corpus from a binary table.
+
+        The table is memory-mapped, not read, and replaces the corpus, which
+        can then no longer be added to. Other parameters of the corpus, such
+        as its word_tokenizer, will not be affected and should be set during
+        initialization.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of a table written by :py:meth:`save_table`.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> filename = os.path.join(tempfile.mkdtemp(), 'tqbf.unigrams')
+        >>> tqbf = 'the quick brown fox jumped over the lazy dog\n\n'
+        >>> tqbf += 'and then it slept\n\n and the dog ran off'
+        >>> UnigramCorpus(tqbf).save_table(filename)
+        >>> corp = UnigramCorpus()
+        >>> corp.load_table(filename)
+        >>> round(corp.idf('dog'), 10)
+        0.6931471806
+        >>> corp.corpus['the']
+        (3, 1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.corpus = _UnigramTable(filename)  # type: ignore
+        self.doc_count = max(
+            self.corpus.doc_count, self.doc_count  # type: ignore
+        )
+
     def _update_doc_count(self) -> None:
         """Update document count, if necessary.
 
         .. versionadded:: 0.4.0
         """
-        max_docs = max(self.corpus.values(), key=lambda _: _[1])[1]
+        max_docs = max(
+            self.corpus.values(), key=lambda _: _[1], default=(0, 0)
+        )[1]
         self.doc_count = max(max_docs, self.doc_count)
 
     def _add_word(self, word: str, count: int, doc_count: int) -> None:
@@ -165,10 +573,20 @@ class UnigramCorpus:
         doc_count : int
             Count of distinct documents in which word appears
 
+        Raises
+        ------
+        TypeError
+            The corpus was loaded from a table, which is read-only
+
 
         .. versionadded:: 0.4.0
 
         """
+        if isinstance(self.corpus, _UnigramTable):
+            raise TypeError(
+                'The corpus was loaded from a table, which cannot be added to.'
+            )
+        self._version += 1
         if self.transform is not None:
             word = self.transform(word)
 
@@ -210,6 +628,48 @@ class UnigramCorpus:
                 self._add_word(word, int(count), int(doc_count))
             self._update_doc_count()
 
+    def gng_importer_many(
+        self, corpus_files: Sequence[str], n_jobs: Optional[int] = 1
+    ) -> Dict[str, float]:
+        """Fill in self.corpus from the shards of a Google NGram corpus.
+
+        Each shard, which may be gzip-compressed, is parsed by a worker process
+        into a table of the counts of its distinct terms, and the tables are
+        merged. Since the counts of each term are summed before it is added to
+        the corpus, the word_transform & word_tokenizer are applied once per
+        distinct term, rather than once per line. Terms are added in sorted
+        order, but the resulting counts are those that
+        :py:meth:`gng_importer` would produce from each shard in turn.
+
+        Parameters
+        ----------
+        corpus_files : list
+            The Google NGram files from which to initialize the corpus
+        n_jobs : int or None
+            The number of worker processes to parse with. If 1 (default), the
+            shards are parsed in this process; if None or less than 1, one
+            process per CPU is used.
+
+        Returns
+        -------
+        dict
+            The number of files (``files``) & lines (``lines``) imported, the
+            time taken (``seconds``), and the throughput
+            (``lines_per_second``)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        start = perf_counter()
+        lines, terms = _import_shards(
+            _parse_unigram_shard, corpus_files, n_jobs
+        )
+        for word, count, doc_count in terms:
+            self._add_word(word, count, doc_count)
+        self._update_doc_count()
+        return _import_stats(len(corpus_files), lines, perf_counter() - start)
+
     def idf(self, term: str) -> float:
         r"""Calculate the Inverse Document Frequency of a term in the corpus.
 
@@ -0,0 +1,209 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._vocabulary.
+
+The corpus._vocabulary module defines _Vocabulary, a sorted list of words that
+maps words to int ids, by binary search, for the compact forms of corpora.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List, Sequence
+
+from numpy import array as np_array
+from numpy import int64 as np_int64
+from numpy import ndarray as np_ndarray
+from numpy import uint8 as np_uint8
+
+__all__ = []  # type: List[str]
+
+
+class _Vocabulary:
+    """Sorted vocabulary of int ids.
+
+    The id of a word is its position in the sorted list of words, so no dict
+    from words to ids need be kept in memory.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """Initialize _Vocabulary instance.
+
+        Parameters
+        ----------
+        words : iterable
+            The words of the vocabulary, which need not be sorted or distinct
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._words = sorted(set(words))
+        # The number of bytes with which an id is packed into a key
+        self.width = max(1, (len(self._words).bit_length() + 7) // 8)
+
+    def __len__(self) -> int:
+        """Return the number of words.
+
+        Returns
+        -------
+        int
+            The number of words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._words)
+
+    def __getitem__(self, word_id: int) -> str:
+        """Return the word with an id.
+
+        Parameters
+        ----------
+        word_id : int
+            The id of the word
+
+        Returns
+        -------
+        str
+            The word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._words[word_id]
+
+    def id(self, word: str) -> int:
+        """Return the id of a word, or -1.
+
+        Parameters
+        ----------
+        word : str
+            The word
+
+        Returns
+        -------
+        int
+            The id of the word, or -1 if it is not in the vocabulary
+
+        Examples
+        --------
+        >>> vocab = _Vocabulary(['the', 'quick', 'brown', 'the'])
+        >>> vocab.id('quick'), vocab.id('fox')
+        (1, -1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        pos = bisect_left(self._words, word)
+        if pos < len(self._words) and self._words[pos] == word:
+            return pos
+        return -1
+
+    def pack(self, word_ids: np_ndarray) -> np_ndarray:
+        r"""Pack rows of ids into sortable byte-string keys.
+
+        Each id is written big-endian in :py:attr:`width` bytes, so that the
+        keys sort in the same order as the tuples of ids.
+
+        Parameters
+        ----------
+        word_ids : numpy.ndarray
+            A 2-dimensional array, each row of which is an n-gram of ids
+
+        Returns
+        -------
+        numpy.ndarray
+            The keys, as an array of fixed-width byte strings
+
+        Examples
+        --------
+        >>> vocab = _Vocabulary(['the', 'quick', 'brown'])
+        >>> vocab.pack(np_array([[2, 1], [0, 2]]))
+        array([b'\x02\x01', b'\x00\x02'], dtype='|S2')
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rows, n_val = word_ids.shape
+        shifts = 8 * np_array(range(self.width - 1, -1, -1))
+        packed = (word_ids[:, :, None] >> shifts).astype(np_uint8)
+        return (
+            packed.reshape(rows, -1)
+            .copy()
+            .view('S{}'.format(n_val * self.width))
+            .reshape(rows)
+        )
+
+    def unpack(self, keys: np_ndarray, n_val: int) -> np_ndarray:
+        """Unpack byte-string keys into rows of ids.
+
+        Parameters
+        ----------
+        keys : numpy.ndarray
+            An array of keys, as returned by :py:meth:`pack`
+        n_val : int
+            The number of ids in each key
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array, each row of which is an n-gram of ids
+
+        Examples
+        --------
+        >>> vocab = _Vocabulary(['the', 'quick', 'brown'])
+        >>> vocab.unpack(vocab.pack(np_array([[2, 1], [0, 2]])), 2).tolist()
+        [[2, 1], [0, 2]]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        packed = (
+            keys.view(np_uint8)
+            .reshape(len(keys), n_val, self.width)
+            .astype(np_int64)
+        )
+        word_ids = packed[:, :, 0]
+        for byte in range(1, self.width):
+            word_ids = (word_ids << 8) | packed[:, :, byte]
+        return word_ids
+
+    def words(self) -> Sequence[str]:
+        """Return the words, sorted.
+
+        Returns
+        -------
+        list
+            The words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._words
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -324,6 +324,9 @@ undergone each transform, is provided in:
 
     - Phonetic distance (:py:class:`.PhoneticDistance`)
 
+For retrieval, a TF-IDF index (:py:class:`.TFIDFIndex`) finds the records of a
+collection with the greatest :py:class:`.TFIDF` similarity to a query.
+
 The remaining distance measures & metrics include:
 
     - Western Airlines' Match Rating Algorithm comparison
@@ -608,6 +611,7 @@ from ._tarantula import Tarantula
 from ._tarwid import Tarwid
 from ._tetrachoric import Tetrachoric
 from ._tf_idf import TFIDF
+from ._tf_idf_index import TFIDFIndex
 from ._tichy import Tichy
 from ._token_distance import _TokenDistance
 from ._tulloss_r import TullossR
@@ -905,6 +909,7 @@ __all__ = [
     'FuzzyWuzzyTokenSort',
     'FuzzyWuzzyTokenSet',
     'PhoneticDistance',
+    'TFIDFIndex',
     'MRA',
     'Editex',
     'Baystat',
@@ -19,10 +19,19 @@
 ALINE alignment, similarity, and distance
 """
 
-from copy import deepcopy
-from typing import Any, Callable, Dict, List, Tuple, Union, cast
-
-from numpy import float_, inf, zeros
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from numpy import array, inf, maximum, where
 
 from ._distance import _Distance
 
@@ -1231,6 +1240,24 @@ class ALINE(_Distance):
             self._phones = self.phones_kondrak
         self._normalizer = normalizer
 
+        # Features are ordered as the consonant features and then the
+        # remaining vowel features, each in set order.
+        self._features = list(self.c_features) + [
+            feature
+            for feature in self.v_features
+            if feature not in self.c_features
+        ]
+        self._salience = array(
+            [self.salience[feature] for feature in self._features]
+        )
+        self._c_indices = [
+            self._features.index(feature) for feature in self.c_features
+        ]
+        self._v_indices = [
+            self._features.index(feature) for feature in self.v_features
+        ]
+        self._vectors = {}  # type: Dict[str, List[float]]
+
     def alignment(self, src: str, tar: str) -> Tuple[float, str, str]:
         """Return the top ALINE alignment of two strings.
 
@@ -1304,368 +1331,412 @@ class ALINE(_Distance):
         .. versionadded:: 0.4.0
         .. versionchanged:: 0.4.1
             Renamed from .alignment to .alignments
+        .. versionchanged:: 0.6.0
+            Computes the score without retrieving alignments when score_only
+            is set
 
         """
+        if score_only:
+            src_tok, src_vec = self._segments(src)
+            tar_tok, tar_vec = self._segments(tar)
+            return self._score(
+                self._score_matrix(
+                    self._sig_tables(src_vec, tar_vec),
+                    len(src_tok),
+                    len(tar_tok),
+                ),
+                len(src_tok),
+                len(tar_tok),
+            )
 
-        def _sig_skip(*args: Any) -> float:
-            return self._c_skip
+        return sorted(
+            self.iter_alignments(src, tar), key=lambda _: _[0], reverse=True
+        )
 
-        def _sig_sub(seg1: Dict[str, float], seg2: Dict[str, float]) -> float:
-            return (
-                self._c_sub
-                - _delta(seg1, seg2)
-                - _sig_vwl(seg1)
-                - _sig_vwl(seg2)
-            )
+    def iter_alignments(
+        self, src: str, tar: str, max_count: Optional[int] = None
+    ) -> Iterator[Tuple[float, str, str]]:
+        """Yield the ALINE alignments of two strings.
 
-        def _sig_exp(
-            seg1: Dict[str, float],
-            seg2a: Dict[str, float],
-            seg2b: Dict[str, float],
-        ) -> float:
-            return (
-                self._c_exp
-                - _delta(seg1, seg2a)
-                - _delta(seg1, seg2b)
-                - _sig_vwl(seg1)
-                - max(_sig_vwl(seg2a), _sig_vwl(seg2b))
-            )
+        Alignments are retrieved lazily, in the order in which they are found
+        (rather than sorted by score, as by :py:meth:`.alignments`), so that
+        only as many as are needed are retrieved.
 
-        def _sig_vwl(seg1: Dict[str, float]) -> float:
-            return (
-                0.0
-                if seg1['manner'] > self.feature_weights['high vowel']
-                else self._c_vwl
-            )
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_count : int or None
+            The maximum number of alignments to yield, or None for all of them
 
-        def _delta(seg1: Dict[str, float], seg2: Dict[str, float]) -> float:
-            features = (
-                self.c_features
-                if max(seg1['manner'], seg2['manner'])
-                > self.feature_weights['high vowel']
-                else self.v_features
-            )
-            diff = 0.0
-            for f in features:
-                diff += (
-                    abs(seg1.get(f, 0.0) - seg2.get(f, 0.0)) * self.salience[f]
-                )
-            return diff
+        Yields
+        ------
+        tuple(float, str, str)
+            ALINE alignments and their scores
 
-        def _retrieve(
+        Examples
+        --------
+        >>> cmp = ALINE()
+        >>> list(cmp.iter_alignments('atcg', 'tagc', max_count=1))
+        [(65.0, '‖ a t c ‖ g', 't ‖ a g c ‖')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_count is not None and max_count < 1:
+            return
+
+        src_tok, src_vec = self._segments(src)
+        tar_tok, tar_vec = self._segments(tar)
+        src_len = len(src_tok)
+        tar_len = len(tar_tok)
+
+        sub, exp_tar, exp_src = self._sig_tables(src_vec, tar_vec)
+        s_mat = self._score_matrix((sub, exp_tar, exp_src), src_len, tar_len)
+        threshold = (1 - self._epsilon) * self._score(s_mat, src_len, tar_len)
+        c_skip = self._c_skip
+        global_mode = self._mode == 'global'
+
+        def _record(
             i: int, j: int, score: float, out: List[Tuple[str, str]]
-        ) -> None:
-            def _record(score: float, out: List[Tuple[str, str]]) -> None:
-                out.append(('‖', '‖'))
-                for i1 in range(i - 1, -1, -1):
-                    out.append((src_tok[i1], ''))
-                for j1 in range(j - 1, -1, -1):
-                    out.append(('', tar_tok[j1]))
-                if self._mode == 'global':
-                    score += (i + j) * _sig_skip('')
-
-                out = out[::-1]
-
-                src_alignment = []
-                tar_alignment = []
-
-                out.append(('‖', '‖'))
-                part = 0
-                s_segment = ''  # type: Union[str, List[str]]
-                t_segment = ''  # type: Union[str, List[str]]
-                for ss, ts in out:
-                    if ss == '‖':
-                        if part % 2 == 0:
-                            src_alignment.append(s_segment)
-                            tar_alignment.append(t_segment)
-                            s_segment = []
-                            t_segment = []
-                        else:
-                            src_alignment.append(' '.join(s_segment))
-                            tar_alignment.append(' '.join(t_segment))
-                            s_segment = ''
-                            t_segment = ''
-                        part += 1
+        ) -> Tuple[float, str, str]:
+            out = out + [('‖', '‖')]
+            for i1 in range(i - 1, -1, -1):
+                out.append((src_tok[i1], ''))
+            for j1 in range(j - 1, -1, -1):
+                out.append(('', tar_tok[j1]))
+            if global_mode:
+                score += (i + j) * c_skip
+
+            out = out[::-1]
+
+            src_alignment = []
+            tar_alignment = []
+
+            out.append(('‖', '‖'))
+            part = 0
+            s_segment = ''  # type: Union[str, List[str]]
+            t_segment = ''  # type: Union[str, List[str]]
+            for ss, ts in out:
+                if ss == '‖':
+                    if part % 2 == 0:
+                        src_alignment.append(s_segment)
+                        tar_alignment.append(t_segment)
+                        s_segment = []
+                        t_segment = []
                     else:
-                        if part % 2 == 0:
-                            s_segment = cast(str, s_segment) + ss
-                            t_segment = cast(str, t_segment) + ts
-                        else:
-                            cast(List[str], s_segment).append(
-                                ss + ' ' * (len(ts) - len(ss))
-                            )
-                            cast(List[str], t_segment).append(
-                                ts + ' ' * (len(ss) - len(ts))
-                            )
-
-                src_alignment_str = ' ‖ '.join(
-                    cast(List[str], src_alignment)
-                ).strip()
-                tar_alignment_str = ' ‖ '.join(
-                    cast(List[str], tar_alignment)
-                ).strip()
-
-                alignments.append(
-                    (score, src_alignment_str, tar_alignment_str)
-                )
-                return
+                        src_alignment.append(' '.join(s_segment))
+                        tar_alignment.append(' '.join(t_segment))
+                        s_segment = ''
+                        t_segment = ''
+                    part += 1
+                else:
+                    if part % 2 == 0:
+                        s_segment = cast(str, s_segment) + ss
+                        t_segment = cast(str, t_segment) + ts
+                    else:
+                        cast(List[str], s_segment).append(
+                            ss + ' ' * (len(ts) - len(ss))
+                        )
+                        cast(List[str], t_segment).append(
+                            ts + ' ' * (len(ss) - len(ts))
+                        )
+
+            src_alignment_str = ' ‖ '.join(
+                cast(List[str], src_alignment)
+            ).strip()
+            tar_alignment_str = ' ‖ '.join(
+                cast(List[str], tar_alignment)
+            ).strip()
+
+            return score, src_alignment_str, tar_alignment_str
 
-            if s_mat[i, j] == 0:
-                _record(score, out)
+        def _retrieve(
+            i: int, j: int, score: float, out: List[Tuple[str, str]]
+        ) -> Iterator[Tuple[float, str, str]]:
+            if s_mat[i][j] == 0:
+                yield _record(i, j, score, out)
                 return
-            else:
-                if (
-                    i > 0
-                    and j > 0
-                    and s_mat[i - 1, j - 1]
-                    + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1])
-                    + score
-                    >= threshold
-                ):
-                    loc_out = deepcopy(out)
-                    loc_out.append((src_tok[i - 1], tar_tok[j - 1]))
-                    _retrieve(
-                        i - 1,
-                        j - 1,
-                        score
-                        + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1]),
-                        loc_out,
-                    )
-                    loc_out.pop()
 
-                if (
-                    j > 0
-                    and s_mat[i, j - 1] + _sig_skip(tar_tok[j - 1]) + score
-                    >= threshold
-                ):
-                    loc_out = deepcopy(out)
-                    loc_out.append(('-', tar_tok[j - 1]))
-                    _retrieve(
-                        i, j - 1, score + _sig_skip(tar_tok[j - 1]), loc_out
-                    )
-                    loc_out.pop()
-
-                if (
-                    i > 0
-                    and j > 1
-                    and s_mat[i - 1, j - 2]
-                    + _sig_exp(
-                        src_feat_wt[i - 1],
-                        tar_feat_wt[j - 2],
-                        tar_feat_wt[j - 1],
+            # Each step is appended to out before retrieving the alignments
+            # that precede it and removed afterwards.
+            if i > 0 and j > 0:
+                step = sub[i - 1][j - 1]
+                if s_mat[i - 1][j - 1] + step + score >= threshold:
+                    out.append((src_tok[i - 1], tar_tok[j - 1]))
+                    yield from _retrieve(i - 1, j - 1, score + step, out)
+                    out.pop()
+
+            if j > 0 and s_mat[i][j - 1] + c_skip + score >= threshold:
+                out.append(('-', tar_tok[j - 1]))
+                yield from _retrieve(i, j - 1, score + c_skip, out)
+                out.pop()
+
+            if i > 0 and j > 1:
+                step = exp_tar[i - 1][j - 2]
+                if s_mat[i - 1][j - 2] + step + score >= threshold:
+                    out.append(
+                        (src_tok[i - 1], tar_tok[j - 2] + tar_tok[j - 1])
                     )
-                    + score
-                    >= threshold
-                ):
-                    loc_out = deepcopy(out)
-                    loc_out.append(
-                        (src_tok[i - 1], tar_tok[j - 2] + tar_tok[j - 1],)
-                    )
-                    _retrieve(
-                        i - 1,
-                        j - 2,
-                        score
-                        + _sig_exp(
-                            src_feat_wt[i - 1],
-                            tar_feat_wt[j - 2],
-                            tar_feat_wt[j - 1],
-                        ),
-                        loc_out,
+                    yield from _retrieve(i - 1, j - 2, score + step, out)
+                    out.pop()
+
+            if i > 0 and s_mat[i - 1][j] + c_skip + score >= threshold:
+                out.append((src_tok[i - 1], '-'))
+                yield from _retrieve(i - 1, j, score + c_skip, out)
+                out.pop()
+
+            if i > 1 and j > 0:
+                step = exp_src[i - 2][j - 1]
+                if s_mat[i - 2][j - 1] + step + score >= threshold:
+                    out.append(
+                        (src_tok[i - 2] + src_tok[i - 1], tar_tok[j - 1])
                     )
-                    loc_out.pop()
+                    yield from _retrieve(i - 2, j - 1, score + step, out)
+                    out.pop()
 
-                if (
-                    i > 0
-                    and s_mat[i - 1, j] + _sig_skip(src_tok[i - 1]) + score
-                    >= threshold
+        count = 0
+        for i in range(1, src_len + 1):
+            for j in range(1, tar_len + 1):
+                if self._mode in {'global', 'half-local'} and (
+                    i < src_len or j < tar_len
                 ):
-                    loc_out = deepcopy(out)
-                    loc_out.append((src_tok[i - 1], '-'))
-                    _retrieve(
-                        i - 1, j, score + _sig_skip(src_tok[i - 1]), loc_out
-                    )
-                    loc_out.pop()
-
-                if (
-                    i > 1
-                    and j > 0
-                    and s_mat[i - 2, j - 1]
-                    + _sig_exp(
-                        tar_feat_wt[j - 1],
-                        src_feat_wt[i - 2],
-                        src_feat_wt[i - 1],
-                    )
-                    + score
-                    >= threshold
+                    continue
+                if self._mode == 'semi-global' and (
+                    i < src_len and j < tar_len
                 ):
-                    loc_out = deepcopy(out)
-                    loc_out.append(
-                        (src_tok[i - 2] + src_tok[i - 1], tar_tok[j - 1],)
-                    )
-                    _retrieve(
-                        i - 2,
-                        j - 1,
-                        score
-                        + _sig_exp(
-                            tar_feat_wt[j - 1],
-                            src_feat_wt[i - 2],
-                            src_feat_wt[i - 1],
-                        ),
-                        loc_out,
-                    )
-                    loc_out.pop()
+                    continue
+                if s_mat[i][j] >= threshold:
+                    out = []
+                    for j1 in range(tar_len - 1, j - 1, -1):
+                        out.append(('', tar_tok[j1]))
+                    for i1 in range(src_len - 1, i - 1, -1):
+                        out.append((src_tok[i1], ''))
+                    out.append(('‖', '‖'))
+                    for alignment in _retrieve(i, j, 0, out):
+                        yield alignment
+                        count += 1
+                        if max_count is not None and count >= max_count:
+                            return
 
-        sg_max = 0.0
+    def _segments(self, word: str) -> Tuple[List[str], List[List[float]]]:
+        """Return the segments of a word and their feature vectors.
 
-        src_tok = []  # type: List[str]
-        src_feat = []  # type: List[Dict[str, str]]
-        tar_tok = []  # type: List[str]
-        tar_feat = []  # type: List[Dict[str, str]]
+        Supplemental symbols (e.g. for aspiration or length) are merged into
+        the segment that precedes them, and symbols that are not in the
+        selected phone set are dropped.
 
-        for ch in src:
-            if ch in self._phones:
-                src_tok.append(ch)
-                src_feat.append(dict(self._phones[ch]))
-        for ch in tar:
+        Parameters
+        ----------
+        word : str
+            The word to segment
+
+        Returns
+        -------
+        tuple(list(str), list(list(float)))
+            The segments of the word and, for each segment, the weights of its
+            features, in the order of :py:attr:`._features`
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = []  # type: List[str]
+        for ch in word:
             if ch in self._phones:
-                tar_tok.append(ch)
-                tar_feat.append(dict(self._phones[ch]))
-
-        for i in range(1, len(src_feat)):
-            if 'supplemental' in src_feat[i]:
-                j = i - 1
-                while j > -1:
-                    if 'supplemental' not in src_feat[j]:
-                        src_tok[j] += src_tok[i]
-                        for key, value in src_feat[i].items():
-                            if key != 'supplemental':
-                                src_feat[j][key] = value
-                        j = 0
-                    j -= 1
-
-        zipped = [
-            fb for fb in zip(src_feat, src_tok) if 'supplemental' not in fb[0]
-        ]
-        if zipped:
-            src_feat, src_tok = zip(*zipped)  # type: ignore
-        else:
-            src_feat, src_tok = [], []
-
-        src_feat_wt = []  # type: List[Dict[str, float]]
-        for f_dict in src_feat:
-            src_feat_wt.append(
-                {
-                    key: self.feature_weights[f_dict[key]]
-                    for key in f_dict.keys()
-                }
-            )
+                if 'supplemental' not in self._phones[ch]:
+                    tokens.append(ch)
+                elif tokens:
+                    tokens[-1] += ch
+
+        vectors = []
+        for token in tokens:
+            if token not in self._vectors:
+                f_dict = dict(self._phones[token[0]])
+                for ch in token[1:]:
+                    f_dict.update(self._phones[ch])
+                self._vectors[token] = [
+                    self.feature_weights[f_dict[feature]]
+                    if feature in f_dict
+                    else 0.0
+                    for feature in self._features
+                ]
+            vectors.append(self._vectors[token])
+        return tokens, vectors
+
+    def _sig_tables(
+        self,
+        src_vec: List[List[float]],
+        tar_vec: List[List[float]],
+    ) -> Tuple[List[List[float]], List[List[float]], List[List[float]]]:
+        """Return the substitution & expansion scores of two segment lists.
 
-        src_len = len(src_tok)
+        The segments' feature vectors are arranged into arrays, so that the
+        differences of every pair of segments are computed at once.
 
-        for i in range(1, len(tar_feat)):
-            if 'supplemental' in tar_feat[i]:
-                j = i - 1
-                while j > -1:
-                    if 'supplemental' not in tar_feat[j]:
-                        tar_tok[j] += tar_tok[i]
-                        for key, value in tar_feat[i].items():
-                            if key != 'supplemental':
-                                tar_feat[j][key] = value
-                        j = 0
-                    j -= 1
-
-        zipped = [
-            fb for fb in zip(tar_feat, tar_tok) if 'supplemental' not in fb[0]
-        ]
-        if zipped:
-            tar_feat, tar_tok = zip(*zipped)  # type: ignore
-        else:
-            tar_feat, tar_tok = [], []
-
-        tar_feat_wt = []  # type: List[Dict[str, float]]
-        for f_dict in tar_feat:
-            tar_feat_wt.append(
-                {
-                    key: self.feature_weights[f_dict[key]]
-                    for key in f_dict.keys()
-                }
-            )
+        Parameters
+        ----------
+        src_vec : list(list(float))
+            The feature vectors of the source segments
+        tar_vec : list(list(float))
+            The feature vectors of the target segments
 
-        tar_len = len(tar_tok)
+        Returns
+        -------
+        tuple(list, list, list)
+            The score of substituting each source segment i for each target
+            segment j, at [i][j]; of expanding source segment i into target
+            segments j & j+1, at [i][j]; and of compressing source segments i
+            & i+1 into target segment j, at [i][j]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not src_vec or not tar_vec:
+            return [], [], []
+
+        high_vowel = self.feature_weights['high vowel']
+        manner = self._features.index('manner')
+        src_arr = array(src_vec).T
+        tar_arr = array(tar_vec).T
+
+        # The salience-weighted differences of each feature, for each pair
+        # of segments, are summed over the consonant & vowel features, in the
+        # order of each set; pairs with a consonant are compared on
+        # consonant features, pairs of vowels on vowel features.
+        diffs = (
+            abs(src_arr[:, :, None] - tar_arr[:, None, :])
+            * self._salience[:, None, None]
+        )
+        c_delta = diffs[self._c_indices].sum(axis=0)
+        v_delta = diffs[self._v_indices].sum(axis=0)
+        consonantal = (
+            maximum.outer(src_arr[manner], tar_arr[manner]) > high_vowel
+        )
+        delta = where(consonantal, c_delta, v_delta)
+
+        src_vwl = where(
+            src_arr[manner] > high_vowel,
+            0.0,
+            self._c_vwl,
+        )
+        tar_vwl = where(
+            tar_arr[manner] > high_vowel,
+            0.0,
+            self._c_vwl,
+        )
+
+        sub = self._c_sub - delta - src_vwl[:, None] - tar_vwl[None, :]
+        # an expansion of source segment i into target segments j & j+1
+        exp_tar = (
+            self._c_exp
+            - delta[:, :-1]
+            - delta[:, 1:]
+            - src_vwl[:, None]
+            - maximum(tar_vwl[:-1], tar_vwl[1:])[None, :]
+        )
+        # a compression of source segments i & i+1 into target segment j
+        exp_src = (
+            self._c_exp
+            - delta[:-1, :]
+            - delta[1:, :]
+            - tar_vwl[None, :]
+            - maximum(src_vwl[:-1], src_vwl[1:])[:, None]
+        )
+
+        return sub.tolist(), exp_tar.tolist(), exp_src.tolist()
+
+    def _score_matrix(
+        self,
+        tables: Tuple[List[List[float]], List[List[float]], List[List[float]]],
+        src_len: int,
+        tar_len: int,
+    ) -> List[List[float]]:
+        """Return the ALINE score matrix.
+
+        Parameters
+        ----------
+        tables : tuple(list, list, list)
+            The substitution & expansion scores, as returned by
+            :py:meth:`._sig_tables`
+        src_len : int
+            The number of source segments
+        tar_len : int
+            The number of target segments
+
+        Returns
+        -------
+        list(list(float))
+            The best score of an alignment ending at each pair of positions
+
+
+        .. versionadded:: 0.6.0
 
-        s_mat = zeros((src_len + 1, tar_len + 1), dtype=float_)
+        """
+        sub, exp_tar, exp_src = tables
+        c_skip = self._c_skip
+        floor = 0.0 if self._mode in {'local', 'half-local'} else -inf
 
+        s_mat = [[0.0] * (tar_len + 1) for _ in range(src_len + 1)]
         if self._mode == 'global':
             for i in range(1, src_len + 1):
-                s_mat[i, 0] = s_mat[i - 1, 0] + _sig_skip(src_tok[i - 1])
+                s_mat[i][0] = s_mat[i - 1][0] + c_skip
             for j in range(1, tar_len + 1):
-                s_mat[0, j] = s_mat[0, j - 1] + _sig_skip(tar_tok[j - 1])
+                s_mat[0][j] = s_mat[0][j - 1] + c_skip
+
+        if not src_len or not tar_len:
+            return s_mat
 
         for i in range(1, src_len + 1):
+            prev = s_mat[i - 1]
+            row = s_mat[i]
+            sub_row = sub[i - 1]
+            exp_tar_row = exp_tar[i - 1]
+            exp_src_row = exp_src[i - 2] if i > 1 else None
             for j in range(1, tar_len + 1):
-                s_mat[i, j] = max(
-                    s_mat[i - 1, j] + _sig_skip(src_feat_wt[i - 1]),
-                    s_mat[i, j - 1] + _sig_skip(tar_feat_wt[j - 1]),
-                    s_mat[i - 1, j - 1]
-                    + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1]),
-                    s_mat[i - 1, j - 2]
-                    + _sig_exp(
-                        src_feat_wt[i - 1],
-                        tar_feat_wt[j - 2],
-                        tar_feat_wt[j - 1],
-                    )
-                    if j > 1
-                    else -inf,
-                    s_mat[i - 2, j - 1]
-                    + _sig_exp(
-                        tar_feat_wt[j - 1],
-                        src_feat_wt[i - 2],
-                        src_feat_wt[i - 1],
-                    )
+                row[j] = max(
+                    prev[j] + c_skip,
+                    row[j - 1] + c_skip,
+                    prev[j - 1] + sub_row[j - 1],
+                    prev[j - 2] + exp_tar_row[j - 2] if j > 1 else -inf,
+                    s_mat[i - 2][j - 1] + exp_src_row[j - 1]  # type: ignore
                     if i > 1
                     else -inf,
-                    0 if self._mode in {'local', 'half-local'} else -inf,
+                    floor,
                 )
 
-                if s_mat[i, j] > sg_max:
-                    if self._mode == 'semi-global':
-                        if i == src_len or j == tar_len:
-                            sg_max = s_mat[i, j]
-                    else:
-                        sg_max = s_mat[i, j]
+        return s_mat
 
-        if self._mode in {'global', 'half-local'}:
-            dp_score = s_mat[src_len, tar_len]
-        else:
-            dp_score = s_mat.max()
+    def _score(
+        self, s_mat: List[List[float]], src_len: int, tar_len: int
+    ) -> float:
+        """Return the ALINE score from a score matrix.
 
-        if score_only:
-            return cast(float, dp_score)
+        Parameters
+        ----------
+        s_mat : list(list(float))
+            The score matrix, as returned by :py:meth:`._score_matrix`
+        src_len : int
+            The number of source segments
+        tar_len : int
+            The number of target segments
 
-        threshold = (1 - self._epsilon) * dp_score
+        Returns
+        -------
+        float
+            The best alignment score
 
-        alignments = []  # type: List[Tuple[float, str, str]]
 
-        for i in range(1, src_len + 1):
-            for j in range(1, tar_len + 1):
-                if self._mode in {'global', 'half-local'} and (
-                    i < src_len or j < tar_len
-                ):
-                    continue
-                if self._mode == 'semi-global' and (
-                    i < src_len and j < tar_len
-                ):
-                    continue
-                if s_mat[i, j] >= threshold:
-                    out = []
-                    for j1 in range(tar_len - 1, j - 1, -1):
-                        out.append(('', tar_tok[j1]))
-                    for i1 in range(src_len - 1, i - 1, -1):
-                        out.append((src_tok[i1], ''))
-                    out.append(('‖', '‖'))
-                    _retrieve(i, j, 0, out)
+        .. versionadded:: 0.6.0
 
-        return sorted(alignments, key=lambda _: _[0], reverse=True)
+        """
+        if self._mode in {'global', 'half-local'}:
+            return s_mat[src_len][tar_len]
+        return max(max(row) for row in s_mat)
 
     def sim_score(self, src: str, tar: str) -> float:
         """Return the ALINE alignment score of two strings.
@@ -20,10 +20,16 @@ editex
 """
 
 from sys import float_info
-from typing import Any, Tuple, cast
+from typing import Any, Iterable, List, Tuple, Union
 from unicodedata import normalize as unicode_normalize
 
+from numpy import arange as np_arange
+from numpy import array as np_array
 from numpy import float_ as np_float
+from numpy import maximum as np_maximum
+from numpy import minimum as np_minimum
+from numpy import ndarray as np_ndarray
+from numpy import where as np_where
 from numpy import zeros as np_zeros
 
 from ._distance import _Distance
@@ -90,6 +96,30 @@ class Editex(_Distance):
         self._local = local
         self._taper_enabled = taper
 
+        # The r & d costs of each pair of letters A-Z, with every other
+        # character sharing the final row & column. Identical characters are
+        # assigned the match cost when the tables are used.
+        match_cost, group_cost, mismatch_cost = cost
+        letters = [chr(code) for code in range(ord('A'), ord('Z') + 1)]
+        r_table = [
+            [mismatch_cost] * (len(letters) + 1)
+            for _ in range(len(letters) + 1)
+        ]
+        for i, ch1 in enumerate(letters):
+            for j, ch2 in enumerate(letters):
+                if ch1 == ch2:
+                    r_table[i][j] = match_cost
+                elif ch1 in self._all_letters and ch2 in self._all_letters:
+                    for group in self._letter_groups:
+                        if ch1 in group and ch2 in group:
+                            r_table[i][j] = group_cost
+                            break
+        d_table = [row[:] for row in r_table]
+        for ch in 'HW':
+            d_table[ord(ch) - ord('A')] = [group_cost] * (len(letters) + 1)
+        self._r_table = np_array(r_table)
+        self._d_table = np_array(d_table)
+
     def _taper(self, pos: int, length: int) -> float:
         return (
             round(
@@ -130,110 +160,251 @@ class Editex(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Costs are looked up in tables precomputed at construction
+
+        """
+        return self._dist_abs_encoded(self._encode(src), self._encode(tar))
+
+    def _encode(self, word: str) -> Tuple[np_ndarray, np_ndarray]:
+        """Return the character codes & cost table indices of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to encode
+
+        Returns
+        -------
+        tuple
+            The code points of the NFKD normalized, uppercase word, preceded
+            by a space, and the index of each character in the cost tables
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        word = ' ' + unicode_normalize('NFKD', word.upper())
+        codes = np_array([ord(char) for char in word])
+        offsets = codes - ord('A')
+        indices = np_where(
+            (offsets >= 0) & (offsets < 26), offsets, len(self._r_table) - 1
+        )
+        return codes, indices
+
+    def _pair_costs(
+        self,
+        table: np_ndarray,
+        codes1: np_ndarray,
+        indices1: np_ndarray,
+        codes2: np_ndarray,
+        indices2: np_ndarray,
+    ) -> np_ndarray:
+        """Return the costs of pairs of characters from a cost table.
+
+        Parameters
+        ----------
+        table : numpy.ndarray
+            The r or d cost table
+        codes1 : numpy.ndarray
+            The code points of the first characters
+        indices1 : numpy.ndarray
+            The cost table indices of the first characters
+        codes2 : numpy.ndarray
+            The code points of the second characters
+        indices2 : numpy.ndarray
+            The cost table indices of the second characters
+
+        Returns
+        -------
+        numpy.ndarray
+            The cost of each pair; if the arguments are 2-dimensional, the
+            cost of each pair of characters from the two sets
+
+
+        .. versionadded:: 0.6.0
 
         """
-        match_cost, group_cost, mismatch_cost = self._cost
-
-        def r_cost(ch1: str, ch2: str) -> int:
-            """Return r(a,b) according to Zobel & Dart's definition.
-
-            Parameters
-            ----------
-            ch1 : str
-                The first character to compare
-            ch2 : str
-                The second character to compare
-
-            Returns
-            -------
-            int
-                r(a,b) according to Zobel & Dart's definition
-
-            .. versionadded:: 0.1.0
-
-            """
-            if ch1 == ch2:
-                return match_cost
-            if ch1 in self._all_letters and ch2 in self._all_letters:
-                for group in self._letter_groups:
-                    if ch1 in group and ch2 in group:
-                        return group_cost
-            return mismatch_cost
-
-        def d_cost(ch1: str, ch2: str) -> int:
-            """Return d(a,b) according to Zobel & Dart's definition.
-
-            Parameters
-            ----------
-            ch1 : str
-                The first character to compare
-            ch2 : str
-                The second character to compare
-
-            Returns
-            -------
-            int
-                d(a,b) according to Zobel & Dart's definition
-
-            .. versionadded:: 0.1.0
-
-            """
-            if ch1 != ch2 and (ch1 == 'H' or ch1 == 'W'):
-                return group_cost
-            return r_cost(ch1, ch2)
-
-        # convert both src & tar to NFKD normalized unicode
-        src = unicode_normalize('NFKD', src.upper())
-        tar = unicode_normalize('NFKD', tar.upper())
-
-        src_len = len(src)
-        tar_len = len(tar)
+        return np_where(
+            codes1 == codes2, self._cost[0], table[indices1, indices2]
+        )
+
+    def _dist_abs_encoded(
+        self,
+        src: Tuple[np_ndarray, np_ndarray],
+        tar: Tuple[np_ndarray, np_ndarray],
+    ) -> float:
+        """Return the Editex distance between two encoded strings.
+
+        Parameters
+        ----------
+        src : tuple
+            Source string for comparison, encoded by :py:meth:`_encode`
+        tar : tuple
+            Target string for comparison, encoded by :py:meth:`_encode`
+
+        Returns
+        -------
+        int or float
+            Editex distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        mismatch_cost = self._cost[2]
+        src_codes, src_indices = src
+        tar_codes, tar_indices = tar
+
+        src_len = len(src_codes) - 1
+        tar_len = len(tar_codes) - 1
         max_len = max(src_len, tar_len)
 
-        if src == tar:
+        if src_len == tar_len and (src_codes == tar_codes).all():
             return 0.0
-        if not src:
+        if not src_len:
             return sum(
                 mismatch_cost * self._taper(pos, max_len)
                 for pos in range(tar_len)
             )
-        if not tar:
+        if not tar_len:
             return sum(
                 mismatch_cost * self._taper(pos, max_len)
                 for pos in range(src_len)
             )
 
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        src = ' ' + src
-        tar = ' ' + tar
+        # d costs of deleting each src & inserting each tar character, and the
+        # r costs of substituting each tar character for each src character
+        src_d = self._pair_costs(
+            self._d_table,
+            src_codes[:-1],
+            src_indices[:-1],
+            src_codes[1:],
+            src_indices[1:],
+        )
+        tar_d = self._pair_costs(
+            self._d_table,
+            tar_codes[:-1],
+            tar_indices[:-1],
+            tar_codes[1:],
+            tar_indices[1:],
+        )
+        sub_r = self._pair_costs(
+            self._r_table,
+            src_codes[1:, None],
+            src_indices[1:, None],
+            tar_codes[None, 1:],
+            tar_indices[None, 1:],
+        )
+        tapers = np_array(
+            [self._taper(pos, max_len) for pos in range(max_len + 1)],
+            dtype=np_float,
+        )
+        # Each edit at (i, j) is tapered according to max(i, j).
+        cell_tapers = tapers[
+            np_maximum.outer(
+                np_arange(1, src_len + 1), np_arange(1, tar_len + 1)
+            )
+        ]
+        del_costs = src_d[:, None] * cell_tapers
+        ins_costs = (tar_d[None, :] * cell_tapers).tolist()
+        sub_costs = sub_r * cell_tapers
 
-        if not self._local:
-            for i in range(1, src_len + 1):
-                d_mat[i, 0] = d_mat[i - 1, 0] + d_cost(
-                    src[i - 1], src[i]
-                ) * self._taper(i, max_len)
+        row = np_zeros(tar_len + 1, dtype=np_float)
         for j in range(1, tar_len + 1):
-            d_mat[0, j] = d_mat[0, j - 1] + d_cost(
-                tar[j - 1], tar[j]
-            ) * self._taper(j, max_len)
-
-        for i in range(1, src_len + 1):
-            for j in range(1, tar_len + 1):
-                d_mat[i, j] = min(
-                    d_mat[i - 1, j]
-                    + d_cost(src[i - 1], src[i])
-                    * self._taper(max(i, j), max_len),
-                    d_mat[i, j - 1]
-                    + d_cost(tar[j - 1], tar[j])
-                    * self._taper(max(i, j), max_len),
-                    d_mat[i - 1, j - 1]
-                    + r_cost(src[i], tar[j]) * self._taper(max(i, j), max_len),
-                )
-
-        if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
-            return int(d_mat[src_len, tar_len])
-        else:
-            return cast(float, d_mat[src_len, tar_len])
+            row[j] = row[j - 1] + tar_d[j - 1] * tapers[j]
+        first = 0.0
+
+        for i in range(src_len):
+            if not self._local:
+                first += src_d[i] * tapers[i + 1]
+            # Deletions & substitutions are computed for the whole row;
+            # insertions depend on the cell to the left, so follow in turn.
+            options = np_minimum(
+                row[1:] + del_costs[i], row[:-1] + sub_costs[i]
+            ).tolist()
+            row_ins = ins_costs[i]
+            cells = [first]
+            for j in range(tar_len):
+                cells.append(min(cells[j] + row_ins[j], options[j]))
+            row = np_array(cells, dtype=np_float)
+
+        dist = float(row[-1])
+        if int(dist) == dist:
+            return int(dist)
+        return dist
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> List[float]:
+        """Return the normalized Editex distances from a string to others.
+
+        This is equivalent to calling :py:meth:`dist` for each target, but
+        src is normalized & encoded only once.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+
+        Returns
+        -------
+        list
+            Normalized Editex distance to each target
+
+        Examples
+        --------
+        >>> cmp = Editex()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        [0.2, 0.3, 0.0]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        encoded = self._encode(src)
+        return [
+            0.0
+            if src == tar
+            else self._dist_abs_encoded(encoded, self._encode(tar))
+            / self._normalize_term(len(src), len(tar))
+            for tar in targets
+        ]
+
+    def _normalize_term(self, src_len: int, tar_len: int) -> Union[int, float]:
+        """Return the maximum Editex distance of strings of two lengths.
+
+        Parameters
+        ----------
+        src_len : int
+            The length of the source string
+        tar_len : int
+            The length of the target string
+
+        Returns
+        -------
+        int or float
+            The normalization term
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        mismatch_cost = self._cost[2]
+        if self._taper_enabled:
+            return max(
+                [
+                    sum(
+                        self._taper(pos, src_len) * mismatch_cost
+                        for pos in range(src_len)
+                    ),
+                    sum(
+                        self._taper(pos, tar_len) * mismatch_cost
+                        for pos in range(tar_len)
+                    ),
+                ]
+            )
+        return max(src_len * mismatch_cost, tar_len * mismatch_cost)
 
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized Editex distance between two strings.
@@ -278,28 +449,9 @@ class Editex(_Distance):
         if src == tar:
             return 0.0
 
-        match_cost, group_cost, mismatch_cost = self._cost
-        src_len = len(src)
-        tar_len = len(tar)
-
-        if self._taper_enabled:
-            normalize_term = max(
-                [
-                    sum(
-                        self._taper(pos, src_len) * mismatch_cost
-                        for pos in range(src_len)
-                    ),
-                    sum(
-                        self._taper(pos, tar_len) * mismatch_cost
-                        for pos in range(tar_len)
-                    ),
-                ]
-            )
-        else:
-            normalize_term = max(
-                src_len * mismatch_cost, tar_len * mismatch_cost
-            )
-        return self.dist_abs(src, tar) / normalize_term
+        return self.dist_abs(src, tar) / self._normalize_term(
+            len(src), len(tar)
+        )
 
 
 if __name__ == '__main__':
@@ -19,9 +19,14 @@
 The Higuera-Micó contextual normalized edit distance
 """
 
-from typing import Any
+from collections import Counter
+from typing import Any, Optional
 
+from numpy import arange as np_arange
+from numpy import array as np_array
 from numpy import full as np_full
+from numpy import maximum as np_maximum
+from numpy import where as np_where
 
 from ._distance import _Distance
 
@@ -48,25 +53,121 @@ class HigueraMico(_Distance):
 
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        """Initialize Levenshtein instance.
+    def __init__(
+        self, max_dist: Optional[float] = None, **kwargs: Any
+    ) -> None:
+        """Initialize HigueraMico instance.
 
         Parameters
         ----------
+        max_dist : float or None
+            If set, pairs of strings whose distance is bounded from below by
+            more than max_dist are abandoned before the distance is computed,
+            and their distance is reported as infinity (or 1.0 by
+            :py:meth:`dist`). This is useful for discarding poor matches
+            cheaply, e.g. when reranking.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_dist
 
         """
         super(HigueraMico, self).__init__(**kwargs)
+        self._max_dist = max_dist
+
+    @staticmethod
+    def _contextual_dist(
+        src_len: int, tar_len: int, n_i: int, n_d: int, n_s: int
+    ) -> float:
+        """Return the contextual distance of a sequence of edits.
+
+        Parameters
+        ----------
+        src_len : int
+            The length of the source string
+        tar_len : int
+            The length of the target string
+        n_i : int
+            The number of insertions
+        n_d : int
+            The number of deletions
+        n_s : int
+            The number of substitutions
+
+        Returns
+        -------
+        float
+            The distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        loc_dist = 0.0
+        for i in range(src_len + 1, src_len + n_i + 1):
+            loc_dist += 1 / i
+        loc_dist += n_s / (src_len + n_i)
+        for i in range(tar_len + 1, tar_len + n_d + 1):
+            loc_dist += 1 / i
+        return loc_dist
+
+    def _lower_bound(self, src: str, tar: str) -> float:
+        """Return a lower bound of the Higuera-Micó distance.
+
+        Any edit sequence must insert or delete the difference in the strings'
+        lengths, and must make at least as many edits as the bag distance
+        between the strings. The bound is the least distance of any numbers of
+        insertions, deletions, & substitutions meeting those constraints.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            A lower bound of the distance between src & tar
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_bag = Counter(src)
+        tar_bag = Counter(tar)
+        min_edits = max(
+            sum((src_bag - tar_bag).values()),
+            sum((tar_bag - src_bag).values()),
+        )
+        min_ins = max(len(tar) - len(src), 0)
+        min_del = max(len(src) - len(tar), 0)
+
+        bound = float('inf')
+        # Each additional insertion & deletion pair may replace up to two
+        # substitutions; beyond that, the distance only grows.
+        for extra in range(
+            (max(min_edits - min_ins - min_del, 0) + 1) // 2 + 1
+        ):
+            n_i = min_ins + extra
+            n_d = min_del + extra
+            n_s = max(min_edits - n_i - n_d, 0)
+            if len(src) + n_i:
+                bound = min(
+                    bound,
+                    self._contextual_dist(len(src), len(tar), n_i, n_d, n_s),
+                )
+        return bound
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the Higuera-Micó distance between two strings.
 
-        This is a straightforward implementation of Higuera & Micó pseudocode
-        from :cite:`Higuera:2008`, ported to Numpy.
+        This is an implementation of Higuera & Micó pseudocode from
+        :cite:`Higuera:2008`, ported to Numpy.
 
         Parameters
         ----------
@@ -92,49 +193,66 @@ class HigueraMico(_Distance):
         >>> cmp.dist_abs('ATCG', 'TAGC')
         0.6000000000000001
 
+        >>> cmp = HigueraMico(max_dist=0.5)
+        >>> cmp.dist_abs('Niall', 'Neil')
+        0.5333333333333333
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        inf
+
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Each anti-diagonal of the matrix is computed at once; added
+            pruning by max_dist
 
         """
         if src == tar:
             return 0.0
+        if self._max_dist is not None and (
+            self._lower_bound(src, tar) > self._max_dist
+        ):
+            return float('inf')
 
+        src_len = len(src)
+        tar_len = len(tar)
         mx = np_full(
-            (len(src) + 1, len(tar) + 1, len(src) + len(tar) + 1),
+            (src_len + 1, tar_len + 1, src_len + tar_len + 1),
             fill_value=float('-inf'),
             dtype=float,
         )
 
-        for i in range(1, len(src) + 1):
+        for i in range(1, src_len + 1):
             mx[i, 0, i] = 0
-        for j in range(len(tar) + 1):
+        for j in range(tar_len + 1):
             mx[0, j, j] = j
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                if src[i - 1] == tar[j - 1]:
-                    for k in range(len(src) + len(tar) + 1):
-                        mx[i, j, k] = mx[i - 1, j - 1, k]
-                else:
-                    for k in range(1, len(src) + len(tar) + 1):
-                        mx[i, j, k] = mx[i - 1, j - 1, k - 1]
-                for k in range(1, len(src) + len(tar) + 1):
-                    mx[i, j, k] = max(
-                        mx[i - 1, j, k - 1],
-                        mx[i, j - 1, k - 1] + 1,
-                        mx[i, j, k],
-                    )
+
+        # Cells on each anti-diagonal depend only on cells on the previous two
+        # anti-diagonals, so each anti-diagonal is computed at once, for all k.
+        matches = (
+            np_array([ord(char) for char in src])[:, None]
+            == np_array([ord(char) for char in tar])[None, :]
+        )
+        for diag in range(2, src_len + tar_len + 1):
+            i = np_arange(max(1, diag - tar_len), min(src_len, diag - 1) + 1)
+            j = diag - i
+            prev = mx[i - 1, j - 1]
+            cells = np_full(prev.shape, float('-inf'))
+            cells[:, 1:] = prev[:, :-1]
+            cells = np_where(matches[i - 1, j - 1][:, None], prev, cells)
+            cells[:, 1:] = np_maximum(
+                np_maximum(mx[i - 1, j, :-1], mx[i, j - 1, :-1] + 1),
+                cells[:, 1:],
+            )
+            mx[i, j] = cells
 
         min_dist = float('inf')
-        for k in range(len(src) + len(tar) + 1):
-            if mx[len(src), len(tar), k] >= 0:
-                n_i = int(mx[len(src), len(tar), k])
-                n_d = len(src) - len(tar) + n_i
+        for k in range(src_len + tar_len + 1):
+            if mx[src_len, tar_len, k] >= 0:
+                n_i = int(mx[src_len, tar_len, k])
+                n_d = src_len - tar_len + n_i
                 n_s = k - (n_i + n_d)
-                loc_dist = 0.0
-                for i in range(len(src) + 1, len(src) + n_i + 1):
-                    loc_dist += 1 / i
-                loc_dist += n_s / (len(src) + n_i)
-                for i in range(len(tar) + 1, len(tar) + n_d + 1):
-                    loc_dist += 1 / i
+                loc_dist = self._contextual_dist(
+                    src_len, tar_len, n_i, n_d, n_s
+                )
                 if loc_dist < min_dist:
                     min_dist = loc_dist
 
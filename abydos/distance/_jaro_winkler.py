@@ -23,7 +23,8 @@ The distance._JaroWinkler module implements distance metrics based on
     - Jaro-Winkler distance
 """
 
-from typing import Any
+from collections import Counter
+from typing import Any, Iterable, List, Sequence
 
 from ._distance import _Distance
 from ..tokenizer import QGrams
@@ -144,6 +145,74 @@ class JaroWinkler(_Distance):
         .. versionchanged:: 0.3.6
             Encapsulated in class
 
+        """
+        self._check_params()
+
+        if src == tar:
+            return 1.0
+
+        return self._sim_lists(self._tokens(src), self._tokens(tar))
+
+    def sim_many(self, src: str, targets: Iterable[str]) -> List[float]:
+        """Return the Jaro or Jaro-Winkler similarities of a string to many.
+
+        The parameters are checked, and src is tokenized, only once.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+
+        Returns
+        -------
+        list
+            The Jaro or Jaro-Winkler similarity of src to each target,
+            identical to those :py:meth:`sim` returns
+
+        Raises
+        ------
+        ValueError
+            Unsupported boost_threshold assignment; boost_threshold must be
+            between 0 and 1.
+        ValueError
+            Unsupported scaling_factor assignment; scaling_factor must be
+            between 0 and 0.25.'
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> [round(sim, 12) for sim in cmp.sim_many('Niall',
+        ... ['Neil', 'Niall', 'Nigel'])]
+        [0.805, 1.0, 0.786666666667]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_params()
+        src_list = self._tokens(src)
+        return [
+            1.0 if src == tar else self._sim_lists(src_list, self._tokens(tar))
+            for tar in targets
+        ]
+
+    def _check_params(self) -> None:
+        """Check the Winkler parameters.
+
+        Raises
+        ------
+        ValueError
+            Unsupported boost_threshold assignment; boost_threshold must be
+            between 0 and 1.
+        ValueError
+            Unsupported scaling_factor assignment; scaling_factor must be
+            between 0 and 0.25.'
+
+
+        .. versionadded:: 0.6.0
+
         """
         if self._mode == 'winkler':
             if self._boost_threshold > 1 or self._boost_threshold < 0:
@@ -157,15 +226,49 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
-        if src == tar:
-            return 1.0
+    def _tokens(self, string: str) -> List[str]:
+        """Return the q-grams of a string, after stripping it.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
 
+        Returns
+        -------
+        list
+            The q-grams of the string, in order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self._qval, int) and self._qval == 1:
+            # The 1-grams of a string are its characters.
+            return list(string.strip())
         tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
+        tokenizer.tokenize(string.strip())
+        return tokenizer.get_list()
+
+    def _sim_lists(self, src_list: List[str], tar_list: List[str]) -> float:
+        """Return the Jaro or Jaro-Winkler similarity of two token lists.
+
+        Parameters
+        ----------
+        src_list : list
+            The q-grams of the source string
+        tar_list : list
+            The q-grams of the target string
+
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
+
+
+        .. versionadded:: 0.6.0
 
+        """
         lens = len(src_list)
         lent = len(tar_list)
 
@@ -249,6 +352,98 @@ class JaroWinkler(_Distance):
 
         return weight
 
+    def _sim_bounds(self, src: str, targets: Sequence[str]) -> List[float]:
+        """Return upper bounds of the similarities of a string to many.
+
+        For character-wise matching, no more characters can be matched than
+        the two strings have in common, counting repeats, and the Winkler
+        boost can be no more than that of their common prefix, so each bound
+        is the similarity that the strings would have if all their common
+        characters matched without transpositions. Bounds are cheaper to
+        compute than similarities, so pairs of strings whose bounds fall below
+        a threshold can be skipped.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : list
+            Target strings for comparison
+
+        Returns
+        -------
+        list
+            For each target, a value that its similarity to src, as
+            :py:meth:`sim` returns it, does not exceed (1.0 for all targets
+            when qval is not 1)
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> [round(sim, 12) for sim in cmp._sim_bounds('Niall',
+        ... ['Neil', 'Colin', 'Alain'])]
+        [0.805, 0.6, 0.733333333333]
+        >>> [round(sim, 12) for sim in cmp.sim_many('Niall',
+        ... ['Neil', 'Colin', 'Alain'])]
+        [0.805, 0.466666666667, 0.466666666667]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not (isinstance(self._qval, int) and self._qval == 1):
+            return [1.0] * len(targets)
+
+        winkler = self._mode == 'winkler'
+        src_list = src.strip()
+        lens = len(src_list)
+        src_hist = dict(Counter(src_list))
+        bounds = []
+        for tar in targets:
+            tar_list = tar.strip()
+            lent = len(tar_list)
+            if src == tar:
+                bounds.append(1.0)
+                continue
+            if lens == 0 or lent == 0:
+                bounds.append(0.0)
+                continue
+
+            # Count the characters in common, consuming a copy of src's
+            # histogram.
+            unmatched = src_hist.copy()
+            num_com = 0
+            for char in tar_list:
+                if unmatched.get(char, 0):
+                    unmatched[char] -= 1
+                    num_com += 1
+            if num_com == 0:
+                bounds.append(0.0)
+                continue
+
+            # The weight, as computed by _sim_lists, with no transpositions
+            weight = num_com / lens + num_com / lent + 1.0
+            weight /= 3.0
+
+            if winkler and weight > self._boost_threshold:
+                minv = min(lens, lent)
+                j = 4 if (minv >= 4) else minv
+                i = 0
+                while (i < j) and (src_list[i] == tar_list[i]):
+                    i += 1
+                weight += i * self._scaling_factor * (1.0 - weight)
+                if (
+                    self._long_strings
+                    and (minv > 4)
+                    and (num_com > i + 1)
+                    and (2 * num_com >= minv + i)
+                ):
+                    weight += (1.0 - weight) * (
+                        (num_com - i - 1) / (lens + lent - i * 2 + 2)
+                    )
+            bounds.append(weight)
+        return bounds
+
 
 if __name__ == '__main__':
     import doctest
@@ -20,7 +20,6 @@ Meta-Levenshtein distance
 """
 
 from collections import defaultdict
-from math import log1p
 from typing import (
     Any,
     Callable,
@@ -36,13 +35,14 @@ from numpy import zeros as np_zeros
 
 from ._distance import _Distance
 from ._jaro_winkler import JaroWinkler
+from ._tf_idf_weights import _TFIDFWeights
 from ..corpus import UnigramCorpus
 from ..tokenizer import QGrams, WhitespaceTokenizer, _Tokenizer
 
 __all__ = ['MetaLevenshtein']
 
 
-class MetaLevenshtein(_Distance):
+class MetaLevenshtein(_TFIDFWeights, _Distance):
     r"""Meta-Levenshtein distance.
 
     Meta-Levenshtein distance :cite:`Moreau:2008` combines Soft-TFIDF with
@@ -91,6 +91,7 @@ class MetaLevenshtein(_Distance):
         """
         super(MetaLevenshtein, self).__init__(**kwargs)
         self._corpus = corpus
+        self._init_idf_cache()
         self._metric = JaroWinkler() if metric is None else metric
         self._normalizer = normalizer
 
@@ -149,13 +150,6 @@ class MetaLevenshtein(_Distance):
         tar_ordered = tar_tok.get_list()
         tar_tok = tar_tok.get_counter()
 
-        if self._corpus is None:
-            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
-        else:
-            corpus = self._corpus
-
         dists = defaultdict(float)  # type: DefaultDict[Tuple[str, str], float]
         s_toks = set(src_tok.keys())
         t_toks = set(tar_tok.keys())
@@ -165,12 +159,9 @@ class MetaLevenshtein(_Distance):
                     self._metric.dist(s_tok, t_tok) if s_tok != t_tok else 0
                 )
 
-        vws_dict = {}
-        vwt_dict = {}
-        for token in src_tok.keys():
-            vws_dict[token] = log1p(src_tok[token]) * corpus.idf(token)
-        for token in tar_tok.keys():
-            vwt_dict[token] = log1p(tar_tok[token]) * corpus.idf(token)
+        idf = self._idfs(src, tar, src_tok, tar_tok)
+        vws_dict = self._tf_idf_weights(src_tok, idf)
+        vwt_dict = self._tf_idf_weights(tar_tok, idf)
 
         def _dist(s_tok: str, t_tok: str) -> float:
             return dists[(s_tok, t_tok)] * vws_dict[s_tok] * vwt_dict[t_tok]
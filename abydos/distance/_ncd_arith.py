@@ -20,10 +20,10 @@ NCD using Arithmetic Coding
 """
 
 from fractions import Fraction
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ._distance import _Distance
-from ..compression import Arithmetic
+from ..compression import Arithmetic, RangeCoder
 
 __all__ = ['NCDarith']
 
@@ -41,6 +41,7 @@ class NCDarith(_Distance):
     def __init__(
         self,
         probs: Optional[Dict[str, Tuple[Fraction, Fraction]]] = None,
+        coder: str = 'arithmetic',
         **kwargs: Any
     ) -> None:
         """Initialize the arithmetic coder object.
@@ -49,15 +50,37 @@ class NCDarith(_Distance):
         ----------
         probs : dict
             A dictionary trained with :py:meth:`Arithmetic.train`
+        coder : str
+            The method used to compute compressed lengths:
 
+                - ``arithmetic`` encodes with :py:class:`.Arithmetic`
+                  (default)
+                - ``range`` encodes with the integer :py:class:`.RangeCoder`
+                - ``estimate`` computes the ideal code length with
+                  :py:meth:`.RangeCoder.code_length`, without encoding
+
+        Raises
+        ------
+        ValueError
+            Unknown coder
 
         .. versionadded:: 0.3.6
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added coder parameter
 
         """
+        if coder not in {'arithmetic', 'range', 'estimate'}:
+            raise ValueError(
+                "coder must be 'arithmetic', 'range', or 'estimate', not "
+                '{!r}'.format(coder)
+            )
         super(NCDarith, self).__init__(**kwargs)
-        self._coder = Arithmetic()
+        self._coder = Arithmetic()  # type: Union[Arithmetic, RangeCoder]
+        if coder in {'range', 'estimate'}:
+            self._coder = RangeCoder()
+        self._estimate = coder == 'estimate'
         self._probs = probs
 
     def dist(self, src: str, tar: str) -> float:
@@ -87,6 +110,10 @@ class NCDarith(_Distance):
         >>> cmp.dist('ATCG', 'TAGC')
         0.6923076923076923
 
+        >>> cmp = NCDarith(coder='estimate')
+        >>> cmp.dist('Niall', 'Neil')
+        0.7749621795424488
+
 
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
@@ -102,10 +129,17 @@ class NCDarith(_Distance):
         else:
             self._coder.set_probs(self._probs)
 
-        src_comp = self._coder.encode(src)[1]
-        tar_comp = self._coder.encode(tar)[1]
-        concat_comp = self._coder.encode(src + tar)[1]
-        concat_comp2 = self._coder.encode(tar + src)[1]
+        if self._estimate and isinstance(self._coder, RangeCoder):
+            # the ideal code length of a string doesn't depend on the order of
+            # its symbols, so only one concatenation needs measuring
+            src_comp = self._coder.code_length(src)
+            tar_comp = self._coder.code_length(tar)
+            concat_comp = concat_comp2 = self._coder.code_length(src + tar)
+        else:
+            src_comp = self._coder.encode(src)[1]
+            tar_comp = self._coder.encode(tar)[1]
+            concat_comp = self._coder.encode(src + tar)[1]
+            concat_comp2 = self._coder.encode(tar + src)[1]
 
         return (
             min(concat_comp, concat_comp2) - min(src_comp, tar_comp)
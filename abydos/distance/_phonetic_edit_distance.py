@@ -35,7 +35,11 @@ from typing import (
 import numpy as np
 
 from ._levenshtein import Levenshtein
-from ..phones._phones import _FEATURE_MASK, cmp_features, ipa_to_features
+from ..phones._phones import (
+    _FEATURE_MASK,
+    FeatureComparator,
+    ipa_to_features,
+)
 
 __all__ = ['PhoneticEditDistance']
 
@@ -115,6 +119,9 @@ class PhoneticEditDistance(Levenshtein):
         elif isinstance(weights, (list, tuple)):
             weights = list(weights) + [0] * (len(_FEATURE_MASK) - len(weights))
         self._weights = weights
+        self._comparator = FeatureComparator(
+            cast(Optional[Sequence[float]], weights)
+        )
 
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
@@ -137,70 +144,113 @@ class PhoneticEditDistance(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Computes substitution costs in advance & rows with NumPy
+
+        """
+        d_mat, trace_mat = self._fill_matrix(src, tar, backtrace, len(src) + 1)
+        if backtrace:
+            return d_mat, trace_mat
+        return d_mat
+
+    def _fill_matrix(
+        self, src: str, tar: str, backtrace: bool, rows: int
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Fill the phonetic edit distance alignment matrix.
+
+        The substitution costs of all pairs of phones are computed at once,
+        as are the deletion & substitution options of each row; only the
+        insertions (and transpositions), which depend on the preceding cell
+        of the same row, are computed cell by cell.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        backtrace : bool
+            Fill the backtrace matrix as well
+        rows : int
+            The number of rows of the alignment matrix to retain: either
+            len(src) + 1, for the full matrix, or (at least) 3, if only the
+            final row is needed
+
+        Returns
+        -------
+        tuple(numpy.ndarray, numpy.ndarray or None)
+            The alignment matrix, with row i stored at i % rows, and the
+            backtrace matrix (or None)
+
+
+        .. versionadded:: 0.6.0
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        osa = self._mode == 'osa'
 
         src_len = len(src)
         tar_len = len(tar)
 
-        src_list = ipa_to_features(src)
-        tar_list = ipa_to_features(tar)
+        # Each character is expected to correspond to a phone; any missing
+        # phones are treated as unknown.
+        src_list = (ipa_to_features(src) + [-1] * src_len)[:src_len]
+        tar_list = (ipa_to_features(tar) + [-1] * tar_len)[:tar_len]
+
+        src_feats = np.array(src_list, dtype=np.int64)
+        tar_feats = np.array(tar_list, dtype=np.int64)
+        sub_mat = np.where(
+            src_feats.reshape(-1, 1) != tar_feats.reshape(1, -1),
+            sub_cost * (1.0 - self._comparator.matrix(src_feats, tar_feats)),
+            0,
+        )
 
-        d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
+        d_mat = np.zeros((rows, tar_len + 1), dtype=np.float_)
+        d_mat[0] = np.arange(tar_len + 1) * ins_cost
+        trace_mat = None  # type: Optional[np.ndarray]
         if backtrace:
             trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
-        for i in range(1, src_len + 1):
-            d_mat[i, 0] = i * del_cost
-            if backtrace:
-                trace_mat[i, 0] = 0
-        for j in range(1, tar_len + 1):
-            d_mat[0, j] = j * ins_cost
-            if backtrace:
-                trace_mat[0, j] = 1
+            trace_mat[0, 1:] = 1
 
         for i in range(src_len):
+            prev = d_mat[i % rows]
+            dels = prev[1:] + del_cost
+            subs = prev[:-1] + sub_mat[i]
+            # Ties are resolved in favor of insertion, then deletion, then
+            # substitution.
+            sub_best = subs < dels
+            row = np.where(sub_best, subs, dels).tolist()
+            if backtrace:
+                trace_row = np.where(sub_best, 2, 1).tolist()
+
+            cur = (i + 1) * del_cost
             for j in range(tar_len):
-                traces = ((i + 1, j), (i, j + 1), (i, j))
-                opts = (
-                    d_mat[traces[0]] + ins_cost,  # ins
-                    d_mat[traces[1]] + del_cost,  # del
-                    d_mat[traces[2]]
-                    + (
-                        sub_cost
-                        * (
-                            1.0
-                            - cmp_features(
-                                src_list[i],
-                                tar_list[j],
-                                cast(Sequence[float], self._weights),
-                            )
-                        )
-                        if src_list[i] != tar_list[j]
-                        else 0
-                    ),  # sub/==
-                )
-                d_mat[i + 1, j + 1] = min(opts)
-                if backtrace:
-                    trace_mat[i + 1, j + 1] = int(np.argmin(opts))
-
-                if self._mode == 'osa':
-                    if (
-                        i + 1 > 1
-                        and j + 1 > 1
-                        and src_list[i] == tar_list[j - 1]
-                        and src_list[i - 1] == tar_list[j]
-                    ):
-                        # transposition
-                        d_mat[i + 1, j + 1] = min(
-                            d_mat[i + 1, j + 1],
-                            d_mat[i - 1, j - 1] + trans_cost,
-                        )
-                        if backtrace:
-                            trace_mat[i + 1, j + 1] = 2
-        if backtrace:
-            return d_mat, trace_mat
-        return d_mat
+                if cur + ins_cost <= row[j]:
+                    row[j] = cur + ins_cost
+                    if backtrace:
+                        trace_row[j] = 0
+
+                if (
+                    osa
+                    and i > 0
+                    and j > 0
+                    and src_list[i] == tar_list[j - 1]
+                    and src_list[i - 1] == tar_list[j]
+                ):
+                    # transposition
+                    row[j] = min(
+                        row[j], d_mat[(i - 1) % rows, j - 1] + trans_cost
+                    )
+                    if backtrace:
+                        trace_row[j] = 2
+                cur = row[j]
+
+            d_mat[(i + 1) % rows, 0] = (i + 1) * del_cost
+            d_mat[(i + 1) % rows, 1:] = row
+            if backtrace:
+                trace_mat[i + 1, 1:] = trace_row  # type: ignore
+
+        return d_mat, trace_mat
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the phonetic edit distance between two strings.
@@ -251,14 +301,14 @@ class PhoneticEditDistance(Levenshtein):
         if not tar:
             return del_cost * src_len
 
-        d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
-        )
+        # Only the last rows of the matrix are retained.
+        d_mat = self._fill_matrix(src, tar, False, 3)[0]
+        distance = d_mat[src_len % 3, tar_len]
 
-        if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
-            return int(d_mat[src_len, tar_len])
+        if int(distance) == distance:
+            return int(distance)
         else:
-            return cast(float, d_mat[src_len, tar_len])
+            return cast(float, distance)
 
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized phonetic edit distance between two strings.
@@ -20,11 +20,11 @@ SoftTF-IDF similarity
 """
 
 from collections import defaultdict
-from math import log1p
-from typing import Any, DefaultDict, Optional, Tuple
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 
 from ._distance import _Distance
 from ._jaro_winkler import JaroWinkler
+from ._tf_idf_weights import _TFIDFWeights
 from ._token_distance import _TokenDistance
 from ..corpus import UnigramCorpus
 from ..tokenizer import _Tokenizer
@@ -32,7 +32,7 @@ from ..tokenizer import _Tokenizer
 __all__ = ['SoftTFIDF']
 
 
-class SoftTFIDF(_TokenDistance):
+class SoftTFIDF(_TFIDFWeights, _TokenDistance):
     r"""SoftTF-IDF similarity.
 
     For two sets X and Y and a population N, SoftTF-IDF similarity
@@ -64,6 +64,12 @@ class SoftTFIDF(_TokenDistance):
 
     """
 
+    # The maximum number of token pairs whose similarities by the metric are
+    # cached
+    _metric_cache_size = 1 << 16
+    # The slack allowed for rounding error in the metric's bounds
+    _bound_margin = 1e-12
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -103,8 +109,78 @@ class SoftTFIDF(_TokenDistance):
         """
         super(SoftTFIDF, self).__init__(tokenizer=tokenizer, **kwargs)
         self._corpus = corpus
+        self._init_idf_cache()
         self._threshold = threshold
         self._metric = JaroWinkler() if metric is None else metric
+        self._metric_cache = {}  # type: Dict[Tuple[str, str], float]
+
+    def _soft_matches(
+        self, s_tok: str, t_toks: List[str]
+    ) -> List[Tuple[str, float]]:
+        """Return the tokens similar to a token, by the metric.
+
+        The metric's similarities are cached across calls. Of the pairs not
+        yet cached, those whose similarity cannot exceed the threshold, by the
+        metric's bounds (if it has them), are skipped, and the similarities
+        of the rest are computed one-to-many (if the metric supports it).
+
+        Parameters
+        ----------
+        s_tok : str
+            A source token
+        t_toks : list
+            The target tokens
+
+        Returns
+        -------
+        list
+            The (target token, similarity) pairs, in the order of t_toks, of
+            the target tokens whose similarities to s_tok exceed the threshold
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        threshold = self._threshold
+        cache = self._metric_cache
+        sims = [cache.get((s_tok, t_tok)) for t_tok in t_toks]
+        uncached = [t_tok for t_tok, sim in zip(t_toks, sims) if sim is None]
+
+        if uncached:
+            # A skipped pair is cached with its bound, which does not exceed
+            # the threshold, in place of its similarity.
+            values = {}  # type: Dict[str, float]
+            to_compute = uncached
+            bounds = getattr(self._metric, '_sim_bounds', None)
+            if bounds is not None:
+                to_compute = []
+                for t_tok, bound in zip(uncached, bounds(s_tok, uncached)):
+                    if bound > threshold - self._bound_margin:
+                        to_compute.append(t_tok)
+                    else:
+                        values[t_tok] = bound
+            if to_compute:
+                sim_many = getattr(self._metric, 'sim_many', None)
+                if sim_many is not None:
+                    values.update(zip(to_compute, sim_many(s_tok, to_compute)))
+                else:
+                    for t_tok in to_compute:
+                        values[t_tok] = self._metric.sim(s_tok, t_tok)
+
+            if len(cache) + len(values) > self._metric_cache_size:
+                cache.clear()
+            for t_tok, value in values.items():
+                cache[(s_tok, t_tok)] = value
+            sims = [
+                values[t_tok] if sim is None else sim
+                for t_tok, sim in zip(t_toks, sims)
+            ]
+
+        return [
+            (t_tok, sim)
+            for t_tok, sim in zip(t_toks, sims)
+            if sim > threshold  # type: ignore
+        ]
 
     def sim(self, src: str, tar: str) -> float:
         """Return the SoftTF-IDF similarity of two strings.
@@ -141,22 +217,14 @@ class SoftTFIDF(_TokenDistance):
 
         src_tok, tar_tok = self._get_tokens()
 
-        if self._corpus is None:
-            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
-        else:
-            corpus = self._corpus
-
         matches = {(tok, tok): 1.0 for tok in self._crisp_intersection()}
         sims = defaultdict(float)  # type: DefaultDict[Tuple[str, str], float]
         s_toks = set(self._src_only().keys())
         t_toks = set(self._tar_only().keys())
+        t_list = list(t_toks)
         for s_tok in s_toks:
-            for t_tok in t_toks:
-                sim = self._metric.sim(s_tok, t_tok)
-                if sim > self._threshold:
-                    sims[(s_tok, t_tok)] = sim
+            for t_tok, sim in self._soft_matches(s_tok, t_list):
+                sims[(s_tok, t_tok)] = sim
         for tokens, value in sorted(
             sims.items(), key=lambda item: item[1], reverse=True
         ):
@@ -165,15 +233,12 @@ class SoftTFIDF(_TokenDistance):
                 s_toks.remove(tokens[0])
                 t_toks.remove(tokens[1])
 
-        vws_dict = {}
-        vwt_dict = {}
-        for token in src_tok.keys():
-            vws_dict[token] = log1p(src_tok[token]) * corpus.idf(token)
-        for token in tar_tok.keys():
-            vwt_dict[token] = log1p(tar_tok[token]) * corpus.idf(token)
+        idf = self._idfs(src, tar, src_tok, tar_tok)
+        vws_dict = self._tf_idf_weights(src_tok, idf)
+        vwt_dict = self._tf_idf_weights(tar_tok, idf)
 
-        vws_rss = sum(score ** 2 for score in vws_dict.values()) ** 0.5
-        vwt_rss = sum(score ** 2 for score in vwt_dict.values()) ** 0.5
+        vws_rss = sum(score**2 for score in vws_dict.values()) ** 0.5
+        vwt_rss = sum(score**2 for score in vwt_dict.values()) ** 0.5
 
         return float(
             round(
@@ -19,9 +19,9 @@
 TF-IDF similarity
 """
 
-from math import log1p
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional
 
+from ._tf_idf_weights import _TFIDFWeights
 from ._token_distance import _TokenDistance
 from ..corpus import UnigramCorpus
 from ..tokenizer import _Tokenizer
@@ -29,7 +29,7 @@ from ..tokenizer import _Tokenizer
 __all__ = ['TFIDF']
 
 
-class TFIDF(_TokenDistance):
+class TFIDF(_TFIDFWeights, _TokenDistance):
     r"""TF-IDF similarity.
 
     For two sets X and Y and a population N, TF-IDF similarity
@@ -84,6 +84,7 @@ class TFIDF(_TokenDistance):
         """
         super(TFIDF, self).__init__(tokenizer=tokenizer, **kwargs)
         self._corpus = corpus
+        self._init_idf_cache()
 
     def sim(self, src: str, tar: str) -> float:
         """Return the TF-IDF similarity of two strings.
@@ -120,22 +121,12 @@ class TFIDF(_TokenDistance):
 
         src_tok, tar_tok = self._get_tokens()
 
-        if self._corpus is None:
-            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
-        else:
-            corpus = self._corpus
+        idf = self._idfs(src, tar, src_tok, tar_tok)
+        vws_dict = self._tf_idf_weights(src_tok, idf)
+        vwt_dict = self._tf_idf_weights(tar_tok, idf)
 
-        vws_dict = {}
-        vwt_dict = {}
-        for token in src_tok.keys():
-            vws_dict[token] = log1p(src_tok[token]) * corpus.idf(token)
-        for token in tar_tok.keys():
-            vwt_dict[token] = log1p(tar_tok[token]) * corpus.idf(token)
-
-        vws_rss = sum(score ** 2 for score in vws_dict.values()) ** 0.5
-        vwt_rss = sum(score ** 2 for score in vwt_dict.values()) ** 0.5
+        vws_rss = sum(score**2 for score in vws_dict.values()) ** 0.5
+        vwt_rss = sum(score**2 for score in vwt_dict.values()) ** 0.5
 
         return float(
             round(
@@ -147,6 +138,71 @@ class TFIDF(_TokenDistance):
             )
         )
 
+    def sim_many(self, src: str, targets: Iterable[str]) -> List[float]:
+        """Return the TF-IDF similarities of a string to many strings.
+
+        With a corpus, each string is converted to a TF-IDF vector once, and
+        each similarity is then the dot product of two sparse vectors.
+        Without one, or with a non-crisp intersection_type, this is equivalent
+        to calling :py:meth:`sim` for each target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+
+        Returns
+        -------
+        list
+            The TF-IDF similarity of src to each target, identical to those
+            :py:meth:`sim` returns
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams
+        >>> corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        >>> for doc in ('cat hat', 'Niall Neil', 'Neal Nigel', 'hat'):
+        ...     corpus.add_document(doc)
+        >>> cmp = TFIDF(tokenizer=QGrams(qval=2), corpus=corpus)
+        >>> cmp.sim_many('cat', ['hat', 'Niall', 'cat'])
+        [0.29601143069025, 0.0, 1.0]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        if self._corpus is None or self.params['intersection_type'] != 'crisp':
+            return [self.sim(src, tar) for tar in targets]
+
+        vectors = self._vectorize([src] + targets)
+        src_norm = vectors.norms[0].item()
+        # the contribution of each src token, before multiplying by the
+        # target's weight & dividing by its norm, as sim computes it
+        src_weights = [
+            (column, weight / src_norm) for column, weight in vectors.row(0)
+        ]
+
+        sims = []
+        for index in range(1, len(vectors)):
+            tar_weights = dict(vectors.row(index))
+            tar_norm = vectors.norms[index].item()
+            sims.append(
+                float(
+                    round(
+                        sum(
+                            weight * tar_weights[column] / tar_norm
+                            for column, weight in src_weights
+                            if column in tar_weights
+                        ),
+                        14,
+                    )
+                )
+            )
+        return sims
+
 
 if __name__ == '__main__':
     import doctest
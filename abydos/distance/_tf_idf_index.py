@@ -0,0 +1,464 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._tf_idf_index.
+
+TF-IDF index for top-k retrieval
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from numpy import arange as np_arange
+from numpy import argsort as np_argsort
+from numpy import array as np_array
+from numpy import bincount as np_bincount
+from numpy import concatenate as np_concatenate
+from numpy import cumsum as np_cumsum
+from numpy import diff as np_diff
+from numpy import float_ as np_float
+from numpy import int64 as np_int64
+from numpy import isfinite as np_isfinite
+from numpy import maximum as np_maximum
+from numpy import partition as np_partition
+from numpy import repeat as np_repeat
+from numpy import searchsorted as np_searchsorted
+from numpy import union1d as np_union1d
+from numpy import zeros as np_zeros
+
+from ._tf_idf import TFIDF
+from ._tf_idf_weights import _TFIDFVectors
+from ..corpus import UnigramCorpus
+from ..tokenizer import _Tokenizer
+
+__all__ = ['TFIDFIndex']
+
+
+class TFIDFIndex:
+    """TF-IDF index.
+
+    A TF-IDF index holds the TF-IDF vectors of a collection of records' keys,
+    as :py:class:`.TFIDF` computes them against a :py:class:`UnigramCorpus`,
+    in compressed sparse row form, together with an inverted list of the
+    L2-normalised weights of each token. Queries are answered
+    term-at-a-time, in the manner of MaxScore :cite:`Turtle:1995`: the
+    tokens of a query are visited in decreasing order of the most they can
+    add to a record's similarity, and once the remaining tokens cannot lift
+    an unseen record into the top k, the rest of the inverted lists are
+    only probed for the records already found, and records that can no
+    longer reach the top k are dropped. The remaining candidates are then
+    rescored with the formula of :py:meth:`.TFIDF.sim`, so the similarities
+    returned are identical to it.
+
+    >>> from abydos.tokenizer import QGrams
+    >>> corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+    >>> names = ['Niall', 'Neil', 'Nigel', 'Neal', 'Colin', 'Coiln']
+    >>> corpus.add_document(' '.join(names))
+    >>> idx = TFIDFIndex(corpus, enumerate(names), tokenizer=QGrams(qval=2))
+    >>> idx.top_k('Nial', 3)
+    [(0, 0.82104527716843), (3, 0.3241359574029), (2, 0.24333235861202)]
+
+    .. versionadded:: 0.6.0
+    """
+
+    # The slack allowed for rounding error when comparing the bounds of
+    # partial sums to the k-th best similarity
+    _margin = 1e-9
+
+    def __init__(
+        self,
+        corpus: UnigramCorpus,
+        records: Optional[
+            Union[Mapping[Hashable, str], Iterable[Tuple[Hashable, str]]]
+        ] = None,
+        tokenizer: Optional[_Tokenizer] = None,
+        **kwargs: Any
+    ) -> None:
+        """Initialize TFIDFIndex instance.
+
+        Parameters
+        ----------
+        corpus : UnigramCorpus
+            A unigram corpus :py:class:`UnigramCorpus`, from which the IDFs
+            of tokens are taken
+        records : dict or iterable or None
+            A dict of record ids to keys, or an iterable of (record id, key)
+            pairs, to index
+        tokenizer : _Tokenizer
+            A tokenizer instance from the :py:mod:`abydos.tokenizer` package
+        **kwargs
+            Arbitrary keyword arguments, passed to :py:class:`.TFIDF`
+
+        Raises
+        ------
+        ValueError
+            A corpus is required, and only the crisp intersection_type is
+            supported
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if corpus is None:
+            raise ValueError('A corpus is required to index strings.')
+        self._cmp = TFIDF(tokenizer=tokenizer, corpus=corpus, **kwargs)
+        if self._cmp.params['intersection_type'] != 'crisp':
+            raise ValueError(
+                'Only the crisp intersection_type can be indexed.'
+            )
+
+        self._ids = []  # type: List[Hashable]
+        self._keys = []  # type: List[str]
+
+        # The vectors of the first _n_vectorized keys, with columns numbered
+        # by _vocabulary, and the state of the corpus they were computed in
+        self._reset()
+        self._state = None  # type: Any
+
+        # The inverted lists: the rows & normalised weights of column c are
+        # at _post_ptr[c]:_post_ptr[c+1] in _post_rows & _post_weights, with
+        # rows in ascending order, and _max_weights[c] is the greatest of
+        # those weights.
+        self._post_ptr = np_zeros(1, dtype=np_int64)
+        self._post_rows = np_zeros(0, dtype=np_int64)
+        self._post_weights = np_zeros(0, dtype=np_float)
+        self._max_weights = np_zeros(0, dtype=np_float)
+
+        if records is not None:
+            self.update(records)
+
+    def __len__(self) -> int:
+        """Return the number of records.
+
+        Returns
+        -------
+        int
+            The number of records
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._ids)
+
+    def add(self, record_id: Hashable, key: str) -> None:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        record_id : hashable
+            The id of the record
+        key : str
+            The key of the record, e.g. a company name
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.update([(record_id, key)])
+
+    def update(
+        self,
+        records: Union[Mapping[Hashable, str], Iterable[Tuple[Hashable, str]]],
+    ) -> None:
+        """Add records to the index.
+
+        Records are vectorized when the index is next queried, so adding
+        records in large batches is considerably faster than adding them
+        between queries.
+
+        Parameters
+        ----------
+        records : dict or iterable
+            A dict of record ids to keys, or an iterable of (record id, key)
+            pairs
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(records, Mapping):
+            records = records.items()
+        for record_id, key in records:
+            self._ids.append(record_id)
+            self._keys.append(key)
+
+    def _reset(self) -> None:
+        """Discard the vectors of all records.
+
+        .. versionadded:: 0.6.0
+        """
+        self._vocabulary = {}  # type: Dict[str, int]
+        self._vectors = _TFIDFVectors(
+            self._vocabulary,
+            np_zeros(0, dtype=np_float),
+            np_zeros(1, dtype=np_int64),
+            np_zeros(0, dtype=np_int64),
+            np_zeros(0, dtype=np_float),
+            np_zeros(0, dtype=np_float),
+        )
+        self._n_vectorized = 0
+
+    def _append(self, batch: _TFIDFVectors) -> None:
+        """Append vectors to the index's vectors.
+
+        Parameters
+        ----------
+        batch : _TFIDFVectors
+            Vectors, as returned by :py:meth:`._TFIDFWeights._vectorize`,
+            whose columns are renumbered into the index's vocabulary
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vocabulary = self._vocabulary
+        vectors = self._vectors
+        idf = vectors.idf.tolist()
+        columns = []
+        for token, column in batch.vocabulary.items():
+            if token not in vocabulary:
+                vocabulary[token] = len(vocabulary)
+                idf.append(batch.idf[column].item())
+            columns.append(vocabulary[token])
+
+        self._vectors = _TFIDFVectors(
+            vocabulary,
+            np_array(idf, dtype=np_float),
+            np_concatenate(
+                [vectors.indptr, batch.indptr[1:] + vectors.indptr[-1]]
+            ),
+            np_concatenate(
+                [
+                    vectors.indices,
+                    np_array(columns, dtype=np_int64)[batch.indices],
+                ]
+            ),
+            np_concatenate([vectors.weights, batch.weights]),
+            np_concatenate([vectors.norms, batch.norms]),
+        )
+        self._n_vectorized = len(self._vectors)
+
+    def _build(self) -> None:
+        """Vectorize any new records & rebuild the inverted lists.
+
+        If the corpus has changed since the records were vectorized, all
+        records are vectorized again.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._cmp._cached_idf()  # noqa: SF01
+        state = self._cmp._idf_state  # noqa: SF01
+        if state != self._state:
+            self._reset()
+            self._state = state
+        if self._n_vectorized == len(self._keys):
+            return
+
+        self._append(
+            self._cmp._vectorize(  # noqa: SF01
+                self._keys[self._n_vectorized :]
+            )
+        )
+        vectors = self._vectors
+
+        # Records with no tokens, or with tokens absent from the corpus
+        # (whose IDFs, and so norms, are infinite) have no positive
+        # similarity to any query, and are left out of the inverted lists.
+        rows = np_repeat(
+            np_arange(len(vectors), dtype=np_int64), np_diff(vectors.indptr)
+        )
+        norms = vectors.norms[rows]
+        keep = np_isfinite(norms) & (norms > 0)
+        rows = rows[keep]
+        columns = vectors.indices[keep]
+        weights = vectors.weights[keep] / norms[keep]
+
+        order = np_argsort(columns, kind='stable')
+        self._post_rows = rows[order]
+        self._post_weights = weights[order]
+        self._post_ptr = np_concatenate(
+            [
+                np_zeros(1, dtype=np_int64),
+                np_cumsum(
+                    np_bincount(columns, minlength=len(self._vocabulary))
+                ),
+            ]
+        )
+        self._max_weights = np_zeros(len(self._vocabulary), dtype=np_float)
+        np_maximum.at(self._max_weights, columns, weights)
+
+    def _sim(self, src_weights: List[Tuple[int, float]], row: int) -> float:
+        """Return the TF-IDF similarity of a query to a record.
+
+        Parameters
+        ----------
+        src_weights : list
+            The column & weight of each token of the query, its weight
+            already divided by the query's norm
+        row : int
+            The row of the record
+
+        Returns
+        -------
+        float
+            TF-IDF similarity, identical to that :py:meth:`.TFIDF.sim` returns
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tar_weights = dict(self._vectors.row(row))
+        tar_norm = self._vectors.norms[row].item()
+        return float(
+            round(
+                sum(
+                    weight * tar_weights[column] / tar_norm
+                    for column, weight in src_weights
+                    if column in tar_weights
+                ),
+                14,
+            )
+        )
+
+    def top_k(self, query: str, k: int = 10) -> List[Tuple[Hashable, float]]:
+        """Return the records most similar to a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : int
+            The maximum number of records to return
+
+        Returns
+        -------
+        list
+            The (record id, TF-IDF similarity) pairs of the (up to) k records
+            with the greatest positive similarity to the query, in decreasing
+            order of similarity, and in the order in which they were added
+            among equally similar records
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams
+        >>> corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        >>> corpus.add_document('cat hat bat rat hot')
+        >>> idx = TFIDFIndex(corpus, tokenizer=QGrams(qval=2))
+        >>> idx.update({'a': 'cat', 'b': 'hat', 'c': 'hot', 'd': 'dog'})
+        >>> idx.top_k('hat')
+        [('b', 1.0), ('c', 0.24420351769632), ('a', 0.12071528227328)]
+        >>> idx.top_k('hat', 1)
+        [('b', 1.0)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._build()
+        if k < 1:
+            return []
+
+        query_vector = self._cmp._vectorize([query])  # noqa: SF01
+        query_norm = query_vector.norms[0].item()
+        # A query with no tokens, or with a token absent from the corpus, has
+        # no positive similarity to any record.
+        if not 0 < query_norm < float('inf'):
+            return []
+
+        src_weights = []  # type: List[Tuple[int, float]]
+        terms = []  # type: List[Tuple[float, float, int]]
+        tokens = list(query_vector.vocabulary)
+        for query_column, weight in query_vector.row(0):
+            column = self._vocabulary.get(tokens[query_column])
+            if column is not None:
+                src_weights.append((column, weight / query_norm))
+                if self._max_weights[column] > 0:
+                    term_weight = weight / query_norm
+                    terms.append(
+                        (
+                            term_weight * self._max_weights[column].item(),
+                            term_weight,
+                            column,
+                        )
+                    )
+        if not terms:
+            return []
+
+        # Visit the tokens in decreasing order of their bounds; rest[i] is the
+        # most that the tokens from the i-th on can add to a similarity.
+        terms.sort(reverse=True)
+        rest = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            rest[i] = rest[i + 1] + terms[i][0]
+
+        acc = np_zeros(len(self._vectors), dtype=np_float)
+        cands = np_zeros(0, dtype=np_int64)
+        theta = 0.0
+        i = 0
+        # Gather candidates until no unseen record can reach the top k.
+        while i < len(terms) and (
+            len(cands) < k or rest[i] >= theta - self._margin
+        ):
+            _, term_weight, column = terms[i]
+            start, end = self._post_ptr[column], self._post_ptr[column + 1]
+            rows = self._post_rows[start:end]
+            acc[rows] += term_weight * self._post_weights[start:end]
+            cands = np_union1d(cands, rows)
+            if len(cands) >= k:
+                theta = np_partition(acc[cands], -k)[-k].item()
+            i += 1
+        # Add the remaining tokens' weights to the surviving candidates only.
+        while i < len(terms):
+            cands = cands[acc[cands] + rest[i] >= theta - self._margin]
+            _, term_weight, column = terms[i]
+            start, end = self._post_ptr[column], self._post_ptr[column + 1]
+            rows = self._post_rows[start:end]
+            pos = np_searchsorted(rows, cands)
+            pos[pos == len(rows)] = 0
+            hits = rows[pos] == cands
+            acc[cands[hits]] += (
+                term_weight * self._post_weights[start:end][pos[hits]]
+            )
+            theta = np_partition(acc[cands], -k)[-k].item()
+            i += 1
+        if len(cands) >= k:
+            cands = cands[acc[cands] >= theta - self._margin]
+
+        sims = []
+        for row in cands.tolist():
+            sim = self._sim(src_weights, row)
+            if sim > 0:
+                sims.append((-sim, row))
+        sims.sort()
+        return [(self._ids[row], -sim) for sim, row in sims[:k]]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,357 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._tf_idf_weights.
+
+The distance._tf_idf_weights module defines _TFIDFWeights, which computes &
+caches the TF-IDF weights of tokens for the TF-IDF based measures, and
+_TFIDFVectors, a collection of TF-IDF vectors in compressed sparse row form.
+"""
+
+from collections import Counter
+from math import log1p
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from numpy import array as np_array
+from numpy import float_ as np_float
+from numpy import int64 as np_int64
+from numpy import ndarray as np_ndarray
+
+from ..corpus import UnigramCorpus
+
+__all__ = []  # type: List[str]
+
+
+class _TFIDFVectors:
+    r"""TF-IDF vectors, in compressed sparse row form.
+
+    Row i holds the tokens of the i-th string of a collection: its columns
+    are ``indices[indptr[i]:indptr[i+1]]``, in the order in which the
+    tokenizer returned the tokens, and its weights, :math:`log(1+TF) \cdot
+    IDF`, are the corresponding elements of ``weights``. Dividing a row's
+    weights by its element of ``norms`` L2-normalises it.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        vocabulary: Dict[str, int],
+        idf: np_ndarray,
+        indptr: np_ndarray,
+        indices: np_ndarray,
+        weights: np_ndarray,
+        norms: np_ndarray,
+    ) -> None:
+        """Initialize _TFIDFVectors instance.
+
+        Parameters
+        ----------
+        vocabulary : dict
+            The column of each token
+        idf : numpy.ndarray
+            The IDF of the token of each column
+        indptr : numpy.ndarray
+            The start of each row in indices & weights, followed by the end of
+            the last row
+        indices : numpy.ndarray
+            The column of each weight
+        weights : numpy.ndarray
+            The weights
+        norms : numpy.ndarray
+            The L2 norm of each row
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.norms = norms
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns
+        -------
+        int
+            The number of rows
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self.norms)
+
+    def row(self, index: int) -> List[Tuple[int, float]]:
+        """Return the columns & weights of a row.
+
+        Parameters
+        ----------
+        index : int
+            The row
+
+        Returns
+        -------
+        list
+            The (column, weight) pairs of the row
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return list(
+            zip(
+                self.indices[start:end].tolist(),
+                self.weights[start:end].tolist(),
+            )
+        )
+
+
+class _TFIDFWeights:
+    """Mixin computing the TF-IDF weights of tokens.
+
+    Classes using it hold a :py:class:`UnigramCorpus` (or None) in
+    ``_corpus`` and a tokenizer in ``params['tokenizer']``, and call
+    :py:meth:`_init_idf_cache` on initialization. The IDF of each token in the
+    corpus is computed once and cached, until the corpus changes.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _corpus = None  # type: Optional[UnigramCorpus]
+    params = {}  # type: Dict[str, Any]
+
+    # The maximum number of tokens whose IDF is cached
+    _idf_cache_size = 1 << 16
+
+    def _init_idf_cache(self) -> None:
+        """Create an empty IDF cache.
+
+        .. versionadded:: 0.6.0
+        """
+        self._idf_cache = {}  # type: Dict[str, float]
+        self._idf_state = None  # type: Optional[Tuple[int, int, int]]
+
+    def _corpus_idf(self, token: str) -> float:
+        """Return the IDF of a token in the corpus, from the cache if possible.
+
+        Parameters
+        ----------
+        token : str
+            The token
+
+        Returns
+        -------
+        float
+            The IDF of the token
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self._idf_cache
+        if token in cache:
+            return cache[token]
+        if len(cache) >= self._idf_cache_size:
+            cache.clear()
+        idf = cache[token] = self._corpus.idf(token)  # type: ignore
+        return idf
+
+    def _cached_idf(self) -> Callable[[str], float]:
+        """Return a function giving the IDF of a token in the corpus.
+
+        The cache is emptied if the corpus has changed since it was last used.
+
+        Returns
+        -------
+        function
+            A function from a token to its IDF
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        corpus = self._corpus
+        state = (
+            id(corpus.corpus),  # type: ignore
+            corpus.doc_count,  # type: ignore
+            getattr(corpus, '_version', 0),
+        )
+        if state != self._idf_state:
+            self._idf_cache.clear()
+            self._idf_state = state
+        return self._corpus_idf
+
+    def _idfs(
+        self,
+        src: str,
+        tar: str,
+        src_tok: TCounter[str],
+        tar_tok: TCounter[str],
+    ) -> Callable[[str], float]:
+        """Return a function giving the IDF of a token.
+
+        Without a corpus, the IDFs are those of a :py:class:`UnigramCorpus`
+        of the two strings, i.e. of the tokens of their words, over three
+        documents; they are computed directly, rather than by creating such a
+        corpus.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        src_tok : Counter
+            The tokens of src
+        tar_tok : Counter
+            The tokens of tar
+
+        Returns
+        -------
+        function
+            A function from a token to its IDF
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._corpus is not None:
+            return self._cached_idf()
+
+        # Each distinct word of a document adds one to the document count of
+        # each of its tokens, and the corpus counts an initial, empty
+        # document.
+        doc_counts = Counter()  # type: TCounter[str]
+        tokenizer = self.params['tokenizer']
+        for doc, doc_tok in ((src, src_tok), (tar, tar_tok)):
+            words = doc.split()
+            if len(words) == 1 and words[0] == doc:
+                doc_counts.update(doc_tok.keys())
+            else:
+                for word in set(words):
+                    doc_counts.update(
+                        tokenizer.tokenize(word).get_counter().keys()
+                    )
+
+        def _idf(token: str) -> float:
+            if token in doc_counts:
+                return log1p(3 / doc_counts[token])
+            return float('inf')
+
+        return _idf
+
+    @staticmethod
+    def _tf_idf_weights(
+        tokens: TCounter[str], idf: Callable[[str], float]
+    ) -> Dict[str, float]:
+        """Return the TF-IDF weight of each token.
+
+        Parameters
+        ----------
+        tokens : Counter
+            The tokens & their counts
+        idf : function
+            A function from a token to its IDF
+
+        Returns
+        -------
+        dict
+            The weight of each token
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            token: log1p(count) * idf(token) for token, count in tokens.items()
+        }
+
+    def _vectorize(self, strings: Iterable[str]) -> _TFIDFVectors:
+        """Return the TF-IDF vectors of strings.
+
+        Parameters
+        ----------
+        strings : iterable
+            The strings
+
+        Returns
+        -------
+        _TFIDFVectors
+            The vector of each string
+
+        Raises
+        ------
+        ValueError
+            A corpus is required to vectorize strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._corpus is None:
+            raise ValueError('A corpus is required to vectorize strings.')
+        idf = self._cached_idf()
+
+        vocabulary = {}  # type: Dict[str, int]
+        idfs = []  # type: List[float]
+        indptr = [0]
+        indices = []  # type: List[int]
+        weights = []  # type: List[float]
+        norms = []  # type: List[float]
+        tokenizer = self.params['tokenizer']
+        for string in strings:
+            tokens = tokenizer.tokenize(string).get_counter()
+            row_weights = []
+            for token, count in tokens.items():
+                column = vocabulary.get(token)
+                if column is None:
+                    column = vocabulary[token] = len(vocabulary)
+                    idfs.append(idf(token))
+                indices.append(column)
+                row_weights.append(log1p(count) * idfs[column])
+            weights.extend(row_weights)
+            indptr.append(len(indices))
+            norms.append(sum(score**2 for score in row_weights) ** 0.5)
+
+        return _TFIDFVectors(
+            vocabulary,
+            np_array(idfs, dtype=np_float),
+            np_array(indptr, dtype=np_int64),
+            np_array(indices, dtype=np_int64),
+            np_array(weights, dtype=np_float),
+            np_array(norms, dtype=np_float),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
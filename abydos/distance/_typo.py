@@ -19,12 +19,18 @@
 Typo edit distance functions.
 """
 
-from itertools import chain
 from math import log
-from typing import Any, Dict, Tuple, cast
+from typing import Any, Dict, List, Tuple, cast
 
+from numpy import arange as np_arange
+from numpy import array as np_array
 from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+from numpy import full as np_full
+from numpy import isnan as np_isnan
+from numpy import ix_ as np_ix_
+from numpy import minimum as np_minimum
+from numpy import nan as np_nan
+from numpy import ndarray as np_ndarray
 
 from ._distance import _Distance
 
@@ -110,6 +116,11 @@ class Typo(_Distance):
     )}  # type: Dict[str, Tuple[Tuple[Tuple[str, ...], ...], ...]]
     # fmt: on
 
+    _key_positions = (
+        {}
+    )  # type: Dict[str, Tuple[Dict[str, int], List[Tuple[int, int, int]]]]
+    _key_distances = {}  # type: Dict[Tuple[str, str], np_ndarray]
+
     def __init__(
         self,
         metric: str = 'euclidean',
@@ -153,6 +164,147 @@ class Typo(_Distance):
         self._layout = layout
         self._failsafe = failsafe
 
+        self._sub_costs = (
+            {}
+        )  # type: Dict[str, Tuple[Dict[str, int], np_ndarray]]
+        if layout != 'auto':
+            self._layout_sub_costs(layout)
+
+    @classmethod
+    def _layout_keys(
+        cls, layout: str
+    ) -> Tuple[Dict[str, int], List[Tuple[int, int, int]]]:
+        """Return the keys of a keyboard layout and their positions.
+
+        Parameters
+        ----------
+        layout : str
+            The name of the keyboard layout
+
+        Returns
+        -------
+        tuple
+            A dict mapping each character on the keyboard to its index, and
+            the (shift state, row, column) of each indexed character. Where a
+            character appears more than once, its first position is used.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if layout not in cls._key_positions:
+            index = {}  # type: Dict[str, int]
+            positions = []  # type: List[Tuple[int, int, int]]
+            for mode, kb_mode in enumerate(cls._keyboard[layout]):
+                for row, keys in enumerate(kb_mode):
+                    for col, char in enumerate(keys):
+                        if len(char) == 1 and char not in index:
+                            index[char] = len(positions)
+                            positions.append((mode, row, col))
+            cls._key_positions[layout] = (index, positions)
+        return cls._key_positions[layout]
+
+    @classmethod
+    def _layout_distances(cls, layout: str, metric: str) -> np_ndarray:
+        """Return the distances between all keys of a keyboard layout.
+
+        Parameters
+        ----------
+        layout : str
+            The name of the keyboard layout
+        metric : str
+            The name of the distance metric
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance between each pair of keys, indexed as in
+            :py:meth:`_layout_keys`
+
+        Raises
+        ------
+        ValueError
+            Unsupported metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (layout, metric) not in cls._key_distances:
+            if metric.startswith('log-'):
+                base = metric[4:]
+            else:
+                base = metric
+            if base == 'euclidean':
+
+                def _distance(row: int, col: int) -> float:
+                    return cast(float, (row**2 + col**2) ** 0.5)
+
+            elif base == 'manhattan':
+
+                def _distance(row: int, col: int) -> float:
+                    return abs(row) + abs(col)
+
+            else:
+                raise ValueError('Unsupported metric: {}'.format(metric))
+
+            positions = cls._layout_keys(layout)[1]
+            distances = [
+                [
+                    _distance(row1 - row2, col1 - col2)
+                    for _, row2, col2 in positions
+                ]
+                for _, row1, col1 in positions
+            ]
+            if base != metric:
+                distances = [
+                    [log(1 + dist) for dist in row] for row in distances
+                ]
+            cls._key_distances[layout, metric] = np_array(
+                distances, dtype=np_float
+            )
+        return cls._key_distances[layout, metric]
+
+    def _layout_sub_costs(
+        self, layout: str
+    ) -> Tuple[Dict[str, int], np_ndarray]:
+        """Return the substitution costs between all keys of a layout.
+
+        Parameters
+        ----------
+        layout : str
+            The name of the keyboard layout
+
+        Returns
+        -------
+        tuple
+            A dict mapping each character on the keyboard to its index, and
+            the cost of substituting each key for each other key. The last row
+            & column hold the cost of substituting a character that is not on
+            the keyboard: an insertion plus a deletion in failsafe mode, or NaN
+            otherwise.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if layout not in self._sub_costs:
+            ins_cost, del_cost, sub_cost, shift_cost = self._cost
+            index, positions = self._layout_keys(layout)
+            modes = np_array([mode for mode, _, _ in positions])
+
+            costs = np_full(
+                (len(positions) + 1, len(positions) + 1),
+                ins_cost + del_cost if self._failsafe else np_nan,
+                dtype=np_float,
+            )
+            costs[:-1, :-1] = sub_cost * (
+                self._layout_distances(layout, self._metric)
+                + shift_cost * (modes[:, None] != modes[None, :])
+            )
+            self._sub_costs[layout] = (index, costs)
+        return self._sub_costs[layout]
+
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the typo distance between two strings.
 
@@ -209,9 +361,11 @@ class Typo(_Distance):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Key positions & substitution costs are precomputed per layout
 
         """
-        ins_cost, del_cost, sub_cost, shift_cost = self._cost
+        ins_cost, del_cost = self._cost[:2]
 
         if src == tar:
             return 0.0
@@ -221,126 +375,50 @@ class Typo(_Distance):
             return len(src) * del_cost
 
         if self._layout == 'auto':
+            letters = set(src) | set(tar)
             for kb in ['QWERTY', 'QWERTZ', 'AZERTY']:
-                keys = set(chain(*chain(*self._keyboard[kb])))
-                letters = set(src) | set(tar)
-                if not (letters - keys):
-                    keyboard = self._keyboard[kb]
+                if letters.issubset(self._layout_keys(kb)[0]):
+                    layout = kb
                     break
             else:
                 # Fallback to QWERTY
-                keyboard = self._keyboard['QWERTY']
+                layout = 'QWERTY'
         else:
-            keyboard = self._keyboard[self._layout]
-
-        kb_array = []
-        for kb_mode in keyboard:
-            kb_array.append({item for sublist in kb_mode for item in sublist})
-        keys = set(chain(*chain(*keyboard)))
-
-        def _kb_array_for_char(char: str) -> Tuple[Tuple[str, ...], ...]:
-            """Return the keyboard layout that contains ch.
-
-            Parameters
-            ----------
-            char : str
-                The character to lookup
-
-            Returns
-            -------
-            tuple
-                A keyboard
-
-            Raises
-            ------
-            ValueError
-                char not found in any keyboard layouts
-
-            .. versionadded:: 0.3.0
-
-            """
-            for i, kb_mode in enumerate(kb_array):
-                if char in kb_mode:
-                    return keyboard[i]
-            raise ValueError(char + ' not found in any keyboard layouts')
-
-        def _substitution_cost(char1: str, char2: str) -> float:
-            if self._failsafe and (char1 not in keys or char2 not in keys):
-                return ins_cost + del_cost
-            cost = sub_cost
-            cost *= metric_dict[self._metric](char1, char2) + shift_cost * (
-                _kb_array_for_char(char1) != _kb_array_for_char(char2)
+            layout = self._layout
+        index, costs = self._layout_sub_costs(layout)
+
+        # Characters not on the keyboard are mapped to the last row & column
+        # of the cost table, and identical characters cost nothing.
+        unknown = len(index)
+        sub = costs[
+            np_ix_(
+                [index.get(char, unknown) for char in src],
+                [index.get(char, unknown) for char in tar],
             )
-            return cost
-
-        def _get_char_coord(
-            char: str, kb_array: Tuple[Tuple[str, ...], ...]
-        ) -> Tuple[int, int]:
-            """Return the row & column of char in the keyboard.
-
-            Parameters
-            ----------
-            char : str
-                The character to search for
-            kb_array : tuple of tuples
-                The array of key positions
-
-            Returns
-            -------
-            tuple
-                The row & column of the key
-
-            .. versionadded:: 0.3.0
-
-            """
-            for row in kb_array:  # pragma: no branch
-                if char in row:
-                    break
-            return kb_array.index(row), row.index(char)
-
-        def _euclidean_keyboard_distance(char1: str, char2: str) -> float:
-            row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-            row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-            return ((row1 - row2) ** 2 + (col1 - col2) ** 2) ** 0.5
-
-        def _manhattan_keyboard_distance(char1: str, char2: str) -> float:
-            row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-            row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-            return abs(row1 - row2) + abs(col1 - col2)
-
-        def _log_euclidean_keyboard_distance(char1: str, char2: str) -> float:
-            return log(1 + _euclidean_keyboard_distance(char1, char2))
-
-        def _log_manhattan_keyboard_distance(char1: str, char2: str) -> float:
-            return log(1 + _manhattan_keyboard_distance(char1, char2))
-
-        metric_dict = {
-            'euclidean': _euclidean_keyboard_distance,
-            'manhattan': _manhattan_keyboard_distance,
-            'log-euclidean': _log_euclidean_keyboard_distance,
-            'log-manhattan': _log_manhattan_keyboard_distance,
-        }
-
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        for i in range(len(src) + 1):
-            d_mat[i, 0] = i * del_cost
-        for j in range(len(tar) + 1):
-            d_mat[0, j] = j * ins_cost
-
+        ]
+        sub[
+            np_array([ord(char) for char in src])[:, None]
+            == np_array([ord(char) for char in tar])[None, :]
+        ] = 0.0
+
+        if not self._failsafe:
+            missing = np_isnan(sub)
+            if missing.any():
+                i, j = divmod(int(missing.argmax()), len(tar))
+                char = src[i] if src[i] not in index else tar[j]
+                raise ValueError(char + ' not found in any keyboard layouts')
+
+        # Each row's deletions & substitutions are computed at once; the
+        # insertions, which depend on the cell to the left, follow in turn.
+        row = np_arange(len(tar) + 1, dtype=np_float) * ins_cost
         for i in range(len(src)):
-            for j in range(len(tar)):
-                d_mat[i + 1, j + 1] = min(
-                    d_mat[i + 1, j] + ins_cost,  # ins
-                    d_mat[i, j + 1] + del_cost,  # del
-                    d_mat[i, j]
-                    + (
-                        _substitution_cost(src[i], tar[j])
-                        if src[i] != tar[j]
-                        else 0
-                    ),  # sub/==
-                )
-
-        return cast(float, d_mat[len(src), len(tar)])
+            options = np_minimum(row[1:] + del_cost, row[:-1] + sub[i])
+            cells = [(i + 1) * del_cost]
+            for option in options.tolist():
+                cells.append(min(cells[-1] + ins_cost, option))
+            row = np_array(cells, dtype=np_float)
+
+        return float(row[-1])
 
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized typo distance between two strings.
@@ -20,6 +20,8 @@ The fingerprint._Fingerprint module implements abstract class Fingerprint
 and defines contants for most common letters.
 """
 
+from ..util._lru_cache import _Cacheable
+
 # fmt: off
 # most common letters, as defined in Cisłak & Grabowski
 MOST_COMMON_LETTERS_CG = ('e', 't', 'a', 'o', 'i', 'n', 's', 'h', 'r', 'd',
@@ -61,12 +63,16 @@ MOST_COMMON_LETTERS_DE_LC = ('e', 'n', 'i', 'r', 's', 't', 'a', 'd', 'h', 'u',
 # fmt: on
 
 
-class _Fingerprint:
+class _Fingerprint(_Cacheable):
     """Abstract _Fingerprint class.
 
+    Results can be cached, per instance, by calling :py:meth:`enable_cache`.
+
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'fingerprint'
+
     def fingerprint(self, word: str) -> str:
         """Fingerprint string.
 
@@ -22,6 +22,8 @@ functions. It has three functions:
     - :py:func:`.ipa_to_features` takes a string of IPA symbols and returns
       list of integers that represent the phonetic features bundled in the
       phone that the symbols represents.
+    - :py:func:`.ipa_to_features_many` does the same for many IPA strings,
+      returning an array of integers for each.
     - :py:func:`.ipa_to_feature_dicts` takes a string of IPA symbols and
       returns list of human-readable dicts that represent the phonetic features
       bundled in the phone that the symbols represents.
@@ -32,6 +34,9 @@ functions. It has three functions:
     - :py:func:`.cmp_features` takes two phonetic feature bundles, such as the
       components of the lists returned by :py:func:`.ipa_to_features`, and
       returns a measure of their similarity.
+    - :py:func:`.cmp_features_matrix` compares each of one sequence of
+      feature bundles to each of another, and :py:class:`.FeatureComparator`
+      compares arrays of bundles with precomputed feature weights.
 
 
 An example using these functions on two different pronunciations of the word
@@ -183,17 +188,23 @@ An example using these functions on two different pronunciations of the word
 """
 
 from ._phones import (
+    FeatureComparator,
     cmp_features,
+    cmp_features_matrix,
     get_feature,
     ipa_to_feature_dicts,
     ipa_to_features,
+    ipa_to_features_many,
 )
 
 __all__ = [
     'ipa_to_features',
+    'ipa_to_features_many',
     'ipa_to_feature_dicts',
     'get_feature',
     'cmp_features',
+    'cmp_features_matrix',
+    'FeatureComparator',
 ]
 
 
@@ -20,10 +20,31 @@ The phones module implements phonetic feature coding, decoding, and comparison
 functions.
 """
 
-from typing import Dict, List, Optional, Sequence, Union
+from functools import lru_cache
+from re import DOTALL
+from re import compile as re_compile
+from re import escape as re_escape
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from unicodedata import normalize
 
-__all__ = ['cmp_features', 'get_feature', 'ipa_to_features']
+from numpy import arange as np_arange
+from numpy import array as np_array
+from numpy import asarray as np_asarray
+from numpy import float_ as np_float
+from numpy import int64 as np_int64
+from numpy import ndarray as np_ndarray
+from numpy import ones as np_ones
+from numpy import uint8 as np_uint8
+from numpy import zeros as np_zeros
+
+__all__ = [
+    'FeatureComparator',
+    'cmp_features',
+    'cmp_features_matrix',
+    'get_feature',
+    'ipa_to_features',
+    'ipa_to_features_many',
+]
 
 
 _PHONETIC_FEATURES = {
@@ -571,6 +592,67 @@ _FEATURE_MASK = {
     'delayed_release': 3,
 }
 
+# A phone's symbol is matched greedily, longest symbol first; any other
+# character is matched alone, as an unknown phone.
+_SEGMENTER = re_compile(
+    '|'.join(
+        re_escape(symbol)
+        for symbol in sorted(_PHONETIC_FEATURES, key=len, reverse=True)
+    )
+    + '|.',
+    DOTALL,
+)
+
+
+@lru_cache(maxsize=65536)
+def _ipa_segments(ipa: str) -> Tuple[str, ...]:
+    """Segment an IPA string into the symbols of its phones.
+
+    Parameters
+    ----------
+    ipa : str
+        The IPA representation of a phone or series of phones
+
+    Returns
+    -------
+    tuple of str
+        The symbols of the phones, in the order of the input, with characters
+        that begin no known symbol as single-character segments
+
+    Examples
+    --------
+    >>> _ipa_segments('t̪ɛl')
+    ('t̪', 'ɛ', 'l')
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(_SEGMENTER.findall(normalize('NFD', ipa.lower())))
+
+
+@lru_cache(maxsize=65536)
+def _ipa_to_feature_tuple(ipa: str) -> Tuple[int, ...]:
+    """Convert IPA to a (memoised) tuple of features.
+
+    Parameters
+    ----------
+    ipa : str
+        The IPA representation of a phone or series of phones
+
+    Returns
+    -------
+    tuple of ints
+        A representation of the features of the input string
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(
+        _PHONETIC_FEATURES.get(symbol, -1) for symbol in _ipa_segments(ipa)
+    )
+
 
 def ipa_to_features(ipa: str) -> List[int]:
     """Convert IPA to features.
@@ -599,30 +681,42 @@ def ipa_to_features(ipa: str) -> List[int]:
     2783230754501863834]
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.6.0
+        Segments by longest match & memoises results
 
     """
-    features = []
-    pos = 0
-    ipa = normalize('NFD', ipa.lower())
-
-    maxsymlen = max(len(_) for _ in _PHONETIC_FEATURES)
-
-    while pos < len(ipa):
-        found_match = False
-        for i in range(maxsymlen, 0, -1):
-            if (
-                pos + i - 1 <= len(ipa)
-                and ipa[pos : pos + i] in _PHONETIC_FEATURES
-            ):
-                features.append(_PHONETIC_FEATURES[ipa[pos : pos + i]])
-                pos += i
-                found_match = True
-
-        if not found_match:
-            features.append(-1)
-            pos += 1
+    return list(_ipa_to_feature_tuple(ipa))
 
-    return features
+
+def ipa_to_features_many(ipas: Iterable[str]) -> List[np_ndarray]:
+    """Convert many IPA strings to arrays of features.
+
+    Parameters
+    ----------
+    ipas : iterable of str
+        IPA representations of phones or series of phones
+
+    Returns
+    -------
+    list of numpy.ndarray
+        A representation of the features of each input string, as an array
+        of np.int64
+
+    Examples
+    --------
+    >>> feats = ipa_to_features_many(['mut', 'fon'])
+    >>> feats[0].dtype
+    dtype('int64')
+    >>> [feat.tolist() for feat in feats]
+    [[2709662981243185770, 1825831513894594986, 2783230754502126250],
+    [2781702983095331242, 1825831531074464170, 2711173160463936106]]
+
+    .. versionadded:: 0.6.0
+
+    """
+    return [
+        np_array(_ipa_to_feature_tuple(ipa), dtype=np_int64) for ipa in ipas
+    ]
 
 
 def ipa_to_feature_dicts(ipa: str) -> List[Dict[str, str]]:
@@ -739,45 +833,33 @@ def ipa_to_feature_dicts(ipa: str) -> List[Dict[str, str]]:
       'delayed_release': '-'}]
 
     .. versionadded:: 0.4.1
+    .. versionchanged:: 0.6.0
+        Segments by longest match
 
     """
     features = []
-    pos = 0
-    ipa = normalize('NFD', ipa.lower())
-
-    maxsymlen = max(len(_) for _ in _PHONETIC_FEATURES)
-
-    while pos < len(ipa):
-        found_match = False
-        for i in range(maxsymlen, 0, -1):
-            if (
-                pos + i - 1 <= len(ipa)
-                and ipa[pos : pos + i] in _PHONETIC_FEATURES
-            ):
-                feature_int = _PHONETIC_FEATURES[ipa[pos : pos + i]]
-                feature_dict = {}
-                for feature in _FEATURE_MASK.keys():
-                    # each feature mask contains two bits, one each for - and +
-                    mask = _FEATURE_MASK[feature]
-                    # the lower bit represents +
-                    pos_mask = mask >> 1
-
-                    masked = feature_int & mask
-                    if masked == 0:
-                        feature_dict[feature] = '0'  # 0
-                    elif masked == mask:
-                        feature_dict[feature] = '+/-'  # +/-
-                    elif masked & pos_mask:
-                        feature_dict[feature] = '+'  # +
-                    else:
-                        feature_dict[feature] = '-'  # -
-                features.append(feature_dict)
-                pos += i
-                found_match = True
-
-        if not found_match:
+
+    for feature_int in _ipa_to_feature_tuple(ipa):
+        if feature_int == -1:
             features.append({})
-            pos += 1
+            continue
+        feature_dict = {}
+        for feature in _FEATURE_MASK.keys():
+            # each feature mask contains two bits, one each for - and +
+            mask = _FEATURE_MASK[feature]
+            # the lower bit represents +
+            pos_mask = mask >> 1
+
+            masked = feature_int & mask
+            if masked == 0:
+                feature_dict[feature] = '0'  # 0
+            elif masked == mask:
+                feature_dict[feature] = '+/-'  # +/-
+            elif masked & pos_mask:
+                feature_dict[feature] = '+'  # +
+            else:
+                feature_dict[feature] = '-'  # -
+        features.append(feature_dict)
 
     return features
 
@@ -946,58 +1028,271 @@ def cmp_features(
         Added weights parameter for modifiable feature weighting
 
     """
-    if feat1 < 0 or feat2 < 0:
-        return 0.0
-    if feat1 == feat2:
-        return 1.0
-
-    # This should be handled some other way since this will take a long time
-    # when done repeatedly. Maybe convert to a class & save the weights list.
-    if weights is not None:
-        if isinstance(weights, dict):
-            weights = [
-                weights[feature] if feature in weights else 0
-                for feature in sorted(
-                    _FEATURE_MASK, key=_FEATURE_MASK.get, reverse=True
-                )
-            ]
-        elif isinstance(weights, (list, tuple)):
-            weights = list(weights) + [0] * (len(_FEATURE_MASK) - len(weights))
-        else:
-            raise TypeError('weights must be a dist, list, or tuple.')
+    if weights is None:
+        return _UNWEIGHTED.cmp(feat1, feat2)
+    return FeatureComparator(weights).cmp(feat1, feat2)
 
-    magnitude = sum(weights) if weights else len(_FEATURE_MASK)
+
+def cmp_features_matrix(
+    feats_a: Sequence[int],
+    feats_b: Sequence[int],
+    weights: Optional[
+        Union[Sequence[Union[int, float]], Dict[str, Union[int, float]]]
+    ] = None,
+) -> np_ndarray:
+    """Compare each feature bundle of one sequence to each of another.
+
+    Parameters
+    ----------
+    feats_a : list of ints
+        A sequence of feature bundles, such as is returned by
+        :py:func:`ipa_to_features`
+    feats_b : list of ints
+        A sequence of feature bundles
+    weights : None or list or tuple or dict
+        Feature weights, as in :py:func:`cmp_features`
+
+    Returns
+    -------
+    numpy.ndarray
+        The comparison of the ith bundle of feats_a to the jth bundle of
+        feats_b, at [i, j]
+
+    Examples
+    --------
+    >>> cmp_features_matrix(ipa_to_features('lz'), ipa_to_features('nl'))
+    array([[0.87096774, 1.        ],
+           [0.87096774, 0.87096774]])
+
+    .. versionadded:: 0.6.0
 
     """
-    # Alternate implementation
-    diff_feats = 0
-    i = 0
-    while feat1 or feat2:
-        f1 = feat1 & 0b11
-        f2 = feat2 & 0b11
-        if (not (0b11 in {f1, f2} and (f1 in {0b01, 0b10} or
-            f2 in {0b01, 0b10}))) and (f1 != f2):
-            diff_feats += weights[i] if weights else 1
-
-        feat1 >>= 2
-        feat2 >>= 2
-        i += 1
-
-    return 1 - (diff_feats / magnitude)
+    if weights is None:
+        return _UNWEIGHTED.matrix(feats_a, feats_b)
+    return FeatureComparator(weights).matrix(feats_a, feats_b)
+
+
+class FeatureComparator:
+    """Compiled feature bundle comparator.
+
+    This compares feature bundles as :py:func:`cmp_features` does, but its
+    weights are prepared once, on initialization, and it can compare whole
+    arrays of feature bundles at once. The array methods sum the weights of
+    differing bits a byte of each bundle at a time, using a table of the
+    weighted bit counts of every byte value. (With non-integral weights, their
+    results may therefore differ from :py:func:`cmp_features` in the last
+    place.)
+
+    .. versionadded:: 0.6.0
     """
 
-    featxor = feat1 ^ feat2
-    diffbits = 0.0
-    i = 0
-    while featxor:
-        if featxor & 0b1:
-            diffbits += weights[i] if weights else 1
-        featxor >>= 1
-        if featxor & 0b1:
-            diffbits += weights[i] if weights else 1
-        featxor >>= 1
-        i += 1
-    return 1 - (0 if not diffbits else (diffbits / (2 * magnitude)))
+    def __init__(
+        self,
+        weights: Optional[
+            Union[Sequence[Union[int, float]], Dict[str, Union[int, float]]]
+        ] = None,
+    ) -> None:
+        """Initialize FeatureComparator instance.
+
+        Parameters
+        ----------
+        weights : None or list or tuple or dict
+            Feature weights, as in :py:func:`cmp_features`
+
+        Raises
+        ------
+        TypeError
+            weights must be a dict, list, or tuple.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if weights is not None:
+            if isinstance(weights, dict):
+                weights = [
+                    weights[feature] if feature in weights else 0
+                    for feature in sorted(
+                        _FEATURE_MASK, key=_FEATURE_MASK.get, reverse=True
+                    )
+                ]
+            elif isinstance(weights, (list, tuple)):
+                weights = list(weights) + [0] * (
+                    len(_FEATURE_MASK) - len(weights)
+                )
+            else:
+                raise TypeError('weights must be a dist, list, or tuple.')
+
+        self._weights = (
+            weights if weights else None
+        )  # type: Optional[List[Union[int, float]]]
+        self._magnitude = (
+            sum(weights) if weights else len(_FEATURE_MASK)
+        )  # type: Union[int, float]
+        self._tables = None  # type: Optional[np_ndarray]
+
+    def cmp(self, feat1: int, feat2: int) -> float:
+        """Compare features.
+
+        Parameters
+        ----------
+        feat1 : int
+            A feature bundle
+        feat2 : int
+            A feature bundle
+
+        Returns
+        -------
+        float
+            A comparison of the feature bundles
+
+        Examples
+        --------
+        >>> cmp = FeatureComparator()
+        >>> cmp.cmp(ipa_to_features('l')[0], ipa_to_features('n')[0])
+        0.8709677419354839
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if feat1 < 0 or feat2 < 0:
+            return 0.0
+        if feat1 == feat2:
+            return 1.0
+
+        featxor = feat1 ^ feat2
+        weights = self._weights
+        if weights is None:
+            diffbits = float(bin(featxor).count('1'))
+        else:
+            diffbits = 0.0
+            i = 0
+            while featxor:
+                if featxor & 0b1:
+                    diffbits += weights[i]
+                featxor >>= 1
+                if featxor & 0b1:
+                    diffbits += weights[i]
+                featxor >>= 1
+                i += 1
+        return 1 - (0 if not diffbits else (diffbits / (2 * self._magnitude)))
+
+    def _byte_tables(self) -> np_ndarray:
+        """Return the weighted bit count tables of each byte of a bundle.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sum of the weights of the set bits of each byte value (column)
+            at each byte position (row) of a feature bundle
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._tables is None:
+            weights = (
+                [1] * 32 if self._weights is None else list(self._weights)
+            )
+            weights += [0] * (32 - len(weights))
+            tables = np_zeros((8, 256), dtype=np_float)
+            for pos in range(8):
+                for value in range(256):
+                    for pair in range(4):
+                        bits = (value >> (2 * pair)) & 0b11
+                        tables[pos, value] += (
+                            bin(bits).count('1') * weights[4 * pos + pair]
+                        )
+            self._tables = tables
+        return self._tables
+
+    def cmp_many(
+        self,
+        feats1: Union[Sequence[int], np_ndarray],
+        feats2: Union[Sequence[int], np_ndarray],
+    ) -> np_ndarray:
+        """Compare arrays of feature bundles elementwise.
+
+        The arrays are broadcast against one another, as in NumPy arithmetic.
+
+        Parameters
+        ----------
+        feats1 : list of ints or numpy.ndarray
+            Feature bundles
+        feats2 : list of ints or numpy.ndarray
+            Feature bundles
+
+        Returns
+        -------
+        numpy.ndarray
+            The comparison of each pair of feature bundles
+
+        Examples
+        --------
+        >>> cmp = FeatureComparator()
+        >>> cmp.cmp_many(ipa_to_features('lin'), ipa_to_features('lik'))
+        array([1.        , 1.        , 0.72580645])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        feats1 = np_asarray(feats1, dtype=np_int64)
+        feats2 = np_asarray(feats2, dtype=np_int64)
+        unknown = (feats1 < 0) | (feats2 < 0)
+
+        featxor = feats1 ^ feats2
+        # Each (little-endian) byte of each XOR indexes its position's table.
+        diffbits = (
+            self._byte_tables()[
+                _BYTE_POSITIONS,
+                featxor.reshape(-1)
+                .astype('<u8')
+                .view(np_uint8)
+                .reshape(-1, 8),
+            ]
+            .sum(axis=1)
+            .reshape(featxor.shape)
+        )
+
+        sims = np_ones(diffbits.shape, dtype=np_float)
+        differ = diffbits != 0
+        sims[differ] = 1 - diffbits[differ] / (2 * self._magnitude)
+        sims[unknown] = 0.0
+        return sims
+
+    def matrix(
+        self,
+        feats_a: Union[Sequence[int], np_ndarray],
+        feats_b: Union[Sequence[int], np_ndarray],
+    ) -> np_ndarray:
+        """Compare each feature bundle of one sequence to each of another.
+
+        Parameters
+        ----------
+        feats_a : list of ints or numpy.ndarray
+            A sequence of feature bundles
+        feats_b : list of ints or numpy.ndarray
+            A sequence of feature bundles
+
+        Returns
+        -------
+        numpy.ndarray
+            The comparison of the ith bundle of feats_a to the jth bundle of
+            feats_b, at [i, j]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        feats_a = np_asarray(feats_a, dtype=np_int64).reshape(-1, 1)
+        feats_b = np_asarray(feats_b, dtype=np_int64).reshape(1, -1)
+        return self.cmp_many(feats_a, feats_b)
+
+
+_BYTE_POSITIONS = np_arange(8)
+_UNWEIGHTED = FeatureComparator()
 
 
 if __name__ == '__main__':
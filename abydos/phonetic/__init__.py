@@ -85,6 +85,9 @@ phonetic algorithms:
     - Oxford Name Compression Algorithm (ONCA) (:py:class:`.ONCA`)
     - MetaSoundex (:py:class:`.MetaSoundex`)
 
+For record linkage, a phonetic blocking index (:py:class:`.BlockingIndex`)
+groups records whose keys share phonetic codes, to generate candidate pairs.
+
 
 Each class has an ``encode`` method to return the phonetically encoded string.
 Classes for which ``encode`` returns a numeric value generally have an
@@ -104,6 +107,7 @@ encoding, as demonstrated below:
 from ._ainsworth import Ainsworth
 from ._alpha_sis import AlphaSIS
 from ._beider_morse import BeiderMorse
+from ._blocking_index import BlockingIndex
 from ._caverphone import Caverphone
 from ._daitch_mokotoff import DaitchMokotoff
 from ._davidson import Davidson
@@ -191,6 +195,7 @@ __all__ = [
     'Waahlin',
     'Norphone',
     'Ainsworth',
+    'BlockingIndex',
 ]
 
 
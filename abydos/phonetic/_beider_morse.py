@@ -23,8 +23,22 @@
 Beider-Morse Phonetic Matching (BMPM) algorithm
 """
 
-from re import search
-from typing import Any, Optional, Tuple, Union
+from collections import OrderedDict
+from re import compile as re_compile
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Match,
+    Optional,
+    OrderedDict as TOrderedDict,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 from unicodedata import normalize
 
 from ._beider_morse_data import (
@@ -121,6 +135,24 @@ _LCONTEXT_POS = 1
 _RCONTEXT_POS = 2
 _PHONETIC_POS = 3
 
+# A compiled rule is (pattern, pattern length, left context regex, right
+# context regex, phonetic), and rule sets are indexed by the first character
+# of their patterns.
+_CompiledRule = Tuple[
+    str, int, Optional[Pattern[str]], Optional[Pattern[str]], str
+]
+_RuleIndex = Dict[str, List[_CompiledRule]]
+_RuleSets = Tuple[_RuleIndex, _RuleIndex, _RuleIndex]
+
+# Compiled language rules are (all languages, (search, mask) per rule, rule
+# numbers indexed by possible first character, unindexable rule numbers).
+_LanguageIndex = Tuple[
+    int,
+    List[Tuple[Callable[[str], Optional[Match[str]]], int]],
+    Dict[str, List[int]],
+    List[int],
+]
+
 
 class BeiderMorse(_Phonetic):
     """Beider-Morse Phonetic Matching.
@@ -132,9 +164,103 @@ class BeiderMorse(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _compiled_rules = {}  # type: Dict[Tuple[str, str, int], _RuleSets]
+    _language_indexes = {}  # type: Dict[str, _LanguageIndex]
+    _language_cache = OrderedDict()  # type: TOrderedDict[Tuple[str, str], int]
+    _language_cache_size = 65536
+    # The language cache is shared by all instances, and so by all threads.
+    _language_lock = Lock()
+
+    def _first_chars(self, letters: str) -> Optional[Set[str]]:
+        """Return the characters with which a language rule can match.
+
+        Parameters
+        ----------
+        letters : str
+            The regular expression of a language rule
+
+        Returns
+        -------
+        set or None
+            The possible first characters of a match, or None if they can't
+            be determined by simple inspection of the expression
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        letters = letters[letters.startswith('^') :]
+        if not letters or '|' in letters or '\\' in letters:
+            return None
+        if letters[0] == '[':
+            end = letters.find(']')
+            chars = letters[1:end]
+            if end < 0 or chars[:1] == '^' or '-' in chars:
+                return None
+            rest = letters[end + 1 :]
+            first = set(chars)  # type: Set[str]
+        elif letters[0] in '.()?*+{$':
+            return None
+        else:
+            rest = letters[1:]
+            first = {letters[0]}
+        if rest[:1] in {'?', '*', '{'}:
+            return None
+        return first
+
+    def _language_index(self, name_mode: str) -> _LanguageIndex:
+        """Return the compiled language rules for a name mode.
+
+        Parameters
+        ----------
+        name_mode : str
+            The name mode of the algorithm: ``gen`` (default),
+            ``ash`` (Ashkenazi), or ``sep`` (Sephardic)
+
+        Returns
+        -------
+        tuple
+            The mask of all languages, each rule's compiled search method &
+            language mask, the rule numbers indexed by the first character
+            of their matches, and the rule numbers that can't be indexed
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if name_mode not in self._language_indexes:
+            all_langs = (
+                sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
+            )
+            searches = []
+            by_char = {}  # type: Dict[str, List[int]]
+            unindexed = []
+            for i, (letters, languages, accept) in enumerate(
+                BMDATA[name_mode]['language_rules']
+            ):
+                if not accept:
+                    languages = (~languages) % (all_langs + 1)
+                searches.append((re_compile(letters).search, languages))
+                first = self._first_chars(letters)
+                if first is None:
+                    unindexed.append(i)
+                else:
+                    for char in first:
+                        by_char.setdefault(char, []).append(i)
+            self._language_indexes[name_mode] = (
+                all_langs,
+                searches,
+                by_char,
+                unindexed,
+            )
+        return self._language_indexes[name_mode]
+
     def _language(self, name: str, name_mode: str) -> int:
         """Return the best guess language ID for the word and language choices.
 
+        Only the rules that can begin with one of the characters of the name
+        are tested, and results are memoised for repeated names.
+
         Parameters
         ----------
         name : str
@@ -152,32 +278,52 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Indexed rules by first character & memoised results
 
         """
+        start = perf_counter()
         name = name.strip().lower()
-        rules = BMDATA[name_mode]['language_rules']
-        all_langs = (
-            sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
-        )
-        choices_remaining = all_langs
-        for rule in rules:
-            letters, languages, accept = rule
-            if search(letters, name) is not None:
-                if accept:
+        key = (name_mode, name)
+        cache = self._language_cache
+
+        with self._language_lock:
+            choices_remaining = cache.get(key)
+            if choices_remaining is not None:
+                cache.move_to_end(key)
+        if choices_remaining is None:
+            all_langs, searches, by_char, unindexed = self._language_index(
+                name_mode
+            )
+            candidates = set(unindexed)
+            for char in set(name):
+                candidates.update(by_char.get(char, ()))
+
+            # The rules' masks are combined with &, so their order is
+            # immaterial.
+            choices_remaining = all_langs
+            for i in candidates:
+                rule_search, languages = searches[i]
+                if rule_search(name) is not None:
                     choices_remaining &= languages
-                else:
-                    choices_remaining &= (~languages) % (all_langs + 1)
-        if choices_remaining == L_NONE:
-            choices_remaining = L_ANY
+            if choices_remaining == L_NONE:
+                choices_remaining = L_ANY
+
+            with self._language_lock:
+                cache[key] = choices_remaining
+                if len(cache) > self._language_cache_size:
+                    cache.popitem(last=False)
+
+        self._phase_times['detection'] += perf_counter() - start
         return choices_remaining
 
     def _redo_language(
         self,
         term: str,
         name_mode: str,
-        rules: Tuple[Any, ...],
-        final_rules1: Tuple[Any, ...],
-        final_rules2: Tuple[Any, ...],
+        rules: _RuleIndex,
+        final_rules1: _RuleIndex,
+        final_rules2: _RuleIndex,
         concat: bool,
     ) -> str:
         """Reassess the language of the terms and call the phonetic encoder.
@@ -191,12 +337,12 @@ class BeiderMorse(_Phonetic):
         name_mode : str
             The name mode of the algorithm: ``gen`` (default),
             ``ash`` (Ashkenazi), or ``sep`` (Sephardic)
-        rules : tuple
-            The set of initial phonetic transform regexps
-        final_rules1 : tuple
-            The common set of final phonetic transform regexps
-        final_rules2 : tuple
-            The specific set of final phonetic transform regexps
+        rules : dict
+            The indexed set of initial phonetic transform rules
+        final_rules1 : dict
+            The indexed common set of final phonetic transform rules
+        final_rules2 : dict
+            The indexed specific set of final phonetic transform rules
         concat : bool
             A flag to indicate concatenation
 
@@ -226,9 +372,9 @@ class BeiderMorse(_Phonetic):
         self,
         term: str,
         name_mode: str,
-        rules: Tuple[Any, ...],
-        final_rules1: Tuple[Any, ...],
-        final_rules2: Tuple[Any, ...],
+        rules: _RuleIndex,
+        final_rules1: _RuleIndex,
+        final_rules2: _RuleIndex,
         language_arg: int = 0,
         concat: bool = False,
     ) -> str:
@@ -241,12 +387,12 @@ class BeiderMorse(_Phonetic):
         name_mode : str
             The name mode of the algorithm: ``gen`` (default),
             ``ash`` (Ashkenazi), or ``sep`` (Sephardic)
-        rules : tuple
-            The set of initial phonetic transform regexps
-        final_rules1 : tuple
-            The common set of final phonetic transform regexps
-        final_rules2 : tuple
-            The specific set of final phonetic transform regexps
+        rules : dict
+            The indexed set of initial phonetic transform rules
+        final_rules1 : dict
+            The indexed common set of final phonetic transform rules
+        final_rules2 : dict
+            The indexed specific set of final phonetic transform rules
         language_arg : int
             The language of the term
         concat : bool
@@ -261,6 +407,8 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Takes compiled rule sets
 
         """
         term = term.replace('-', ' ').strip()
@@ -343,6 +491,7 @@ class BeiderMorse(_Phonetic):
         term_length = len(term)
 
         # apply language rules to map to phonetic alphabet
+        start = perf_counter()
         phonetic = ''
         skip = 0
         for i in range(term_length):
@@ -350,35 +499,27 @@ class BeiderMorse(_Phonetic):
                 skip -= 1
                 continue
             found = False
-            for rule in rules:
-                pattern = rule[_PATTERN_POS]
-                pattern_length = len(pattern)
-                lcontext = rule[_LCONTEXT_POS]
-                rcontext = rule[_RCONTEXT_POS]
-
+            for pattern, pattern_length, left, right, target in rules.get(
+                term[i], ()
+            ):
                 # check to see if next sequence in input matches the string in
                 # the rule
-                if (pattern_length > term_length - i) or (
-                    term[i : i + pattern_length] != pattern
-                ):  # no match
+                if not term.startswith(pattern, i):  # no match
                     continue
 
-                right = '^' + rcontext
-                left = lcontext + '$'
-
                 # check that right context is satisfied
-                if rcontext != '':
-                    if not search(right, term[i + pattern_length :]):
+                if right is not None:
+                    if not right.match(term, i + pattern_length):
                         continue
 
                 # check that left context is satisfied
-                if lcontext != '':
-                    if not search(left, term[:i]):
+                if left is not None:
+                    if not left.search(term, 0, i):
                         continue
 
                 # check for incompatible attributes
                 candidate = self._apply_rule_if_compat(
-                    phonetic, rule[_PHONETIC_POS], language_arg
+                    phonetic, target, language_arg
                 )
                 # The below condition shouldn't ever be false
                 if candidate is not None:  # pragma: no branch
@@ -391,9 +532,11 @@ class BeiderMorse(_Phonetic):
             ):  # character in name that is not in table -- e.g., space
                 pattern_length = 1
             skip = pattern_length - 1
+        self._phase_times['main_rules'] += perf_counter() - start
 
         # apply final rules on phonetic-alphabet,
         # doing a substitution of certain characters
+        start = perf_counter()
         phonetic = self._apply_final_rules(
             phonetic, final_rules1, language_arg, False
         )  # apply common rules
@@ -402,13 +545,14 @@ class BeiderMorse(_Phonetic):
         phonetic = self._apply_final_rules(
             phonetic, final_rules2, language_arg, True
         )  # apply lang specific rules
+        self._phase_times['final_rules'] += perf_counter() - start
 
         return phonetic
 
     def _apply_final_rules(
         self,
         phonetic: str,
-        final_rules: Tuple[Any, ...],
+        final_rules: _RuleIndex,
         language_arg: int,
         strip: bool,
     ) -> str:
@@ -418,8 +562,8 @@ class BeiderMorse(_Phonetic):
         ----------
         phonetic : str
             The term to which to apply the final rules
-        final_rules : tuple
-            The set of final phonetic transform regexps
+        final_rules : dict
+            The indexed set of final phonetic transform rules
         language_arg : int
             An integer representing the target language of the phonetic
             encoding
@@ -435,6 +579,8 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Takes a compiled rule set
 
         """
         # optimization to save time
@@ -465,35 +611,31 @@ class BeiderMorse(_Phonetic):
                         i += 1
                     continue
 
-                for rule in final_rules:
-                    pattern = rule[_PATTERN_POS]
-                    pattern_length = len(pattern)
-                    lcontext = rule[_LCONTEXT_POS]
-                    rcontext = rule[_RCONTEXT_POS]
-
-                    right = '^' + rcontext
-                    left = lcontext + '$'
-
+                for (
+                    pattern,
+                    pattern_length,
+                    left,
+                    right,
+                    target,
+                ) in final_rules.get(phoneticx[i : i + 1], ()):
                     # check to see if next sequence in phonetic matches the
                     # string in the rule
-                    if (pattern_length > len(phoneticx) - i) or phoneticx[
-                        i : i + pattern_length
-                    ] != pattern:
+                    if not phoneticx.startswith(pattern, i):
                         continue
 
                     # check that right context is satisfied
-                    if rcontext != '':
-                        if not search(right, phoneticx[i + pattern_length :]):
+                    if right is not None:
+                        if not right.match(phoneticx, i + pattern_length):
                             continue
 
                     # check that left context is satisfied
-                    if lcontext != '':
-                        if not search(left, phoneticx[:i]):
+                    if left is not None:
+                        if not left.search(phoneticx, 0, i):
                             continue
 
                     # check for incompatible attributes
                     candidate = self._apply_rule_if_compat(
-                        phonetic2, rule[_PHONETIC_POS], language_arg
+                        phonetic2, target, language_arg
                     )
                     # The below condition shouldn't ever be false
                     if candidate is not None:  # pragma: no branch
@@ -847,6 +989,77 @@ class BeiderMorse(_Phonetic):
             return L_ANY
         return code
 
+    def _compile_rules(self, rules: Tuple[Tuple[str, ...], ...]) -> _RuleIndex:
+        """Compile a set of rules and index them by their first character.
+
+        Each rule's left context is compiled to match at the end of the text
+        preceding the pattern and its right context to match at the position
+        following it, so neither needs the term to be sliced. (No context has
+        a top-level alternation, so anchoring by position is equivalent to
+        prefixing ``^`` or suffixing ``$``.)
+
+        Parameters
+        ----------
+        rules : tuple
+            A set of phonetic transform rules
+
+        Returns
+        -------
+        dict
+            The rules, in their original order, indexed by the first
+            character of their patterns
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        index = {}  # type: _RuleIndex
+        for rule in rules:
+            pattern = rule[_PATTERN_POS]
+            lcontext = rule[_LCONTEXT_POS]
+            rcontext = rule[_RCONTEXT_POS]
+            index.setdefault(pattern[:1], []).append(
+                (
+                    pattern,
+                    len(pattern),
+                    re_compile(lcontext + '$') if lcontext else None,
+                    re_compile(rcontext) if rcontext else None,
+                    rule[_PHONETIC_POS],
+                )
+            )
+        return index
+
+    def _rule_sets(self, language_arg: int) -> _RuleSets:
+        """Return the compiled rule sets for a language.
+
+        Compiled rule sets are cached per combination of name mode, match
+        mode, and language, and shared among all instances.
+
+        Parameters
+        ----------
+        language_arg : int
+            The language index (a single language or L_ANY)
+
+        Returns
+        -------
+        tuple
+            The initial rules, the common final rules, and the
+            language-specific final rules
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = (self._name_mode, self._match_mode, language_arg)
+        if key not in self._compiled_rules:
+            bmdata = BMDATA[self._name_mode]
+            self._compiled_rules[key] = (
+                self._compile_rules(bmdata['rules'][language_arg]),
+                self._compile_rules(bmdata[self._match_mode]['common']),
+                self._compile_rules(bmdata[self._match_mode][language_arg]),
+            )
+        return self._compiled_rules[key]
+
     def __init__(
         self,
         language_arg: Union[str, int] = 0,
@@ -931,6 +1144,44 @@ class BeiderMorse(_Phonetic):
         self._concat = concat
         self._filter_langs = filter_langs
         self._lang_choices = lang_choices
+        self._phase_times = dict.fromkeys(
+            ('detection', 'main_rules', 'final_rules', 'numbers'), 0.0
+        )
+
+    def get_phase_times(self) -> Dict[str, float]:
+        """Return the time spent in each phase of encoding.
+
+        Returns
+        -------
+        dict
+            The cumulative seconds spent, since initialization or the last
+            call to :py:meth:`.reset_phase_times`, in language detection
+            (``detection``), the main phonetic rules (``main_rules``), the
+            final rules (``final_rules``), and the expansion of alternates
+            (``numbers``)
+
+        Examples
+        --------
+        >>> pe = BeiderMorse()
+        >>> pe.encode('Niall')
+        'nial,niol'
+        >>> sorted(pe.get_phase_times())
+        ['detection', 'final_rules', 'main_rules', 'numbers']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return dict(self._phase_times)
+
+    def reset_phase_times(self) -> None:
+        """Reset the phase times to zero.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for phase in self._phase_times:
+            self._phase_times[phase] = 0.0
 
     def encode(self, word: str) -> str:
         """Return the Beider-Morse Phonetic Matching encoding(s) of a term.
@@ -1002,9 +1253,7 @@ class BeiderMorse(_Phonetic):
             language_arg, self._name_mode
         )
 
-        rules = BMDATA[self._name_mode]['rules'][language_arg2]
-        final_rules1 = BMDATA[self._name_mode][self._match_mode]['common']
-        final_rules2 = BMDATA[self._name_mode][self._match_mode][language_arg2]
+        rules, final_rules1, final_rules2 = self._rule_sets(language_arg2)
 
         result = self._phonetic(
             word,
@@ -1015,7 +1264,9 @@ class BeiderMorse(_Phonetic):
             language_arg,
             self._concat,
         )
+        start = perf_counter()
         result = self._phonetic_numbers(result).replace(' ', ',')
+        self._phase_times['numbers'] += perf_counter() - start
 
         return result
 
@@ -0,0 +1,368 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic._blocking_index.
+
+Phonetic blocking index for record linkage
+"""
+
+from collections import defaultdict
+from itertools import combinations
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._phonetic import _Phonetic
+
+__all__ = ['BlockingIndex']
+
+
+class BlockingIndex:
+    """Phonetic blocking index.
+
+    A blocking index groups records into blocks of records whose keys share a
+    phonetic code, so that record linkage need only compare records within a
+    block, rather than all pairs of records. Each supplied phonetic algorithm
+    forms a blocking pass, and the candidates of all passes are unioned.
+    Algorithms that return multiple, comma-separated codes (e.g.
+    :py:class:`.DoubleMetaphone` or :py:class:`.BeiderMorse`) place a record in
+    the block of each of its codes.
+
+    >>> from abydos.phonetic import DoubleMetaphone, Soundex
+    >>> idx = BlockingIndex([Soundex(), DoubleMetaphone()])
+    >>> idx.update({1: 'Smith', 2: 'Schmidt', 3: 'Niall', 4: 'Neil',
+    ... 5: 'Nigel'})
+    >>> sorted(idx.candidates('Smyth'))
+    [1, 2]
+    >>> sorted(idx.candidate_pairs())
+    [(1, 2), (3, 4)]
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        passes: Union[
+            Type[_Phonetic],
+            _Phonetic,
+            Sequence[Union[Type[_Phonetic], _Phonetic]],
+        ],
+        records: Optional[
+            Union[Mapping[Hashable, str], Iterable[Tuple[Hashable, str]]]
+        ] = None,
+        encode_alpha: bool = False,
+    ) -> None:
+        """Initialize BlockingIndex instance.
+
+        Parameters
+        ----------
+        passes : _Phonetic or type or list
+            An instance of a subclass of _Phonetic, or a list of such
+            instances, each of which defines a blocking pass
+        records : dict or iterable or None
+            A dict of record ids to keys, or an iterable of (record id, key)
+            pairs, to index
+        encode_alpha : bool
+            Set to true to use the encode_alpha method of phonetic algoritms
+
+        Raises
+        ------
+        TypeError
+            Each pass must be a phonetic algorithm
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(passes, Sequence):
+            passes = [passes]
+
+        self._encoders = []  # type: List[_Phonetic]
+        for encoder in passes:
+            if isinstance(encoder, type) and issubclass(encoder, _Phonetic):
+                encoder = encoder()
+            if not isinstance(encoder, _Phonetic):
+                raise TypeError(
+                    '{} has unknown type {}'.format(encoder, type(encoder))
+                )
+            self._encoders.append(encoder)
+        self._encode_alpha = encode_alpha
+
+        # Records are numbered in the order added, and blocks hold record
+        # numbers in ascending order. An id added more than once keeps the
+        # number of its first record in _first.
+        self._ids = []  # type: List[Hashable]
+        self._first = {}  # type: Dict[Hashable, int]
+        self._blocks = [
+            defaultdict(list) for _ in self._encoders
+        ]  # type: List[Dict[str, List[int]]]
+
+        if records is not None:
+            self.update(records)
+
+    def _codes(self, encoded: str) -> Set[str]:
+        """Return the distinct, non-empty codes of an encoding.
+
+        Parameters
+        ----------
+        encoded : str
+            A (possibly comma-separated) phonetic encoding
+
+        Returns
+        -------
+        set
+            The codes of the encoding
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {code for code in encoded.split(',') if code}
+
+    def add(self, record_id: Hashable, key: str) -> None:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        record_id : hashable
+            The id of the record
+        key : str
+            The key of the record, e.g. a surname
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.update([(record_id, key)])
+
+    def update(
+        self,
+        records: Union[Mapping[Hashable, str], Iterable[Tuple[Hashable, str]]],
+    ) -> None:
+        """Add records to the index.
+
+        Parameters
+        ----------
+        records : dict or iterable
+            A dict of record ids to keys, or an iterable of (record id, key)
+            pairs
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(records, Mapping):
+            records = records.items()
+        start = len(self._ids)
+        keys = []
+        for record_id, key in records:
+            self._first.setdefault(record_id, len(self._ids))
+            self._ids.append(record_id)
+            keys.append(key)
+
+        for encoder, blocks in zip(self._encoders, self._blocks):
+            encoded = encoder.encode_many(keys, alpha=self._encode_alpha)
+            for num, codes in enumerate(encoded, start):
+                for code in self._codes(codes):
+                    blocks[code].append(num)
+
+    def _query_codes(self, query: str) -> List[Set[str]]:
+        """Return the codes of a query in each pass.
+
+        Parameters
+        ----------
+        query : str
+            The key to encode
+
+        Returns
+        -------
+        list
+            The set of codes of the query for each pass
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._encode_alpha:
+            return [
+                self._codes(encoder.encode_alpha(query))
+                for encoder in self._encoders
+            ]
+        return [
+            self._codes(encoder.encode(query)) for encoder in self._encoders
+        ]
+
+    def candidates(self, query: str) -> Set[Hashable]:
+        """Return the ids of the records sharing a block with a query.
+
+        Parameters
+        ----------
+        query : str
+            The key to search for
+
+        Returns
+        -------
+        set
+            The ids of the candidate records
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> idx = BlockingIndex(Soundex(), [('a', 'Smith'), ('b', 'Jones')])
+        >>> idx.candidates('Schmidt')
+        {'a'}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        nums = set()  # type: Set[int]
+        for blocks, codes in zip(self._blocks, self._query_codes(query)):
+            for code in codes:
+                if code in blocks:
+                    nums.update(blocks[code])
+        return {self._ids[num] for num in nums}
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """Return the pairs of ids of records sharing a block.
+
+        Each pair is returned once, with the ids in the order in which they
+        were first added.
+
+        Returns
+        -------
+        set
+            The candidate pairs of record ids
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ids = self._ids
+        first = self._first
+        pairs = set()  # type: Set[Tuple[int, int]]
+        for blocks in self._blocks:
+            for block in blocks.values():
+                # Map the records of each id to its first record, so that an
+                # id added more than once is paired in a single order.
+                nums = sorted({first[ids[num]] for num in block})
+                pairs.update(combinations(nums, 2))
+        return {(ids[num1], ids[num2]) for num1, num2 in pairs}
+
+    def block_sizes(self) -> Dict[Tuple[int, str], int]:
+        """Return the size of each block.
+
+        Returns
+        -------
+        dict
+            A dict of (pass number, code) to the number of records in that
+            block
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            (i, code): len(block)
+            for i, blocks in enumerate(self._blocks)
+            for code, block in blocks.items()
+        }
+
+    def largest_blocks(self, n: int = 10) -> List[Tuple[int, str, int]]:
+        """Return the largest blocks.
+
+        Parameters
+        ----------
+        n : int
+            The number of blocks to return
+
+        Returns
+        -------
+        list
+            (pass number, code, size) for the n largest blocks, largest first
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> idx = BlockingIndex(Soundex(), enumerate(['Smith', 'Smyth',
+        ... 'Schmidt', 'Jones']))
+        >>> idx.largest_blocks(1)
+        [(0, 'S530', 3)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        sizes = sorted(
+            self.block_sizes().items(), key=lambda x: x[1], reverse=True
+        )
+        return [(i, code, size) for (i, code), size in sizes[:n]]
+
+    def block_stats(self) -> Dict[str, float]:
+        """Return statistics on the blocks.
+
+        Returns
+        -------
+        dict
+            The number of distinct record ids (``records``) & of blocks
+            (``blocks``), the largest (``max_size``) & mean (``mean_size``)
+            block sizes, the number of distinct candidate pairs
+            (``comparisons``), and the reduction ratio of those comparisons
+            relative to comparing all pairs of records (``reduction_ratio``)
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> idx = BlockingIndex(Soundex(), enumerate(['Smith', 'Smyth',
+        ... 'Schmidt', 'Jones']))
+        >>> idx.block_stats()
+        {'records': 4, 'blocks': 2, 'max_size': 3, 'mean_size': 2.0,
+        'comparisons': 3, 'reduction_ratio': 0.5}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        sizes = list(self.block_sizes().values())
+        records = len(self._first)
+        comparisons = len(self.candidate_pairs())
+        all_pairs = records * (records - 1) // 2
+        return {
+            'records': records,
+            'blocks': len(sizes),
+            'max_size': max(sizes, default=0),
+            'mean_size': sum(sizes) / len(sizes) if sizes else 0.0,
+            'comparisons': comparisons,
+            'reduction_ratio': (
+                1.0 - comparisons / all_pairs if all_pairs else 0.0
+            ),
+        }
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
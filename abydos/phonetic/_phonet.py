@@ -20,13 +20,20 @@ phonet algorithm (a.k.a. Hannoveraner Phonetik), intended chiefly for German
 """
 
 from collections import Counter
-from typing import Counter as TCounter, Optional, Tuple, Union, cast
+from typing import Counter as TCounter, Dict, Optional, Tuple, Union, cast
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
 
 __all__ = ['Phonet']
 
+_PhonetTables = Tuple[
+    TCounter[str],
+    TCounter[str],
+    TCounter[Tuple[int, int]],
+    TCounter[Tuple[int, int]],
+]
+
 
 class Phonet(_Phonetic):
     """Phonet code.
@@ -1063,6 +1070,8 @@ class Phonet(_Phonetic):
         )
     )
 
+    _compiled_rules = {}  # type: Dict[str, _PhonetTables]
+
     def __init__(self, mode: int = 1, lang: str = 'de') -> None:
         """Initialize AlphaSIS instance.
 
@@ -1075,11 +1084,30 @@ class Phonet(_Phonetic):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Rule tables are compiled once per language and shared
 
         """
         self._mode = mode
         self._lang = lang
 
+        if lang == 'none':
+            self._rules = self._rules_no_lang
+        else:
+            lang = 'de'
+            self._rules = self._rules_german
+
+        # The rule tables depend only on the rule set and are never modified
+        # during encoding, so they are built once per process.
+        if lang not in self._compiled_rules:
+            self._compiled_rules[lang] = self._compile_rules(self._rules)
+        (
+            self._alpha_pos,
+            self._phonet_hash,
+            self._phonet_hash_1,
+            self._phonet_hash_2,
+        ) = self._compiled_rules[lang]
+
     def encode(self, word: str) -> str:
         """Return the phonet code for a word.
 
@@ -1131,319 +1159,309 @@ class Phonet(_Phonetic):
             Encapsulated in class
 
         """
-        phonet_hash = Counter()  # type: TCounter[str]
-        alpha_pos = Counter()  # type: TCounter[str]
+        word = unicode_normalize('NFKC', word)
+        return self._phonet(word)
 
-        phonet_hash_1 = Counter()  # type: TCounter[Tuple[int, int]]
-        phonet_hash_2 = Counter()  # type: TCounter[Tuple[int, int]]
+    def _compile_rules(
+        self, _phonet_rules: Tuple[Optional[str], ...]
+    ) -> _PhonetTables:
+        """Build the hash tables used to look up phonet rules.
 
-        def _initialize_phonet(lang: str) -> None:
-            """Initialize phonet variables.
+        Parameters
+        ----------
+        _phonet_rules : tuple
+            The rule set to index
 
-            Parameters
-            ----------
-            lang : str
-                Language to use for rules
+        Returns
+        -------
+        tuple
+            The alpha_pos, phonet_hash, phonet_hash_1, & phonet_hash_2 tables
 
-            .. versionadded:: 0.1.0
+        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.6.0
+            Made a method that returns its tables, rather than a closure
 
-            """
-            if lang == 'none':
-                _phonet_rules = self._rules_no_lang
-            else:
-                _phonet_rules = self._rules_german
-
-            phonet_hash[''] = -1
-
-            # German and international umlauts
-            for ch in {
-                'À',
-                'Á',
-                'Â',
-                'Ã',
-                'Ä',
-                'Å',
-                'Æ',
-                'Ç',
-                'È',
-                'É',
-                'Ê',
-                'Ë',
-                'Ì',
-                'Í',
-                'Î',
-                'Ï',
-                'Ð',
-                'Ñ',
-                'Ò',
-                'Ó',
-                'Ô',
-                'Õ',
-                'Ö',
-                'Ø',
-                'Ù',
-                'Ú',
-                'Û',
-                'Ü',
-                'Ý',
-                'Þ',
-                'ß',
-                'Œ',
-                'Š',
-                'Ÿ',
-            }:
-                alpha_pos[ch] = 1
-                phonet_hash[ch] = -1
-
-            # "normal" letters ('A'-'Z')
-            for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
-                alpha_pos[ch] = i + 2
-                phonet_hash[ch] = -1
-
-            for i in range(26):
-                for j in range(28):
-                    phonet_hash_1[i, j] = -1
-                    phonet_hash_2[i, j] = -1
-
-            # for each phonetc rule
-            for i in range(len(_phonet_rules)):
-                rule = _phonet_rules[i]
-
-                if rule and i % 3 == 0:
-                    # calculate first hash value
-                    ch = cast(str, _phonet_rules[i])[0]
-
-                    if phonet_hash[ch] < 0 and (
-                        cast(str, _phonet_rules[i + 1])
-                        or cast(str, _phonet_rules[i + 2])
-                    ):
-                        phonet_hash[ch] = i
+        """
+        phonet_hash = Counter()  # type: TCounter[str]
+        alpha_pos = Counter()  # type: TCounter[str]
 
-                    # calculate second hash values
-                    if ch and alpha_pos[ch] >= 2:
-                        k = alpha_pos[ch]
+        phonet_hash_1 = Counter()  # type: TCounter[Tuple[int, int]]
+        phonet_hash_2 = Counter()  # type: TCounter[Tuple[int, int]]
 
-                        j = k - 2
+        phonet_hash[''] = -1
+
+        # German and international umlauts
+        for ch in {
+            'À',
+            'Á',
+            'Â',
+            'Ã',
+            'Ä',
+            'Å',
+            'Æ',
+            'Ç',
+            'È',
+            'É',
+            'Ê',
+            'Ë',
+            'Ì',
+            'Í',
+            'Î',
+            'Ï',
+            'Ð',
+            'Ñ',
+            'Ò',
+            'Ó',
+            'Ô',
+            'Õ',
+            'Ö',
+            'Ø',
+            'Ù',
+            'Ú',
+            'Û',
+            'Ü',
+            'Ý',
+            'Þ',
+            'ß',
+            'Œ',
+            'Š',
+            'Ÿ',
+        }:
+            alpha_pos[ch] = 1
+            phonet_hash[ch] = -1
+
+        # "normal" letters ('A'-'Z')
+        for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+            alpha_pos[ch] = i + 2
+            phonet_hash[ch] = -1
+
+        for i in range(26):
+            for j in range(28):
+                phonet_hash_1[i, j] = -1
+                phonet_hash_2[i, j] = -1
+
+        # for each phonetc rule
+        for i in range(len(_phonet_rules)):
+            rule = _phonet_rules[i]
+
+            if rule and i % 3 == 0:
+                # calculate first hash value
+                ch = cast(str, _phonet_rules[i])[0]
+
+                if phonet_hash[ch] < 0 and (
+                    cast(str, _phonet_rules[i + 1])
+                    or cast(str, _phonet_rules[i + 2])
+                ):
+                    phonet_hash[ch] = i
+
+                # calculate second hash values
+                if ch and alpha_pos[ch] >= 2:
+                    k = alpha_pos[ch]
+
+                    j = k - 2
+                    rule = rule[1:]
+
+                    if not rule:
+                        rule = ' '
+                    elif rule[0] == '(':
                         rule = rule[1:]
+                    else:
+                        rule = rule[0]
 
-                        if not rule:
-                            rule = ' '
-                        elif rule[0] == '(':
-                            rule = rule[1:]
-                        else:
-                            rule = rule[0]
-
-                        while rule and (rule[0] != ')'):
-                            k = alpha_pos[rule[0]]
+                    while rule and (rule[0] != ')'):
+                        k = alpha_pos[rule[0]]
 
-                            if k > 0:
-                                # add hash value for this letter
-                                if phonet_hash_1[j, k] < 0:
-                                    phonet_hash_1[j, k] = i
-                                    phonet_hash_2[j, k] = i
+                        if k > 0:
+                            # add hash value for this letter
+                            if phonet_hash_1[j, k] < 0:
+                                phonet_hash_1[j, k] = i
+                                phonet_hash_2[j, k] = i
 
-                                if phonet_hash_2[j, k] >= (i - 30):
-                                    phonet_hash_2[j, k] = i
-                                else:
-                                    k = -1
+                            if phonet_hash_2[j, k] >= (i - 30):
+                                phonet_hash_2[j, k] = i
+                            else:
+                                k = -1
 
-                            if k <= 0:
-                                # add hash value for all letters
-                                if phonet_hash_1[j, 0] < 0:
-                                    phonet_hash_1[j, 0] = i
+                        if k <= 0:
+                            # add hash value for all letters
+                            if phonet_hash_1[j, 0] < 0:
+                                phonet_hash_1[j, 0] = i
 
-                                phonet_hash_2[j, 0] = i
+                            phonet_hash_2[j, 0] = i
 
-                            rule = rule[1:]
-
-        def _phonet(term: str, mode: int, lang: str) -> str:
-            """Return the phonet coded form of a term.
+                        rule = rule[1:]
 
-            Parameters
-            ----------
-            term : str
-                Term to transform
-            mode : int
-                The ponet variant to employ (1 or 2)
-            lang : str
-                ``de`` (default) for German, ``none`` for no language
+        return alpha_pos, phonet_hash, phonet_hash_1, phonet_hash_2
 
-            Returns
-            -------
-            str
-                The phonet value
+    def _phonet(self, term: str) -> str:
+        """Return the phonet coded form of a term.
 
-            .. versionadded:: 0.1.0
+        Parameters
+        ----------
+        term : str
+            Term to transform
 
-            """
-            if lang == 'none':
-                _phonet_rules = self._rules_no_lang
-            else:
-                _phonet_rules = self._rules_german
+        Returns
+        -------
+        str
+            The phonet value
 
-            char0 = ''
-            dest = term
+        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.6.0
+            Made a method using the instance's compiled rule tables
 
-            if not term:
-                return ''
+        """
+        _phonet_rules = self._rules
+        mode = self._mode
+        alpha_pos = self._alpha_pos
+        phonet_hash = self._phonet_hash
+        phonet_hash_1 = self._phonet_hash_1
+        phonet_hash_2 = self._phonet_hash_2
 
-            term_length = len(term)
+        char0 = ''
+        dest = term
 
-            # convert input string to upper-case
-            src = term.translate(self._upper_trans)
+        if not term:
+            return ''
 
-            # check "src"
-            i = 0
-            j = 0
-            zeta = 0
+        term_length = len(term)
 
-            while i < len(src):
-                char = src[i]
+        # convert input string to upper-case
+        src = term.translate(self._upper_trans)
 
-                pos = alpha_pos[char]
+        # check "src"
+        i = 0
+        j = 0
+        zeta = 0
 
-                if pos >= 2:
-                    xpos = pos - 2
+        while i < len(src):
+            char = src[i]
 
-                    if i + 1 == len(src):
-                        pos = alpha_pos['']
-                    else:
-                        pos = alpha_pos[src[i + 1]]
+            pos = alpha_pos[char]
 
-                    start1 = phonet_hash_1[xpos, pos]
-                    start2 = phonet_hash_1[xpos, 0]
-                    end1 = phonet_hash_2[xpos, pos]
-                    end2 = phonet_hash_2[xpos, 0]
+            if pos >= 2:
+                xpos = pos - 2
 
-                    # preserve rule priorities
-                    if (start2 >= 0) and ((start1 < 0) or (start2 < start1)):
-                        pos = start1
-                        start1 = start2
-                        start2 = pos
-                        pos = end1
+                if i + 1 == len(src):
+                    pos = alpha_pos['']
+                else:
+                    pos = alpha_pos[src[i + 1]]
+
+                start1 = phonet_hash_1[xpos, pos]
+                start2 = phonet_hash_1[xpos, 0]
+                end1 = phonet_hash_2[xpos, pos]
+                end2 = phonet_hash_2[xpos, 0]
+
+                # preserve rule priorities
+                if (start2 >= 0) and ((start1 < 0) or (start2 < start1)):
+                    pos = start1
+                    start1 = start2
+                    start2 = pos
+                    pos = end1
+                    end1 = end2
+                    end2 = pos
+
+                if (end1 >= start2) and (start2 >= 0):
+                    if end2 > end1:
                         end1 = end2
-                        end2 = pos
 
-                    if (end1 >= start2) and (start2 >= 0):
-                        if end2 > end1:
-                            end1 = end2
-
-                        start2 = -1
-                        end2 = -1
-                else:
-                    pos = phonet_hash[char]
-                    start1 = pos
-                    end1 = 10000
                     start2 = -1
                     end2 = -1
+            else:
+                pos = phonet_hash[char]
+                start1 = pos
+                end1 = 10000
+                start2 = -1
+                end2 = -1
+
+            pos = start1
+            zeta0 = 0
+
+            if pos >= 0:
+                # check rules for this char
+                while (_phonet_rules[pos] is None) or (
+                    cast(str, _phonet_rules[pos])[0] == char
+                ):
+                    if pos > end1:
+                        if start2 > 0:
+                            pos = start2
+                            start1 = start2
+                            start2 = -1
+                            end1 = end2
+                            end2 = -1
+                            continue
 
-                pos = start1
-                zeta0 = 0
+                        break
 
-                if pos >= 0:
-                    # check rules for this char
-                    while (_phonet_rules[pos] is None) or (
-                        cast(str, _phonet_rules[pos])[0] == char
+                    if (_phonet_rules[pos] is None) or (
+                        _phonet_rules[pos + mode] is None
                     ):
-                        if pos > end1:
-                            if start2 > 0:
-                                pos = start2
-                                start1 = start2
-                                start2 = -1
-                                end1 = end2
-                                end2 = -1
-                                continue
-
-                            break
-
-                        if (_phonet_rules[pos] is None) or (
-                            _phonet_rules[pos + mode] is None
-                        ):
-                            # no conversion rule available
-                            pos += 3
-                            continue
+                        # no conversion rule available
+                        pos += 3
+                        continue
+
+                    # check whole string
+                    matches = 1  # number of matching letters
+                    priority = 5  # default priority
+                    rule = cast(str, _phonet_rules[pos])[1:]
+
+                    while (
+                        rule
+                        and (len(src) > (i + matches))
+                        and (src[i + matches] == rule[0])
+                        and not rule[0].isdigit()
+                        and (rule not in '(-<^$')
+                    ):
+                        matches += 1
+                        rule = rule[1:]
 
-                        # check whole string
-                        matches = 1  # number of matching letters
-                        priority = 5  # default priority
-                        rule = cast(str, _phonet_rules[pos])[1:]
-
-                        while (
-                            rule
-                            and (len(src) > (i + matches))
-                            and (src[i + matches] == rule[0])
-                            and not rule[0].isdigit()
-                            and (rule not in '(-<^$')
+                    if rule and (rule[0] == '('):
+                        # check an array of letters
+                        if (
+                            (len(src) > (i + matches))
+                            and src[i + matches].isalpha()
+                            and (src[i + matches] in rule[1:])
                         ):
                             matches += 1
-                            rule = rule[1:]
-
-                        if rule and (rule[0] == '('):
-                            # check an array of letters
-                            if (
-                                (len(src) > (i + matches))
-                                and src[i + matches].isalpha()
-                                and (src[i + matches] in rule[1:])
-                            ):
-                                matches += 1
 
-                                while rule and rule[0] != ')':
-                                    rule = rule[1:]
-
-                                # if rule[0] == ')':
+                            while rule and rule[0] != ')':
                                 rule = rule[1:]
 
-                        if rule:
-                            priority0 = ord(rule[0])
-                        else:
-                            priority0 = 0
+                            # if rule[0] == ')':
+                            rule = rule[1:]
 
-                        matches0 = matches
+                    if rule:
+                        priority0 = ord(rule[0])
+                    else:
+                        priority0 = 0
 
-                        while rule and rule[0] == '-' and matches > 1:
-                            matches -= 1
-                            rule = rule[1:]
+                    matches0 = matches
 
-                        if rule and rule[0] == '<':
-                            rule = rule[1:]
+                    while rule and rule[0] == '-' and matches > 1:
+                        matches -= 1
+                        rule = rule[1:]
 
-                        if rule and rule[0].isdigit():
-                            # read priority
-                            priority = int(rule[0])
-                            rule = rule[1:]
+                    if rule and rule[0] == '<':
+                        rule = rule[1:]
 
-                        if rule and rule[0:2] == '^^':
-                            rule = rule[1:]
+                    if rule and rule[0].isdigit():
+                        # read priority
+                        priority = int(rule[0])
+                        rule = rule[1:]
 
-                        if (
-                            not rule
-                            or (
-                                (rule[0] == '^')
-                                and ((i == 0) or not src[i - 1].isalpha())
-                                and (
-                                    (rule[1:2] != '$')
-                                    or (
-                                        not (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ].isalpha()
-                                        )
-                                        and (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ]
-                                            != '.'
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (rule[0] == '$')
-                                and (i > 0)
-                                and src[i - 1].isalpha()
-                                and (
-                                    (
-                                        not src[
+                    if rule and rule[0:2] == '^^':
+                        rule = rule[1:]
+
+                    if (
+                        not rule
+                        or (
+                            (rule[0] == '^')
+                            and ((i == 0) or not src[i - 1].isalpha())
+                            and (
+                                (rule[1:2] != '$')
+                                or (
+                                    not (
+                                        src[
                                             i + matches0 : i + matches0 + 1
                                         ].isalpha()
                                     )
@@ -1453,290 +1471,291 @@ class Phonet(_Phonetic):
                                     )
                                 )
                             )
-                        ):
-                            # look for continuation, if:
-                            # matches > 1 und NO '-' in first string */
-                            pos0 = -1
+                        )
+                        or (
+                            (rule[0] == '$')
+                            and (i > 0)
+                            and src[i - 1].isalpha()
+                            and (
+                                (
+                                    not src[
+                                        i + matches0 : i + matches0 + 1
+                                    ].isalpha()
+                                )
+                                and (
+                                    src[i + matches0 : i + matches0 + 1] != '.'
+                                )
+                            )
+                        )
+                    ):
+                        # look for continuation, if:
+                        # matches > 1 und NO '-' in first string */
+                        pos0 = -1
 
-                            start3 = 0
-                            start4 = 0
-                            end3 = 0
-                            end4 = 0
+                        start3 = 0
+                        start4 = 0
+                        end3 = 0
+                        end4 = 0
 
-                            if (
-                                (matches > 1)
-                                and src[i + matches : i + matches + 1]
-                                and (priority0 != ord('-'))
-                            ):
-                                char0 = src[i + matches - 1]
-                                pos0 = alpha_pos[char0]
-
-                                if pos0 >= 2 and src[i + matches]:
-                                    xpos = pos0 - 2
-                                    pos0 = alpha_pos[src[i + matches]]
-                                    start3 = phonet_hash_1[xpos, pos0]
-                                    start4 = phonet_hash_1[xpos, 0]
-                                    end3 = phonet_hash_2[xpos, pos0]
-                                    end4 = phonet_hash_2[xpos, 0]
-
-                                    # preserve rule priorities
-                                    if (start4 >= 0) and (
-                                        (start3 < 0) or (start4 < start3)
-                                    ):
-                                        pos0 = start3
-                                        start3 = start4
-                                        start4 = pos0
-                                        pos0 = end3
+                        if (
+                            (matches > 1)
+                            and src[i + matches : i + matches + 1]
+                            and (priority0 != ord('-'))
+                        ):
+                            char0 = src[i + matches - 1]
+                            pos0 = alpha_pos[char0]
+
+                            if pos0 >= 2 and src[i + matches]:
+                                xpos = pos0 - 2
+                                pos0 = alpha_pos[src[i + matches]]
+                                start3 = phonet_hash_1[xpos, pos0]
+                                start4 = phonet_hash_1[xpos, 0]
+                                end3 = phonet_hash_2[xpos, pos0]
+                                end4 = phonet_hash_2[xpos, 0]
+
+                                # preserve rule priorities
+                                if (start4 >= 0) and (
+                                    (start3 < 0) or (start4 < start3)
+                                ):
+                                    pos0 = start3
+                                    start3 = start4
+                                    start4 = pos0
+                                    pos0 = end3
+                                    end3 = end4
+                                    end4 = pos0
+
+                                if (end3 >= start4) and (start4 >= 0):
+                                    if end4 > end3:
                                         end3 = end4
-                                        end4 = pos0
 
-                                    if (end3 >= start4) and (start4 >= 0):
-                                        if end4 > end3:
-                                            end3 = end4
-
-                                        start4 = -1
-                                        end4 = -1
-                                else:
-                                    pos0 = phonet_hash[char0]
-                                    start3 = pos0
-                                    end3 = 10000
                                     start4 = -1
                                     end4 = -1
+                            else:
+                                pos0 = phonet_hash[char0]
+                                start3 = pos0
+                                end3 = 10000
+                                start4 = -1
+                                end4 = -1
+
+                            pos0 = start3
+
+                        # check continuation rules for src[i+matches]
+                        if pos0 >= 0:
+                            while (_phonet_rules[pos0] is None) or (
+                                cast(str, _phonet_rules[pos0])[0] == char0
+                            ):
+                                if pos0 > end3:
+                                    if start4 > 0:
+                                        pos0 = start4
+                                        start3 = start4
+                                        start4 = -1
+                                        end3 = end4
+                                        end4 = -1
+                                        continue
 
-                                pos0 = start3
+                                    priority0 = -1
 
-                            # check continuation rules for src[i+matches]
-                            if pos0 >= 0:
-                                while (_phonet_rules[pos0] is None) or (
-                                    cast(str, _phonet_rules[pos0])[0] == char0
+                                    # important
+                                    break
+
+                                if (_phonet_rules[pos0] is None) or (
+                                    _phonet_rules[pos0 + mode] is None
                                 ):
-                                    if pos0 > end3:
-                                        if start4 > 0:
-                                            pos0 = start4
-                                            start3 = start4
-                                            start4 = -1
-                                            end3 = end4
-                                            end4 = -1
-                                            continue
-
-                                        priority0 = -1
-
-                                        # important
-                                        break
-
-                                    if (_phonet_rules[pos0] is None) or (
-                                        _phonet_rules[pos0 + mode] is None
-                                    ):
-                                        # no conversion rule available
-                                        pos0 += 3
-                                        continue
+                                    # no conversion rule available
+                                    pos0 += 3
+                                    continue
 
-                                    # check whole string
-                                    matches0 = matches
-                                    priority0 = 5
-                                    rule = cast(str, _phonet_rules[pos0])[1:]
+                                # check whole string
+                                matches0 = matches
+                                priority0 = 5
+                                rule = cast(str, _phonet_rules[pos0])[1:]
 
-                                    while (
-                                        rule
-                                        and (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ]
-                                            == rule[0]
-                                        )
-                                        and (
-                                            not rule[0].isdigit()
-                                            or (rule in '(-<^$')
-                                        )
+                                while (
+                                    rule
+                                    and (
+                                        src[i + matches0 : i + matches0 + 1]
+                                        == rule[0]
+                                    )
+                                    and (
+                                        not rule[0].isdigit()
+                                        or (rule in '(-<^$')
+                                    )
+                                ):
+                                    matches0 += 1
+                                    rule = rule[1:]
+
+                                if rule and rule[0] == '(':
+                                    # check an array of letters
+                                    if src[
+                                        i + matches0 : i + matches0 + 1
+                                    ].isalpha() and (
+                                        src[i + matches0] in rule[1:]
                                     ):
                                         matches0 += 1
-                                        rule = rule[1:]
-
-                                    if rule and rule[0] == '(':
-                                        # check an array of letters
-                                        if src[
-                                            i + matches0 : i + matches0 + 1
-                                        ].isalpha() and (
-                                            src[i + matches0] in rule[1:]
-                                        ):
-                                            matches0 += 1
 
-                                            while rule and rule[0] != ')':
-                                                rule = rule[1:]
-
-                                            # if rule[0] == ')':
+                                        while rule and rule[0] != ')':
                                             rule = rule[1:]
 
-                                    while rule and rule[0] == '-':
-                                        # "matches0" is NOT decremented
-                                        # because of
-                                        #    "if (matches0 == matches)"
+                                        # if rule[0] == ')':
                                         rule = rule[1:]
 
-                                    if rule and rule[0] == '<':
-                                        rule = rule[1:]
+                                while rule and rule[0] == '-':
+                                    # "matches0" is NOT decremented
+                                    # because of
+                                    #    "if (matches0 == matches)"
+                                    rule = rule[1:]
 
-                                    if rule and rule[0].isdigit():
-                                        priority0 = int(rule[0])
-                                        rule = rule[1:]
+                                if rule and rule[0] == '<':
+                                    rule = rule[1:]
+
+                                if rule and rule[0].isdigit():
+                                    priority0 = int(rule[0])
+                                    rule = rule[1:]
 
-                                    if (
-                                        not rule
-                                        # rule == '^' is not possible here
-                                        or (
-                                            (rule[0] == '$')
-                                            and not src[
+                                if (
+                                    not rule
+                                    # rule == '^' is not possible here
+                                    or (
+                                        (rule[0] == '$')
+                                        and not src[
+                                            i + matches0 : i + matches0 + 1
+                                        ].isalpha()
+                                        and (
+                                            src[
                                                 i + matches0 : i + matches0 + 1
-                                            ].isalpha()
-                                            and (
-                                                src[
-                                                    i
-                                                    + matches0 : i
-                                                    + matches0
-                                                    + 1
-                                                ]
-                                                != '.'
-                                            )
+                                            ]
+                                            != '.'
                                         )
-                                    ):
-                                        if matches0 == matches:
-                                            # this is only a partial string
-                                            pos0 += 3
-                                            continue
+                                    )
+                                ):
+                                    if matches0 == matches:
+                                        # this is only a partial string
+                                        pos0 += 3
+                                        continue
 
-                                        if priority0 < priority:
-                                            # priority is too low
-                                            pos0 += 3
-                                            continue
+                                    if priority0 < priority:
+                                        # priority is too low
+                                        pos0 += 3
+                                        continue
 
-                                        # continuation rule found
-                                        break
+                                    # continuation rule found
+                                    break
 
-                                    pos0 += 3
+                                pos0 += 3
 
-                                # end of "while"
-                                if (priority0 >= priority) and (
-                                    (_phonet_rules[pos0] is not None)
-                                    and (
-                                        cast(str, _phonet_rules[pos0])[0]
-                                        == char0
-                                    )
-                                ):
+                            # end of "while"
+                            if (priority0 >= priority) and (
+                                (_phonet_rules[pos0] is not None)
+                                and (
+                                    cast(str, _phonet_rules[pos0])[0] == char0
+                                )
+                            ):
 
-                                    pos += 3
-                                    continue
+                                pos += 3
+                                continue
 
-                            # replace string
-                            if _phonet_rules[pos] and (
-                                '<' in cast(str, _phonet_rules[pos])[1:]
+                        # replace string
+                        if _phonet_rules[pos] and (
+                            '<' in cast(str, _phonet_rules[pos])[1:]
+                        ):
+                            priority0 = 1
+                        else:
+                            priority0 = 0
+
+                        rule = cast(str, _phonet_rules[pos + mode])
+
+                        if (priority0 == 1) and (zeta == 0):
+                            # rule with '<' is applied
+                            if (
+                                (j > 0)
+                                and rule
+                                and (
+                                    (dest[j - 1] == char)
+                                    or (dest[j - 1] == rule[0])
+                                )
                             ):
-                                priority0 = 1
-                            else:
-                                priority0 = 0
+                                j -= 1
 
-                            rule = cast(str, _phonet_rules[pos + mode])
+                            zeta0 = 1
+                            zeta += 1
+                            matches0 = 0
 
-                            if (priority0 == 1) and (zeta == 0):
-                                # rule with '<' is applied
-                                if (
-                                    (j > 0)
-                                    and rule
-                                    and (
-                                        (dest[j - 1] == char)
-                                        or (dest[j - 1] == rule[0])
-                                    )
-                                ):
-                                    j -= 1
+                            while rule and src[i + matches0]:
+                                src = (
+                                    src[0 : i + matches0]
+                                    + rule[0]
+                                    + src[i + matches0 + 1 :]
+                                )
+                                matches0 += 1
+                                rule = rule[1:]
 
-                                zeta0 = 1
-                                zeta += 1
-                                matches0 = 0
+                            if matches0 < matches:
+                                src = (
+                                    src[0 : i + matches0] + src[i + matches :]
+                                )
 
-                                while rule and src[i + matches0]:
-                                    src = (
-                                        src[0 : i + matches0]
+                            char = src[i]
+                        else:
+                            i = i + matches - 1
+                            zeta = 0
+
+                            while len(rule) > 1:
+                                if (j == 0) or (dest[j - 1] != rule[0]):
+                                    dest = (
+                                        dest[0:j]
                                         + rule[0]
-                                        + src[i + matches0 + 1 :]
+                                        + dest[min(len(dest), j + 1) :]
                                     )
-                                    matches0 += 1
-                                    rule = rule[1:]
+                                    j += 1
 
-                                if matches0 < matches:
-                                    src = (
-                                        src[0 : i + matches0]
-                                        + src[i + matches :]
-                                    )
+                                rule = rule[1:]
 
-                                char = src[i]
+                            # new "current char"
+                            if not rule:
+                                rule = ''
+                                char = ''
                             else:
-                                i = i + matches - 1
-                                zeta = 0
-
-                                while len(rule) > 1:
-                                    if (j == 0) or (dest[j - 1] != rule[0]):
-                                        dest = (
-                                            dest[0:j]
-                                            + rule[0]
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
-                                        j += 1
-
-                                    rule = rule[1:]
-
-                                # new "current char"
-                                if not rule:
-                                    rule = ''
-                                    char = ''
-                                else:
-                                    char = rule[0]
+                                char = rule[0]
 
-                                if (
-                                    _phonet_rules[pos]
-                                    and '^^'
-                                    in cast(str, _phonet_rules[pos])[1:]
-                                ):
-                                    if char:
-                                        dest = (
-                                            dest[0:j]
-                                            + char
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
-                                        j += 1
-
-                                    src = src[i + 1 :]
-                                    i = 0
-                                    zeta0 = 1
-
-                            break
+                            if (
+                                _phonet_rules[pos]
+                                and '^^' in cast(str, _phonet_rules[pos])[1:]
+                            ):
+                                if char:
+                                    dest = (
+                                        dest[0:j]
+                                        + char
+                                        + dest[min(len(dest), j + 1) :]
+                                    )
+                                    j += 1
 
-                        pos += 3
+                                src = src[i + 1 :]
+                                i = 0
+                                zeta0 = 1
 
-                        if pos > end1 and start2 > 0:
-                            pos = start2
-                            start1 = start2
-                            end1 = end2
-                            start2 = -1
-                            end2 = -1
+                        break
 
-                if zeta0 == 0:
-                    if char and ((j == 0) or (dest[j - 1] != char)):
-                        # delete multiple letters only
-                        dest = (
-                            dest[0:j] + char + dest[min(j + 1, term_length) :]
-                        )
-                        j += 1
+                    pos += 3
 
-                    i += 1
-                    zeta = 0
+                    if pos > end1 and start2 > 0:
+                        pos = start2
+                        start1 = start2
+                        end1 = end2
+                        start2 = -1
+                        end2 = -1
 
-            dest = dest[0:j]
+            if zeta0 == 0:
+                if char and ((j == 0) or (dest[j - 1] != char)):
+                    # delete multiple letters only
+                    dest = dest[0:j] + char + dest[min(j + 1, term_length) :]
+                    j += 1
 
-            return dest
+                i += 1
+                zeta = 0
 
-        _initialize_phonet(self._lang)
+        dest = dest[0:j]
 
-        word = unicode_normalize('NFKC', word)
-        return _phonet(word, self._mode, self._lang)
+        return dest
 
 
 if __name__ == '__main__':
@@ -19,17 +19,28 @@
 The phonetic._phonetic module implements abstract class Phonetic.
 """
 
-from itertools import groupby
+from itertools import chain, groupby, repeat
+from typing import Iterable, List, Optional, Union
+
+from numpy import empty as np_empty
+from numpy import ndarray as np_ndarray
+
+from ..util._lru_cache import _Cacheable
+from ..util._parallel import _parallel_map
 
 __all__ = ['_Phonetic']
 
 
-class _Phonetic:
+class _Phonetic(_Cacheable):
     """Abstract Phonetic class.
 
+    Results can be cached, per instance, by calling :py:meth:`enable_cache`.
+
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'encode'
+
     _uc_set = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
     _lc_set = set('abcdefghijklmnopqrstuvwxyz')
     _uc_v_set = set('AEIOU')
@@ -102,6 +113,102 @@ class _Phonetic:
         """
         return self.encode(word)
 
+    def encode_many(
+        self,
+        words: Iterable[str],
+        n_jobs: Optional[int] = 1,
+        chunk_size: int = 1000,
+        alpha: bool = False,
+        as_array: bool = False,
+    ) -> Union[List[str], np_ndarray]:
+        """Encode many words phonetically.
+
+        The words are deduplicated before encoding, so each distinct word is
+        encoded only once, and the encodings are returned in the order of the
+        input.
+
+        Parameters
+        ----------
+        words : iterable
+            The words to transform
+        n_jobs : int or None
+            The number of worker processes to encode with. If 1 (default),
+            the words are encoded in this process; if None or less than 1,
+            one process per CPU is used.
+        chunk_size : int
+            The number of distinct words sent to a worker at a time
+        alpha : bool
+            If True, the words are encoded with :py:meth:`encode_alpha`
+        as_array : bool
+            If True, the encodings are returned as a NumPy object array
+
+        Returns
+        -------
+        list or numpy.ndarray
+            The transformed words
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex()
+        >>> pe.encode_many(['Smith', 'Schmidt', 'Smith', 'Smyth'])
+        ['S530', 'S530', 'S530', 'S530']
+        >>> pe.encode_many(['Ashcroft', 'Tymczak'], as_array=True)
+        array(['A261', 'T522'], dtype=object)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+
+        chunk_size = max(chunk_size, 1)
+        chunks = [
+            unique[i : i + chunk_size]
+            for i in range(0, len(unique), chunk_size)
+        ]
+        encoded = list(
+            chain.from_iterable(
+                _parallel_map(
+                    self._encode_batch, chunks, n_jobs, repeat(alpha)
+                )
+            )
+        )
+
+        codes = dict(zip(unique, encoded))
+        if as_array:
+            array = np_empty(len(words), dtype=object)
+            array[:] = [codes[word] for word in words]
+            return array
+        return [codes[word] for word in words]
+
+    def _encode_batch(self, words: List[str], alpha: bool) -> List[str]:
+        """Encode a batch of distinct words.
+
+        This is the unit of work of :py:meth:`encode_many`. Encoders that can
+        encode many words more efficiently than one at a time may override it.
+
+        Parameters
+        ----------
+        words : list
+            The distinct words to transform
+        alpha : bool
+            If True, the words are encoded with :py:meth:`encode_alpha`
+
+        Returns
+        -------
+        list
+            The transformed words, in the order of the input
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if alpha:
+            return [self.encode_alpha(word) for word in words]
+        return [self.encode(word) for word in words]
+
 
 if __name__ == '__main__':
     import doctest
@@ -66,6 +66,10 @@ form:
 >>> stmr.stem('trusted')
 'trust'
 
+The stems of a closed vocabulary can be computed once, by any of these
+stemmers, into a memory-mapped stem table (:py:class:`.StemTable`), which is
+itself a stemmer.
+
 ----
 
 """
@@ -86,6 +90,7 @@ from ._snowball_dutch import SnowballDutch
 from ._snowball_german import SnowballGerman
 from ._snowball_norwegian import SnowballNorwegian
 from ._snowball_swedish import SnowballSwedish
+from ._stem_table import StemTable
 from ._stemmer import _Stemmer
 from ._uea_lite import UEALite
 
@@ -108,6 +113,7 @@ __all__ = [
     'CLEFGerman',
     'CLEFGermanPlus',
     'CLEFSwedish',
+    'StemTable',
 ]
 
 
@@ -0,0 +1,540 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stemmer._stem_table.
+
+Precompiled, memory-mapped stem table
+"""
+
+import mmap
+import struct
+from typing import Any, Dict, Iterable, Optional
+from zlib import crc32
+
+from numpy import array as np_array
+from numpy import cumsum as np_cumsum
+from numpy import frombuffer as np_frombuffer
+from numpy import ndarray
+from numpy import uint32 as np_uint32
+from numpy import uint64 as np_uint64
+
+from ._stemmer import _Stemmer
+
+__all__ = ['StemTable']
+
+
+class _Pool:
+    """A read-only sequence of the byte strings in a string pool.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, buffer: Any, offsets: ndarray, start: int) -> None:
+        """Initialize _Pool instance.
+
+        Parameters
+        ----------
+        buffer : mmap.mmap
+            The buffer holding the pool
+        offsets : numpy.ndarray
+            The offset of each string, relative to start, followed by the end
+            of the last string
+        start : int
+            The position of the pool in the buffer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._buffer = buffer
+        self._offsets = offsets
+        self._start = start
+
+    def __len__(self) -> int:
+        """Return the number of strings in the pool.
+
+        Returns
+        -------
+        int
+            The number of strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        """Return a string from the pool.
+
+        Parameters
+        ----------
+        index : int
+            The index of the string
+
+        Returns
+        -------
+        bytes
+            The UTF-8 encoded string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._buffer[
+            self._start
+            + self._offsets.item(index) : self._start
+            + self._offsets.item(index + 1)
+        ]
+
+
+class StemTable(_Stemmer):
+    """Stem table.
+
+    A stem table holds the stems of a closed vocabulary, as computed once by
+    another stemmer, in a compact file. The file holds the vocabulary as a
+    sorted pool of UTF-8 strings, the distinct stems as a second pool, arrays
+    of offsets into each, and an open-addressing hash index of the words, so
+    that it can be opened with :py:mod:`mmap` without being read or parsed.
+    Words outside the vocabulary are passed to the live stemmer. The table
+    records the stemmer's class and parameters, and can be opened only with a
+    stemmer that matches them.
+
+    Since the file is memory-mapped, any number of processes that open the
+    same table share a single copy of it in the operating system's page cache.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _magic = b'ABSTEM01'
+    # magic, number of words, number of stems, number of hash slots, length of
+    # stemmer signature
+    _header = struct.Struct('<8sQQQQ')
+
+    def __init__(self, path: str, stemmer: _Stemmer) -> None:
+        """Initialize StemTable instance.
+
+        Parameters
+        ----------
+        path : str
+            The path of a stem table, as written by :py:meth:`build`
+        stemmer : _Stemmer
+            The stemmer that built the table, which stems words that are not
+            in it
+
+        Raises
+        ------
+        ValueError
+            The file is not a stem table, or was built by a different stemmer
+            or by the same stemmer with different parameters
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._path = path
+        self._stemmer = stemmer
+
+        with open(path, 'rb') as table_file:
+            self._buffer = mmap.mmap(
+                table_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        try:
+            (
+                magic,
+                n_words,
+                n_stems,
+                n_slots,
+                sig_len,
+            ) = self._header.unpack_from(self._buffer)
+        except struct.error:
+            magic = b''
+        if magic != self._magic:
+            self._buffer.close()
+            raise ValueError('{} is not a stem table.'.format(path))
+
+        pos = self._header.size
+        signature = self._buffer[pos : pos + sig_len].decode('utf-8')
+        if signature != self._signature(stemmer):
+            self._buffer.close()
+            raise ValueError(
+                '{} was built by {}, not {}.'.format(
+                    path, signature, self._signature(stemmer)
+                )
+            )
+        pos = self._padding(pos + sig_len)
+
+        word_offsets = self._view(pos, '<u8', n_words + 1)
+        pos += 8 * (n_words + 1)
+        stem_offsets = self._view(pos, '<u8', n_stems + 1)
+        pos += 8 * (n_stems + 1)
+        self._stem_ids = self._view(pos, '<u4', n_words)
+        pos += 4 * n_words
+        self._slots = self._view(pos, '<u4', n_slots)
+        pos = self._padding(pos + 4 * n_slots)
+
+        self._mask = n_slots - 1
+        self._words = _Pool(self._buffer, word_offsets, pos)
+        self._stems = _Pool(
+            self._buffer, stem_offsets, pos + word_offsets.item(-1)
+        )
+
+    def _view(self, pos: int, dtype: str, count: int) -> ndarray:
+        """Return an array in the table, without copying it.
+
+        Parameters
+        ----------
+        pos : int
+            The position of the array in the file
+        dtype : str
+            The little-endian NumPy dtype of the array's items, as written by
+            :py:meth:`build`
+        count : int
+            The number of items
+
+        Returns
+        -------
+        numpy.ndarray
+            The array, which NumPy reads in the file's byte order whatever the
+            byte order of the machine
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np_frombuffer(
+            self._buffer, dtype=dtype, count=count, offset=pos
+        )
+
+    @staticmethod
+    def _signature(stemmer: _Stemmer) -> str:
+        """Return the name & parameters of a stemmer.
+
+        The parameters are the stemmer's attributes that are booleans,
+        numbers, strings, or None, which are the options given to its
+        constructor.
+
+        Parameters
+        ----------
+        stemmer : _Stemmer
+            A stemmer
+
+        Returns
+        -------
+        str
+            The stemmer's class name and parameters
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter2, SnowballGerman
+        >>> StemTable._signature(Porter2(early_english=True))
+        'Porter2(early_english=True)'
+        >>> StemTable._signature(SnowballGerman())
+        'SnowballGerman(alternate_vowels=False)'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        params = sorted(
+            (name.lstrip('_'), value)
+            for name, value in vars(stemmer).items()
+            if value is None or isinstance(value, (bool, int, float, str))
+        )
+        return '{}({})'.format(
+            type(stemmer).__name__,
+            ', '.join('{}={!r}'.format(name, value) for name, value in params),
+        )
+
+    @staticmethod
+    def _padding(pos: int) -> int:
+        """Return a position rounded up to a multiple of 8.
+
+        Parameters
+        ----------
+        pos : int
+            A position in the file
+
+        Returns
+        -------
+        int
+            The next 8-byte aligned position
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return -(-pos // 8) * 8
+
+    @classmethod
+    def build(
+        cls,
+        stemmer: _Stemmer,
+        vocabulary: Iterable[str],
+        path: str,
+        n_jobs: Optional[int] = 1,
+        chunk_size: int = 10000,
+    ) -> 'StemTable':
+        """Stem a vocabulary and write its stem table.
+
+        Parameters
+        ----------
+        stemmer : _Stemmer
+            The stemmer to build the table with
+        vocabulary : iterable
+            The words to include in the table
+        path : str
+            The path of the file to write
+        n_jobs : int or None
+            The number of worker processes to stem with. If 1 (default), the
+            words are stemmed in this process; if None or less than 1, one
+            process per CPU is used.
+        chunk_size : int
+            The number of words sent to a worker at a time
+
+        Returns
+        -------
+        StemTable
+            The stem table, opened
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> from abydos.stemmer import Porter2
+        >>> path = os.path.join(tempfile.mkdtemp(), 'porter2.stems')
+        >>> stmr = StemTable.build(Porter2(), ['running', 'runs', 'ran'], path)
+        >>> len(stmr)
+        3
+        >>> stmr.stem('running'), stmr.stem('jumping')
+        ('run', 'jump')
+        >>> stmr.close()
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        word_bytes = sorted({word.encode('utf-8') for word in vocabulary})
+        words = [word.decode('utf-8') for word in word_bytes]
+
+        stems = stemmer.stem_many(words, n_jobs, chunk_size)
+
+        stem_ids = {}  # type: Dict[str, int]
+        for stem in stems:
+            if stem not in stem_ids:
+                stem_ids[stem] = len(stem_ids)
+        stem_bytes = [stem.encode('utf-8') for stem in stem_ids]
+
+        # The hash index has at least twice as many slots as words, each
+        # holding 0 or the index of a word plus 1.
+        n_slots = 1
+        while n_slots < 2 * len(words):
+            n_slots <<= 1
+        slots = [0] * n_slots
+        for index, word in enumerate(word_bytes):
+            slot = crc32(word) & (n_slots - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (n_slots - 1)
+            slots[slot] = index + 1
+
+        signature = cls._signature(stemmer).encode('utf-8')
+        with open(path, 'wb') as table_file:
+            table_file.write(
+                cls._header.pack(
+                    cls._magic,
+                    len(words),
+                    len(stem_ids),
+                    n_slots,
+                    len(signature),
+                )
+            )
+            pos = cls._header.size + len(signature)
+            table_file.write(signature + b'\0' * (cls._padding(pos) - pos))
+            for pool in (word_bytes, stem_bytes):
+                offsets = np_cumsum(
+                    [0] + [len(string) for string in pool], dtype=np_uint64
+                )
+                table_file.write(offsets.astype('<u8').tobytes())
+            for ints in ([stem_ids[stem] for stem in stems], slots):
+                table_file.write(
+                    np_array(ints, dtype=np_uint32).astype('<u4').tobytes()
+                )
+            pos = 4 * (len(words) + n_slots)
+            table_file.write(b'\0' * (cls._padding(pos) - pos))
+            for pool in (word_bytes, stem_bytes):
+                table_file.write(b''.join(pool))
+
+        return cls(path, stemmer)
+
+    def _index(self, word: str) -> int:
+        """Return the index of a word in the table, or -1.
+
+        Parameters
+        ----------
+        word : str
+            The word to find
+
+        Returns
+        -------
+        int
+            The index of the word, or -1 if it is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = word.encode('utf-8')
+        slots = self._slots
+        slot = crc32(key) & self._mask
+        index = slots.item(slot) - 1
+        while index >= 0:
+            if self._words[index] == key:
+                return index
+            slot = (slot + 1) & self._mask
+            index = slots.item(slot) - 1
+        return -1
+
+    def stem(self, word: str) -> str:
+        """Return the stem of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to stem
+
+        Returns
+        -------
+        str
+            Word stem, from the table or, if the word is not in the table,
+            from the stemmer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        index = self._index(word)
+        if index < 0:
+            return self._stemmer.stem(word)
+        return self._stems[self._stem_ids.item(index)].decode('utf-8')
+
+    def __contains__(self, word: object) -> bool:
+        """Return True if a word is in the table.
+
+        Parameters
+        ----------
+        word : str
+            The word to find
+
+        Returns
+        -------
+        bool
+            True if the word is in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return isinstance(word, str) and self._index(word) >= 0
+
+    def __len__(self) -> int:
+        """Return the number of words in the table.
+
+        Returns
+        -------
+        int
+            The number of words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._words)
+
+    def close(self) -> None:
+        """Close the table's memory map.
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The arrays are views of the buffer, which must be dropped before it
+        # can be closed.
+        del self._words, self._stems, self._stem_ids, self._slots
+        self._buffer.close()
+
+    def __enter__(self) -> 'StemTable':
+        """Return the table, as a context manager.
+
+        Returns
+        -------
+        StemTable
+            The table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the table, on leaving a context.
+
+        Parameters
+        ----------
+        *args
+            The exception, if any, raised in the context
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the table for pickling.
+
+        The table is pickled as its path & stemmer, and reopened when
+        unpickled, so that processes share the file rather than copies of it.
+
+        Returns
+        -------
+        dict
+            The path & stemmer of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {'path': self._path, 'stemmer': self._stemmer}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Reopen a pickled table.
+
+        Parameters
+        ----------
+        state : dict
+            The path & stemmer of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__init__(state['path'], state['stemmer'])  # type: ignore
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,15 +19,27 @@
 abstract class _Stemmer
 """
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from ..util._lru_cache import _Cacheable
+from ..util._parallel import _n_workers, _parallel_map
+
 __all__ = ['_Stemmer']
 
 
-class _Stemmer:
+class _Stemmer(_Cacheable):
     """Abstract Stemmer class.
 
+    Results can be cached, per instance, by calling :py:meth:`enable_cache`.
+
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'stem'
+
     def stem(self, word: str) -> str:
         """Return stem.
 
@@ -47,6 +59,166 @@ class _Stemmer:
         """
         return word
 
+    def stem_many(
+        self,
+        words: Iterable[str],
+        n_jobs: Optional[int] = 1,
+        chunk_size: int = 10000,
+    ) -> List[str]:
+        """Stem many words.
+
+        The words are deduplicated before stemming, so each distinct word is
+        stemmed only once, and the stems are returned in the order of the
+        input.
+
+        Parameters
+        ----------
+        words : iterable
+            The words to stem
+        n_jobs : int or None
+            The number of worker processes to stem with. If 1 (default), the
+            words are stemmed in this process; if None or less than 1, one
+            process per CPU is used.
+        chunk_size : int
+            The number of distinct words sent to a worker at a time
+
+        Returns
+        -------
+        list
+            The word stems
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter2
+        >>> stmr = Porter2()
+        >>> stmr.stem_many(['running', 'runs', 'running', 'ran'])
+        ['run', 'run', 'run', 'ran']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+
+        chunk_size = max(chunk_size, 1)
+        chunks = [
+            unique[i : i + chunk_size]
+            for i in range(0, len(unique), chunk_size)
+        ]
+        stemmed = list(
+            chain.from_iterable(
+                _parallel_map(self._stem_batch, chunks, n_jobs)
+            )
+        )
+
+        stems = dict(zip(unique, stemmed))
+        return [stems[word] for word in words]
+
+    def stem_stream(
+        self,
+        tokens: Iterable[str],
+        n_jobs: Optional[int] = 1,
+        chunk_size: int = 10000,
+    ) -> Iterator[str]:
+        """Stem a stream of tokens.
+
+        The tokens are read & stemmed in chunks, so that a stream of any
+        length is stemmed in bounded memory, and the stems are yielded in the
+        order of the stream. Within each chunk, each distinct token is stemmed
+        only once.
+
+        Parameters
+        ----------
+        tokens : iterable
+            The tokens to stem
+        n_jobs : int or None
+            The number of worker processes to stem with. If 1 (default), the
+            tokens are stemmed in this process; if None or less than 1, one
+            process per CPU is used. At most two chunks per worker are read
+            ahead of the stems yielded.
+        chunk_size : int
+            The number of tokens in each chunk
+
+        Yields
+        ------
+        str
+            The stem of each token
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter2
+        >>> stmr = Porter2()
+        >>> tokens = iter('the runners were running in the runs'.split())
+        >>> ' '.join(stmr.stem_stream(tokens, chunk_size=3))
+        'the runner were run in the run'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = iter(tokens)
+        chunk_size = max(chunk_size, 1)
+        chunks = iter(lambda: list(islice(tokens, chunk_size)), [])
+
+        n_jobs = _n_workers(n_jobs)
+        if n_jobs == 1:
+            for chunk in chunks:
+                yield from self._stem_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            pending = deque()  # type: Deque[Future[List[str]]]
+            for chunk in chunks:
+                pending.append(executor.submit(self._stem_chunk, chunk))
+                if len(pending) >= 2 * n_jobs:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _stem_chunk(self, tokens: List[str]) -> List[str]:
+        """Stem a chunk of tokens, stemming each distinct token once.
+
+        Parameters
+        ----------
+        tokens : list
+            The tokens to stem
+
+        Returns
+        -------
+        list
+            The stems, in the order of the input
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        unique = list(dict.fromkeys(tokens))
+        stems = dict(zip(unique, self._stem_batch(unique)))
+        return [stems[token] for token in tokens]
+
+    def _stem_batch(self, words: List[str]) -> List[str]:
+        """Stem a batch of distinct words.
+
+        This is the unit of work of :py:meth:`stem_many`. Stemmers that can
+        stem many words more efficiently than one at a time may override it.
+
+        Parameters
+        ----------
+        words : list
+            The words to stem
+
+        Returns
+        -------
+        list
+            The word stems, in the order of the input
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [self.stem(word) for word in words]
+
 
 if __name__ == '__main__':
     import doctest
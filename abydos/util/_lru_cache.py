@@ -0,0 +1,260 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._lru_cache.
+
+The util._lru_cache module defines _LRUCache, a bounded, per-instance
+memoisation of a single method, and _Cacheable, which lets the base classes of
+encoders, stemmers, and fingerprinters opt in to it.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+
+__all__ = []  # type: List[str]
+
+
+_CacheInfo = NamedTuple(
+    '_CacheInfo',
+    [
+        ('hits', int),
+        ('misses', int),
+        ('evictions', int),
+        ('maxsize', int),
+        ('currsize', int),
+    ],
+)
+
+
+class _LRUCache:
+    """Least-recently-used cache of a method of an object.
+
+    Calls are answered from the cache when the same arguments have been
+    seen before; otherwise the method of the object's class is called and its
+    result stored, evicting the least recently used entry when the cache is
+    full.
+
+    Since the cache belongs to a single object, objects with different
+    parameters never share entries. When pickled (e.g. to be sent to a worker
+    process), the entries and statistics are dropped so that each copy warms
+    up independently.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, obj: Any, method: str, maxsize: int = 1024) -> None:
+        """Initialize _LRUCache instance.
+
+        Parameters
+        ----------
+        obj : object
+            The object whose method is to be cached
+        method : str
+            The name of the method to cache
+        maxsize : int
+            The maximum number of entries to retain
+
+        Raises
+        ------
+        ValueError
+            maxsize must be at least 1.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+        self._obj = obj
+        self._method = method
+        self._maxsize = maxsize
+        self.cache_clear()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the method's value for the arguments.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments to the method
+        **kwargs
+            Keyword arguments to the method
+
+        Returns
+        -------
+        Any
+            The method's value
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = (
+            args if not kwargs else args + tuple(sorted(kwargs.items()))
+        )  # type: Hashable
+        cache = self._cache
+        if key in cache:
+            self._hits += 1
+            cache.move_to_end(key)
+            return cache[key]
+
+        self._misses += 1
+        value = getattr(type(self._obj), self._method)(
+            self._obj, *args, **kwargs
+        )
+        cache[key] = value
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
+            self._evictions += 1
+        return value
+
+    def cache_info(self) -> _CacheInfo:
+        """Return the cache statistics.
+
+        Returns
+        -------
+        _CacheInfo
+            The hits, misses, evictions, maximum size, and current size of the
+            cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _CacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self._maxsize,
+            len(self._cache),
+        )
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._cache = OrderedDict()  # type: OrderedDict[Hashable, Any]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the cache for pickling, without its entries.
+
+        Returns
+        -------
+        dict
+            The object, method name, and maximum size of the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            '_obj': self._obj,
+            '_method': self._method,
+            '_maxsize': self._maxsize,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore an empty cache from a pickled state.
+
+        Parameters
+        ----------
+        state : dict
+            The object, method name, and maximum size of the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self.cache_clear()
+
+
+class _Cacheable:
+    """Mixin adding an opt-in LRU cache to a class's main method.
+
+    Subclasses name the method to cache in ``_cached_method``. Once
+    :py:meth:`enable_cache` is called, the instance's method is replaced by an
+    :py:class:`_LRUCache` of it.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _cached_method = ''
+
+    def enable_cache(self, maxsize: int = 1024) -> None:
+        """Cache this object's results in a bounded LRU cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of results to retain
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        setattr(
+            self,
+            self._cached_method,
+            _LRUCache(self, self._cached_method, maxsize),
+        )
+
+    def disable_cache(self) -> None:
+        """Stop caching this object's results and discard the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.pop(self._cached_method, None)
+
+    def cache_info(self) -> Optional[_CacheInfo]:
+        """Return the cache statistics.
+
+        Returns
+        -------
+        _CacheInfo or None
+            The hits, misses, evictions, maximum size, and current size of the
+            cache, or None if caching is not enabled
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self.__dict__.get(self._cached_method)
+        if isinstance(cache, _LRUCache):
+            return cache.cache_info()
+        return None
+
+    def cache_clear(self) -> None:
+        """Empty the cache, if enabled, and reset its statistics.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self.__dict__.get(self._cached_method)
+        if isinstance(cache, _LRUCache):
+            cache.cache_clear()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
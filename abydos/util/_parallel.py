@@ -0,0 +1,109 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._parallel.
+
+The util._parallel module defines _n_workers, which interprets the n_jobs
+parameter of Abydos's batch methods, and _parallel_map, which maps a function
+over items in worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+__all__ = []  # type: List[str]
+
+
+def _n_workers(n_jobs: Optional[int]) -> int:
+    """Return the number of worker processes to use.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The number of worker processes requested. If 1, work is done in this
+        process; if None or less than 1, one process per CPU is used.
+
+    Returns
+    -------
+    int
+        The number of worker processes
+
+    Examples
+    --------
+    >>> _n_workers(4)
+    4
+    >>> _n_workers(None) == _n_workers(0) == (cpu_count() or 1)
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if n_jobs is None or n_jobs < 1:
+        return cpu_count() or 1
+    return n_jobs
+
+
+def _parallel_map(
+    func: Callable[..., Any],
+    items: Sequence[Any],
+    n_jobs: Optional[int] = 1,
+    *args: Iterable[Any]
+) -> List[Any]:
+    """Apply a function to each of a sequence of items, in worker processes.
+
+    No more workers are started than there are items, and if only one would
+    be, the function is applied in this process.
+
+    Parameters
+    ----------
+    func : function
+        The function to apply, which must be picklable
+    items : sequence
+        The items to apply it to
+    n_jobs : int or None
+        The number of worker processes, as interpreted by :py:func:`_n_workers`
+    *args : iterable
+        Further iterables of arguments, as for :py:func:`map`
+
+    Returns
+    -------
+    list
+        The result for each item, in order
+
+    Examples
+    --------
+    >>> _parallel_map(abs, [-1, 2, -3])
+    [1, 2, 3]
+    >>> _parallel_map(pow, [2, 3], 1, [3, 2])
+    [8, 9]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    workers = min(_n_workers(n_jobs), len(items))
+    if workers <= 1:
+        return list(map(func, items, *args))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, *args))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
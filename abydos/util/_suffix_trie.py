@@ -0,0 +1,102 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._suffix_trie.
+
+The util._suffix_trie module defines _SuffixTrie, a trie of reversed
+suffixes, which finds every suffix of a word in a single backwards walk.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+__all__ = []  # type: List[str]
+
+
+class _SuffixTrie:
+    """Trie of reversed suffixes.
+
+    Each node is a dict from a character to the next node; a node that ends a
+    suffix holds that suffix's value under the key ``''``, which no character
+    can collide with.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, suffixes: Iterable[Tuple[str, Any]]) -> None:
+        """Initialize _SuffixTrie instance.
+
+        Parameters
+        ----------
+        suffixes : iterable
+            Pairs of a suffix and its value
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._root = {}  # type: Dict[str, Any]
+        for suffix, value in suffixes:
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[''] = value
+
+    def matches(self, word: str, min_stem: int = 0) -> List[Tuple[int, Any]]:
+        """Return the suffixes of a word that are in the trie.
+
+        Parameters
+        ----------
+        word : str
+            The word to match
+        min_stem : int
+            The minimum length of the word left after removing a suffix
+
+        Returns
+        -------
+        list
+            The length & value of each matching suffix, longest first
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie([('s', 1), ('es', 2), ('ies', 3)])
+        >>> trie.matches('flies')
+        [(3, 3), (2, 2), (1, 1)]
+        >>> trie.matches('flies', min_stem=3)
+        [(2, 2), (1, 1)]
+        >>> trie.matches('fly')
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []  # type: List[Tuple[int, Any]]
+        node = self._root
+        length = len(word)
+        for pos in range(length - 1, min_stem - 1, -1):
+            if word[pos] not in node:
+                break
+            node = node[word[pos]]
+            if '' in node:
+                found.append((length - pos, node['']))
+        found.reverse()
+        return found
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -81,6 +81,24 @@ class BWTTestCases(unittest.TestCase):
                 self.coder_dollar.decode(self.coder_dollar.encode(w)), w
             )
 
+    def test_bwt_long(self):
+        """Test abydos.compression.BWT with suffix sorted inputs."""
+        for w in (
+            'SIX.MIXED.PIXIES.SIFT.SIXTY.PIXIE.DUST.BOXES' * 10,
+            'a' * 1000,
+            'ab' * 500 + 'a',
+            'בְּרֵאשִׁית, בָּרָא אֱלֹהִים' * 20,
+        ):
+            word = w + '\x00'
+            rotations = sorted(word[i:] + word[:i] for i in range(len(word)))
+            self.assertEqual(
+                self.coder.encode(w), ''.join(r[-1] for r in rotations)
+            )
+            self.assertEqual(self.coder.decode(self.coder.encode(w)), w)
+            self.assertEqual(
+                self.coder_pipe.decode(self.coder_pipe.encode(w)), w
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
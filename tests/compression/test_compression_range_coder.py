@@ -0,0 +1,130 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.compression.test_compression_range_coder.
+
+This module contains unit tests for abydos.compression.RangeCoder
+"""
+
+import unittest
+from fractions import Fraction
+from math import log2
+
+from abydos.compression import Arithmetic, RangeCoder
+
+from .. import NIALL
+
+
+class RangeCoderTestCases(unittest.TestCase):
+    """Test abydos.compression.RangeCoder."""
+
+    coder = RangeCoder()
+    coder64 = RangeCoder(' '.join(NIALL), precision=64)
+    adaptive = RangeCoder(' '.join(NIALL), adaptive=True)
+
+    def test_range_coder_init(self):
+        """Test abydos.compression.RangeCoder.__init__."""
+        self.assertRaises(ValueError, RangeCoder, precision=8)
+
+    def test_range_coder_train(self):
+        """Test abydos.compression.RangeCoder.train & .get_probs."""
+        self.coder.train('')
+        self.assertEqual(self.coder.get_probs(), {'\x00': (0, 1)})
+        self.coder.train(' '.join(NIALL))
+        self.assertEqual(
+            self.coder.get_probs(), Arithmetic(' '.join(NIALL)).get_probs()
+        )
+        niall_probs = self.coder.get_probs()
+        self.coder.train('\x00'.join(NIALL))
+        self.assertEqual(niall_probs, self.coder.get_probs())
+
+    def test_range_coder_set_probs(self):
+        """Test abydos.compression.RangeCoder.set_probs."""
+        probs = Arithmetic(' '.join(NIALL)).get_probs()
+        self.coder.set_probs(probs)
+        self.assertEqual(self.coder.get_probs(), probs)
+
+        # frequencies exceeding the precision are rescaled
+        coder = RangeCoder(precision=16)
+        coder.set_probs(
+            {
+                'a': (Fraction(0), Fraction(1, 3)),
+                'b': (Fraction(1, 3), Fraction(1 << 20, 3 << 20 - 1)),
+                '\x00': (Fraction(1 << 20, 3 << 20 - 1), Fraction(1)),
+            }
+        )
+        self.assertLessEqual(sum(coder._counts), 1 << 14)
+        self.assertEqual(coder.decode(*coder.encode('abba')), 'abba')
+
+    def test_range_coder_encode(self):
+        """Test abydos.compression.RangeCoder.encode."""
+        self.coder.train(' '.join(NIALL))
+        self.assertEqual(self.coder.encode(''), (127, 7))
+        self.assertEqual(self.coder.encode('a'), (3267, 12))
+        self.assertEqual(self.coder.encode('Niall'), (244479, 19))
+        self.assertEqual(self.coder.encode('Ni\x00ll'), (1932751, 22))
+        self.assertRaises(KeyError, self.coder.encode, 'NIALL')
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.encode(''), (1, 2))
+
+    def test_range_coder_decode(self):
+        """Test abydos.compression.RangeCoder.decode."""
+        self.coder.train(' '.join(NIALL))
+        self.assertEqual(self.coder.decode(127, 7), '')
+        self.assertEqual(self.coder.decode(3267, 12), 'a')
+        self.assertEqual(self.coder.decode(244479, 19), 'Niall')
+        self.assertEqual(self.coder.decode(1932751, 22), 'Ni ll')
+        self.coder.set_probs({})
+        self.assertEqual(self.coder.decode(0, 0), '')
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.decode(1, 1), '')
+
+    def test_range_coder_roundtripping(self):
+        """Test abydos.compression.RangeCoder.encode & .decode roundtrips."""
+        self.coder.train(' '.join(NIALL))
+        for coder in (self.coder, self.coder64, self.adaptive):
+            for name in NIALL + ('', ' '.join(NIALL) * 20):
+                self.assertEqual(coder.decode(*coder.encode(name)), name)
+
+        coder = RangeCoder('ab', precision=16, adaptive=True)
+        text = 'a' * 40000 + 'b'
+        self.assertEqual(coder.decode(*coder.encode(text)), text)
+
+    def test_range_coder_code_length(self):
+        """Test abydos.compression.RangeCoder.code_length."""
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.code_length(''), 0.0)
+
+        self.coder.train(' '.join(NIALL))
+        self.assertAlmostEqual(self.coder.code_length(''), log2(114))
+        for name in NIALL:
+            self.assertLessEqual(
+                self.coder.encode(name)[1], self.coder.code_length(name) + 2
+            )
+        self.assertAlmostEqual(
+            self.coder.code_length('Ni ll'),
+            self.coder.code_length('Ni\x00ll'),
+        )
+
+        self.assertAlmostEqual(self.adaptive.code_length(''), log2(114))
+        self.assertAlmostEqual(
+            self.adaptive.code_length('ll'),
+            log2(114 / 25) + log2(115 / 26) + log2(116),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.compression.test_compression_streaming_rle.
+
+This module contains unit tests for abydos.compression.StreamingRLE
+"""
+
+import unittest
+
+from abydos.compression import BWT, RLE, StreamingRLE
+
+
+class StreamingRLETestCases(unittest.TestCase):
+    """Test abydos.compression.StreamingRLE.encode & .decode."""
+
+    rle = StreamingRLE()
+    str_rle = RLE()
+    bwt = BWT()
+
+    bws = (
+        b'WWWWWWWWWWWWBWWWWWWWWWWWWBBBWWWWWWWWWWWWWWWWWWWWWWWWBWWWWWWWWWWWWWW'
+    )
+
+    def test_streaming_rle_encode(self):
+        """Test abydos.compression.StreamingRLE.encode."""
+        self.assertEqual(self.rle.encode(b''), b'')
+        self.assertEqual(self.rle.encode(b'banana'), b'banana')
+        self.assertEqual(self.rle.encode(self.bws), b'12WB12W3B24WB14W')
+        self.assertEqual(
+            self.rle.encode(bytearray(b'Schifffahrt')), b'Schi3fahrt'
+        )
+        self.assertEqual(
+            self.rle.encode(memoryview(b'Schifffahrt')), b'Schi3fahrt'
+        )
+        self.assertEqual(
+            self.rle.encode(self.bwt.encode('banana').encode('utf-8')),
+            b'annb\x00aa',
+        )
+
+        # runs held across chunks
+        self.assertEqual(self.rle.encode(b'WWWWW', final=False), b'')
+        self.assertEqual(self.rle.encode(b'WWWWWWW', final=False), b'')
+        self.assertEqual(self.rle.encode(b'B', final=False), b'12W')
+        self.assertEqual(self.rle.encode(b'', final=False), b'')
+        self.assertEqual(self.rle.encode(b'B'), b'BB')
+        self.assertEqual(self.rle.encode(b'a', final=False), b'')
+        self.rle.reset()
+        self.assertEqual(self.rle.encode(b'b'), b'b')
+
+        for size in (1, 2, 3, 7, 64):
+            self.assertEqual(
+                b''.join(
+                    self.rle.iterencode(
+                        self.bws[i : i + size]
+                        for i in range(0, len(self.bws), size)
+                    )
+                ),
+                b'12WB12W3B24WB14W',
+            )
+        self.assertEqual(list(self.rle.iterencode([])), [])
+
+    def test_streaming_rle_decode(self):
+        """Test abydos.compression.StreamingRLE.decode."""
+        self.assertEqual(self.rle.decode(b''), b'')
+        self.assertEqual(self.rle.decode(b'banana'), b'banana')
+        self.assertEqual(self.rle.decode(b'12WB12W3B24WB14W'), self.bws)
+        self.assertEqual(self.rle.decode(b'12W1B12W3B24W1B14W'), self.bws)
+        self.assertEqual(self.rle.decode(b'Schi3fahrt'), b'Schifffahrt')
+        self.assertEqual(self.rle.decode(b'Schi3fahrt12'), b'Schifffahrt')
+
+        # counts held across chunks
+        self.assertEqual(self.rle.decode(b'ab1', final=False), b'ab')
+        self.assertEqual(self.rle.decode(b'2', final=False), b'')
+        self.assertEqual(self.rle.decode(b'c'), b'c' * 12)
+        self.assertEqual(self.rle.decode(b'3', final=False), b'')
+        self.rle.reset()
+        self.assertEqual(self.rle.decode(b'a'), b'a')
+
+        for size in (1, 2, 3, 7, 64):
+            encoded = b'12W1B12W3B24W1B14W'
+            self.assertEqual(
+                b''.join(
+                    self.rle.iterdecode(
+                        memoryview(encoded)[i : i + size]
+                        for i in range(0, len(encoded), size)
+                    )
+                ),
+                self.bws,
+            )
+        self.assertEqual(list(self.rle.iterdecode([])), [])
+
+    def test_streaming_rle_str_compatibility(self):
+        """Test abydos.compression.StreamingRLE against RLE."""
+        for text in (
+            'aaabaabababa',
+            'Schifffahrt',
+            self.bws.decode('ascii'),
+            self.bwt.encode('Niall Noígíallach'),
+            self.bwt.encode('WWWWWWWWWWWWBWWWWWWWWWWWWBBB' * 100),
+        ):
+            data = text.encode('utf-8')
+            encoded = self.str_rle.encode(text).encode('utf-8')
+            self.assertEqual(self.rle.encode(data), encoded)
+            self.assertEqual(self.rle.decode(encoded), data)
+
+    def test_streaming_rle_bwt_roundtripping(self):
+        """Test abydos.compression.StreamingRLE & BWT roundtripping."""
+        for text in (
+            '',
+            'banana',
+            'Niall Noígíallach',
+            'WWWWWWWWWWWWBWWWWWWWWWWWWBBB' * 100,
+        ):
+            encoded = self.rle.encode(self.bwt.encode(text).encode('utf-8'))
+            self.assertEqual(
+                self.bwt.decode(self.rle.decode(encoded).decode('utf-8')),
+                text,
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
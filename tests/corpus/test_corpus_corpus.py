@@ -19,9 +19,12 @@
 This module contains unit tests for abydos.corpus.Corpus
 """
 
+import os
+import tempfile
 import unittest
 
 from abydos.corpus import Corpus
+from abydos.corpus._corpus import _split_stream
 from abydos.tokenizer import QSkipgrams
 
 
@@ -274,6 +277,97 @@ class CorpusTestCases(unittest.TestCase):
             wiki_idf_corpus.idf('A', lambda w: w.upper()), 0.69314718056
         )
 
+    def test_corpus_streaming(self):
+        """Test abydos.corpus.Corpus.from_file & from_iterable."""
+        docs = self.sotu2015_sample.split('\n\n')
+        stream = Corpus.from_iterable(
+            docs, filter_chars='.?-;,:', stop_words=['the', 'and']
+        )
+        listed = Corpus(
+            self.sotu2015_sample,
+            filter_chars='.?-;,:',
+            stop_words=['the', 'and'],
+        )
+        self.assertEqual(stream.corpus, [])
+        self.assertEqual(stream.docs(), listed.docs())
+        self.assertEqual(list(stream.iter_docs()), listed.docs())
+        self.assertEqual(list(stream.iter_sents()), listed.sents())
+        self.assertEqual(list(stream.iter_words()), listed.words())
+        self.assertEqual(stream.docs_of_words(), listed.docs_of_words())
+        self.assertEqual(stream.raw(), listed.raw())
+        self.assertEqual(stream.idf('America'), listed.idf('America'))
+        self.assertNotIn('the', stream.words())
+
+        # a one-pass iterator yields its documents once
+        once = Corpus.from_iterable(iter(docs))
+        self.assertEqual(len(once.sents()), len(self.sotu2015_corpus.sents()))
+        self.assertEqual(once.sents(), [])
+
+        handle, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8') as corpus_file:
+                corpus_file.write(self.sotu2015_sample)
+            for chunk_size in (1, 2, 7, 1 << 20):
+                from_file = Corpus.from_file(
+                    path, filter_chars='.?-;,:', chunk_size=chunk_size
+                )
+                self.assertEqual(from_file.docs(), self.sotu2015_corpus.docs())
+                # the file is reread on each pass
+                self.assertEqual(
+                    from_file.words(), self.sotu2015_corpus.words()
+                )
+            from_file = Corpus.from_file(path, doc_split='\n', chunk_size=3)
+            self.assertEqual(
+                from_file.docs(), Corpus(self.sotu2015_sample, '\n').docs()
+            )
+        finally:
+            os.remove(path)
+
+    def test_corpus_compact(self):
+        """Test abydos.corpus.Corpus.compact."""
+        corpus = Corpus(self.sotu2015_sample, filter_chars='.?-;,:')
+        corpus.compact()
+        self.assertEqual(corpus.corpus, [])
+        self.assertEqual(corpus.docs(), self.sotu2015_corpus.docs())
+        self.assertEqual(corpus.words(), self.sotu2015_corpus.words())
+        self.assertEqual(corpus.raw(), self.sotu2015_corpus.raw())
+        for term in ('America', 'the', 'we', 'trolley'):
+            self.assertEqual(corpus.idf(term), self.sotu2015_corpus.idf(term))
+        self.assertEqual(
+            corpus.idf('A', lambda w: w.upper()),
+            self.sotu2015_corpus.idf('A', lambda w: w.upper()),
+        )
+
+        # a one-pass stream is read once and held compactly
+        stream = Corpus.from_iterable(
+            iter(self.sotu2015_sample.split('\n\n')), filter_chars='.?-;,:'
+        )
+        stream.compact()
+        self.assertEqual(stream.sents(), self.sotu2015_corpus.sents())
+        self.assertEqual(stream.sents(), self.sotu2015_corpus.sents())
+
+        empty = Corpus()
+        empty.compact()
+        self.assertEqual(empty.docs(), [])
+        self.assertEqual(empty.idf('the'), float('inf'))
+
+    def test_corpus_split_stream(self):
+        """Test abydos.corpus._corpus._split_stream."""
+        text = 'ab\n\naab\n\n\nb\naaab\n\n'
+        for sep in ('\n', '\n\n', 'aa', 'ab\n'):
+            for size in range(1, len(text) + 1):
+                chunks = [
+                    text[i : i + size] for i in range(0, len(text), size)
+                ]
+                self.assertEqual(
+                    list(_split_stream(chunks, sep)), text.split(sep)
+                )
+        self.assertEqual(list(_split_stream([], '\n\n')), [''])
+        self.assertEqual(
+            list(_split_stream(['x' * 100] * 100 + ['\n\ny'], '\n\n')),
+            ['x' * 10000, 'y'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,10 @@
 This module contains unit tests for abydos.corpus._n_gram_corpus
 """
 
+import gzip
+import os
+import shutil
+import tempfile
 import unittest
 from collections import Counter
 
@@ -180,6 +184,23 @@ class NGramCorpusTestCases(unittest.TestCase):
             self.sotu_ngcorpus_5.get_count('<SOS> And'),
         )
 
+    def test_corpus_importer_streaming(self):
+        """Test abydos.corpus.NGramCorpus.corpus_importer from a stream."""
+        stream = Corpus.from_iterable(
+            self.sotu2015_sample.split('\n\n'), filter_chars='.?-;,:'
+        )
+        ngcorpus = NGramCorpus()
+        ngcorpus.corpus_importer(stream, n_val=3, bos='', eos='<EOS>')
+        expected = NGramCorpus()
+        expected.corpus_importer(
+            self.sotu2015_corpus, n_val=3, bos='', eos='<EOS>'
+        )
+        self.assertEqual(ngcorpus.ngcorpus, expected.ngcorpus)
+        self.assertEqual(ngcorpus.get_count('to come <EOS>'), 1)
+
+        # importing does not alter the sentences of the corpus
+        self.assertNotIn('<EOS>', self.sotu2015_corpus.words())
+
     def test_gng_importer(self):
         """Test abydos.corpus.NGramCorpus.gng_importer."""
         self.assertIsInstance(self.simple_corpus, NGramCorpus)
@@ -188,6 +209,46 @@ class NGramCorpusTestCases(unittest.TestCase):
         self.assertEqual(self.simple_corpus.get_count('the'), 20)
         self.assertEqual(self.double_corpus.get_count('the'), 40)
 
+    def test_gng_importer_many(self):
+        """Test abydos.corpus.NGramCorpus.gng_importer_many."""
+        tempdir = tempfile.mkdtemp()
+        try:
+            trigrams = _corpus_file('googlebooks-ger-all-3gram-20120701-yp')
+            gz_path = os.path.join(tempdir, 'trigrams.gz')
+            with open(trigrams, 'rb') as shard:
+                with gzip.open(gz_path, 'wb') as gz_shard:
+                    gz_shard.write(shard.read())
+            shards = [
+                _corpus_file('googlebooks-ger-all-2gram-20120701-yp'),
+                gz_path,
+                _corpus_file('simple-ngrams.txt'),
+                _corpus_file('googlebooks-ger-all-2gram-20120701-yp'),
+            ]
+
+            expected = NGramCorpus()
+            for shard in shards[:1] + [trigrams] + shards[2:]:
+                expected.gng_importer(shard)
+            ngrams = [
+                list(ngram)
+                for ngram, _ in expected._iter_ngcorpus(expected.ngcorpus)
+            ]
+
+            for n_jobs, compact in ((1, False), (2, False), (2, True)):
+                ngcorpus = NGramCorpus()
+                stats = ngcorpus.gng_importer_many(shards, n_jobs, compact)
+                if compact:
+                    self.assertEqual(ngcorpus.ngcorpus, Counter())
+                else:
+                    self.assertEqual(ngcorpus.ngcorpus, expected.ngcorpus)
+                for ngram in ngrams:
+                    self.assertEqual(
+                        ngcorpus.get_count(ngram), expected.get_count(ngram)
+                    )
+                self.assertEqual(stats['files'], 4)
+                self.assertEqual(stats['lines'], 2 * 49310 + 73924 + 16)
+        finally:
+            shutil.rmtree(tempdir)
+
     def test_get_count(self):
         """Test abydos.corpus.NGramCorpus.get_count."""
         # string-style tests
@@ -200,6 +261,33 @@ class NGramCorpusTestCases(unittest.TestCase):
         self.assertEqual(self.simple_corpus.get_count(['the', 'quick']), 2)
         self.assertEqual(self.simple_corpus.get_count(['trolley']), 0)
 
+    def test_compact(self):
+        """Test abydos.corpus.NGramCorpus.compact."""
+        ngcorpus = NGramCorpus()
+        ngcorpus.corpus_importer(self.sotu2015_corpus, 3, '<SOS>', '<EOS>')
+        ngcorpus.compact()
+        self.assertEqual(ngcorpus.ngcorpus, Counter())
+        for ngram in ('the', 'to come', '<SOS> And', 'And we', 'a b c d'):
+            self.assertEqual(
+                ngcorpus.get_count(ngram),
+                self.sotu_ngcorpus_tri.get_count(ngram),
+            )
+        self.assertEqual(ngcorpus.get_count(['the']), 19)
+        self.assertEqual(ngcorpus.get_count('trolley'), 0)
+
+        # n-grams added after compacting are counted with the compacted ones
+        ngcorpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+        self.assertEqual(ngcorpus.get_count('the'), 39)
+        self.assertEqual(ngcorpus.get_count('the quick'), 2)
+        ngcorpus.compact()
+        self.assertEqual(ngcorpus.get_count('the'), 39)
+        self.assertEqual(ngcorpus.get_count('the quick'), 2)
+        self.assertEqual(ngcorpus.get_count('to come'), 2)
+
+        empty = NGramCorpus()
+        empty.compact()
+        self.assertEqual(empty.get_count('the'), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,7 +19,10 @@
 This module contains unit tests for abydos.corpus._unigram_corpus
 """
 
+import gzip
 import os
+import pickle
+import shutil
 import sys
 import tempfile
 import unittest
@@ -161,6 +164,94 @@ class UnigramCorpusTestCases(unittest.TestCase):
         os.close(handle)
         os.remove(path)
 
+    def test_unigram_corpus_save_load_table(self):
+        """Test abydos.corpus.UnigramCorpus.save_table & .load_table."""
+        handle, path = tempfile.mkstemp('.unigrams')
+        os.close(handle)
+        try:
+            for corpus in (
+                self.simple_corpus,
+                self.sotu2015_corpus,
+                self.pos_corpus,
+            ):
+                corpus.save_table(path)
+                table = UnigramCorpus()
+                table.load_table(path)
+                self.assertEqual(table.doc_count, corpus.doc_count)
+                self.assertEqual(len(table.corpus), len(corpus.corpus))
+                self.assertEqual(dict(table.corpus), dict(corpus.corpus))
+                for term in list(corpus.corpus) + ['trolley', '', 'zzz']:
+                    self.assertEqual(table.idf(term), corpus.idf(term))
+                self.assertNotIn(None, table.corpus)
+                self.assertRaises(KeyError, table.corpus.__getitem__, 'zzz')
+                self.assertIs(type(table.corpus['the'][0]), int)
+
+                # a loaded table is read-only
+                version = table._version  # noqa: SF01
+                self.assertRaises(TypeError, table.add_document, 'the end')
+                self.assertEqual(table._version, version)  # noqa: SF01
+
+                copy = pickle.loads(pickle.dumps(table))
+                self.assertEqual(copy.idf('the'), corpus.idf('the'))
+                copy.corpus.close()
+                table.corpus.close()
+
+            empty = UnigramCorpus()
+            empty.save_table(path)
+            empty.load_table(path)
+            self.assertEqual(len(empty.corpus), 0)
+            self.assertEqual(empty.idf('the'), float('inf'))
+            empty.corpus.close()
+
+            with open(path, 'wb') as table_file:
+                table_file.write(b'short')
+            self.assertRaises(ValueError, empty.load_table, path)
+        finally:
+            os.remove(path)
+
+    def test_unigram_corpus_gng_importer_many(self):
+        """Test abydos.corpus.UnigramCorpus.gng_importer_many."""
+        tempdir = tempfile.mkdtemp()
+        try:
+            gz_path = os.path.join(tempdir, 'simple-ngrams-pos.txt.gz')
+            with open(_corpus_file('simple-ngrams-pos.txt'), 'rb') as shard:
+                with gzip.open(gz_path, 'wb') as gz_shard:
+                    gz_shard.write(shard.read())
+            shards = [
+                _corpus_file('simple-ngrams.txt'),
+                gz_path,
+                _corpus_file('simple-ngrams.txt'),
+            ]
+
+            for kwargs in (
+                {},
+                {'word_transform': Soundex().encode},
+                {'word_tokenizer': QSkipgrams(qval=3, start_stop='')},
+            ):
+                expected = UnigramCorpus(**kwargs)
+                for shard in (
+                    'simple-ngrams.txt',
+                    'simple-ngrams-pos.txt',
+                    'simple-ngrams.txt',
+                ):
+                    expected.gng_importer(_corpus_file(shard))
+                for n_jobs in (1, 2):
+                    corpus = UnigramCorpus(**kwargs)
+                    stats = corpus.gng_importer_many(shards, n_jobs=n_jobs)
+                    self.assertEqual(
+                        dict(corpus.corpus), dict(expected.corpus)
+                    )
+                    self.assertEqual(corpus.doc_count, expected.doc_count)
+                    self.assertEqual(stats['files'], 3)
+                    self.assertEqual(stats['lines'], 40)
+                    self.assertGreater(stats['lines_per_second'], 0)
+
+            corpus = UnigramCorpus()
+            self.assertEqual(corpus.gng_importer_many([])['lines'], 0)
+            self.assertEqual(len(corpus.corpus), 0)
+        finally:
+            shutil.rmtree(tempdir)
+
     def test_unigram_corpus_idf(self):
         """Test abydos.corpus.UnigramCorpus.idf."""
         # string-style tests
@@ -511,6 +511,56 @@ class ALINETestCases(unittest.TestCase):
             [(163.0, '‖ k ɒ g n ei t ‖', '‖ k o g n aː t ‖ us')],
         )
 
+    def test_aline_alignments_score_only(self):
+        """Test abydos.distance.ALINE.alignments with score_only."""
+        self.assertEqual(self.cmp.alignments('', '', score_only=True), 0.0)
+        self.assertEqual(self.cmp.alignments('a', '', score_only=True), 0.0)
+        self.assertEqual(
+            self.cmp.alignments('niall', 'nigel', score_only=True), 95.0
+        )
+
+        for cmp in (
+            self.cmp,
+            ALINE(mode='global'),
+            ALINE(mode='half-local'),
+            ALINE(mode='semi-global'),
+            ALINE(epsilon=0.2),
+        ):
+            for src, tar in (
+                ('driy', 'tres'),
+                ('tuwz', 'dentis'),
+                ('colin', 'coiln'),
+                ('atcaacgagt', 'aacgattag'),
+            ):
+                self.assertEqual(
+                    cmp.alignments(src, tar, score_only=True),
+                    cmp.alignments(src, tar)[0][0],
+                )
+
+    def test_aline_iter_alignments(self):
+        """Test abydos.distance.ALINE.iter_alignments."""
+        cmp = ALINE(mode='global')
+        self.assertEqual(list(cmp.iter_alignments('', '')), [])
+        self.assertEqual(list(cmp.iter_alignments('', 'a')), [])
+
+        alignments = cmp.iter_alignments('tuwz', 'dentis')
+        self.assertEqual(
+            next(alignments), (45.0, '‖ - - - t uw z ‖', '‖ d e n t i  s ‖')
+        )
+        self.assertEqual(
+            next(alignments), (45.0, '‖ - - t  uw z ‖', '‖ d e nt i  s ‖')
+        )
+        self.assertRaises(StopIteration, next, alignments)
+
+        self.assertEqual(
+            list(cmp.iter_alignments('tuwz', 'dentis', max_count=1)),
+            [(45.0, '‖ - - - t uw z ‖', '‖ d e n t i  s ‖')],
+        )
+        self.assertEqual(
+            sorted(cmp.iter_alignments('atcaacgagt', 'aacgattag')),
+            sorted(cmp.alignments('atcaacgagt', 'aacgattag')),
+        )
+
     def test_aline_alignment(self):
         """Test abydos.distance.ALINE.alignment."""
         self.assertEqual(
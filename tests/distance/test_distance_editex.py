@@ -98,6 +98,33 @@ class EditexTestCases(unittest.TestCase):
             self.cmp_taper.dist('nelson', 'neilsen'), 0.123376623
         )
 
+    def test_editex_dist_many(self):
+        """Test abydos.distance.Editex.dist_many."""
+        targets = ['', 'nelson', 'neilsen', 'NEILSEN', 'neal', 'nîäll', 'ab']
+        for cmp in (self.cmp, self.cmp_local, self.cmp_taper):
+            self.assertEqual(cmp.dist_many('niall', []), [])
+            self.assertEqual(
+                cmp.dist_many('niall', targets),
+                [cmp.dist('niall', tar) for tar in targets],
+            )
+            self.assertEqual(
+                cmp.dist_many('', targets),
+                [cmp.dist('', tar) for tar in targets],
+            )
+
+    def test_editex_cost_tables(self):
+        """Test abydos.distance.Editex's cost tables."""
+        cmp = Editex(cost=(0, 3, 5))
+        # r(D,T) is the same-group cost, r(D,H) is a mismatch
+        self.assertEqual(cmp.dist_abs('adz', 'atz'), 3)
+        self.assertEqual(cmp.dist_abs('adz', 'ahz'), 5)
+        # d(H,x) is the same-group cost, d(x,H) is r(x,H)
+        self.assertEqual(cmp.dist_abs('ahb', 'ah'), 3)
+        self.assertEqual(cmp.dist_abs('ahb', 'ab'), 5)
+        # characters outside A-Z compare only by identity
+        self.assertEqual(cmp.dist_abs('a1z', 'a2z'), 5)
+        self.assertEqual(cmp.dist_abs('a1z', 'a1z'), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -89,6 +89,37 @@ class HigueraMicoTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 0.5
         )
 
+    def test_higuera_mico_max_dist(self):
+        """Test abydos.distance.HigueraMico with max_dist."""
+        pairs = [
+            ('', 'abc'),
+            ('abc', ''),
+            ('abcd', 'efgh'),
+            ('Nigel', 'Niall'),
+            ('Colin', 'Coiln'),
+            ('ATCAACGAGT', 'AACGATTAG'),
+            ('aluminum', 'Catalan'),
+        ]
+        for src, tar in pairs:
+            self.assertLessEqual(
+                self.cmp._lower_bound(src, tar), self.cmp.dist_abs(src, tar)
+            )
+
+        cmp = HigueraMico(max_dist=0.5)
+        self.assertEqual(cmp.dist_abs('abc', 'abc'), 0.0)
+        self.assertEqual(cmp.dist_abs('abc', ''), float('inf'))
+        self.assertEqual(cmp.dist_abs('abcd', 'efgh'), float('inf'))
+        self.assertEqual(cmp.dist('abcd', 'efgh'), 1.0)
+        self.assertAlmostEqual(cmp.dist_abs('Nigel', 'Niall'), 0.4)
+        self.assertEqual(cmp.dist_abs('aluminum', 'Catalan'), float('inf'))
+
+        # Pairs that are not pruned have their exact distance
+        cmp = HigueraMico(max_dist=2.0)
+        for src, tar in pairs:
+            self.assertEqual(
+                cmp.dist_abs(src, tar), self.cmp.dist_abs(src, tar)
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -133,6 +133,47 @@ class JaroWinklerTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(self.jaro_winkler.dist('ABCD', 'EFGH'), 1.0)
 
+    def test_sim_many_jaro_winkler(self):
+        """Test abydos.distance.JaroWinkler.sim_many & ._sim_bounds."""
+        names = [
+            '',
+            ' ',
+            'MARTHA',
+            'MARHTA',
+            'MARTHA ',
+            'DWAYNE',
+            'DUANE',
+            'DIXON',
+            'DICKSONX',
+            'DICKSON',
+            'ABCD',
+            'DCBA',
+            'EFGH',
+        ]
+        for cmp in (
+            self.jaro,
+            self.jaro_winkler,
+            JaroWinkler(long_strings=True),
+            JaroWinkler(boost_threshold=0.2, scaling_factor=0.25),
+            JaroWinkler(qval=2),
+        ):
+            for src in names:
+                sims = [cmp.sim(src, tar) for tar in names]
+                self.assertEqual(cmp.sim_many(src, names), sims)
+                for bound, sim in zip(cmp._sim_bounds(src, names), sims):
+                    self.assertGreaterEqual(bound, sim)
+
+        self.assertEqual(
+            self.jaro_winkler._sim_bounds('ABCD', ['EFGH', 'ABCD', '']),
+            [0.0, 1.0, 0.0],
+        )
+        self.assertEqual(
+            JaroWinkler(qval=2)._sim_bounds('ABCD', ['EFGH']), [1.0]
+        )
+        self.assertRaises(
+            ValueError, JaroWinkler(boost_threshold=2).sim_many, 'ab', ['ba']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -36,6 +36,9 @@ class NCDarithTestCases(unittest.TestCase):
     arith = Arithmetic(' '.join(NIALL))
     cmp = NCDarith()
     cmp_probs = NCDarith(arith.get_probs())
+    cmp_range = NCDarith(coder='range')
+    cmp_range_probs = NCDarith(arith.get_probs(), coder='range')
+    cmp_estimate = NCDarith(coder='estimate')
 
     def test_ncd_arith_dist(self):
         """Test abydos.distance.NCDarith.dist."""
@@ -62,6 +65,24 @@ class NCDarithTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('Njáll', 'Njall'), 0.75)
         self.assertAlmostEqual(self.cmp.dist('Njall', 'Njáll'), 0.75)
 
+        # range coder & code length estimation
+        self.assertEqual(self.cmp_range.dist('', ''), 0)
+        self.assertEqual(self.cmp_estimate.dist('', ''), 0)
+        self.assertGreater(self.cmp_range.dist('a', ''), 0)
+        self.assertGreater(self.cmp_range_probs.dist('a', ''), 0)
+        self.assertGreater(self.cmp_estimate.dist('a', ''), 0)
+
+        self.assertAlmostEqual(self.cmp_range.dist('Niall', 'Neil'), 0.8125)
+        self.assertAlmostEqual(self.cmp_range.dist('Neil', 'Niall'), 0.8125)
+        self.assertAlmostEqual(
+            self.cmp_estimate.dist('Niall', 'Neil'), 0.7749621795424488
+        )
+        self.assertAlmostEqual(
+            self.cmp_estimate.dist('Neil', 'Niall'), 0.7749621795424488
+        )
+
+        self.assertRaises(ValueError, NCDarith, coder='bogus')
+
     def test_ncd_arith_sim(self):
         """Test abydos.distance.NCDarith.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
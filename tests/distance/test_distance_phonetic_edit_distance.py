@@ -136,6 +136,38 @@ class PhoneticEditDistanceTestCases(unittest.TestCase):
             (0.06451612903225801, 'Niel', 'Neil'),
         )
 
+    def test_phonetic_edit_distance_alignment_matrix(self):
+        """Test abydos.distance.PhoneticEditDistance._alignment_matrix."""
+        for ped in (self.ped, PhoneticEditDistance(mode='osa')):
+            for src, tar in (
+                ('Niel', 'Neil'),
+                ('ATCAACGAGT', 'AACGATTAG'),
+                ('abab', 'baba'),
+            ):
+                d_mat, trace_mat = ped._alignment_matrix(  # noqa: SF01
+                    src, tar
+                )
+                self.assertEqual(d_mat.shape, (len(src) + 1, len(tar) + 1))
+                self.assertEqual(trace_mat.shape, d_mat.shape)
+                self.assertEqual(
+                    d_mat.tolist(),
+                    ped._alignment_matrix(  # noqa: SF01
+                        src, tar, backtrace=False
+                    ).tolist(),
+                )
+                # the score-only pass retains only the final rows
+                self.assertEqual(
+                    ped.dist_abs(src, tar), d_mat[len(src), len(tar)]
+                )
+
+        # characters without phones of their own are treated as unknown
+        self.assertEqual(
+            self.ped._alignment_matrix(  # noqa: SF01
+                't̪a', 'ta', backtrace=False
+            ).shape,
+            (4, 3),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -23,11 +23,21 @@ import os
 import unittest
 
 from abydos.corpus import UnigramCorpus
-from abydos.distance import Levenshtein, SoftTFIDF
-from abydos.tokenizer import QGrams
+from abydos.distance import JaroWinkler, Levenshtein, SoftTFIDF, _Distance
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
 from abydos.util import download_package, package_path
 
 
+class _PlainJaroWinkler(_Distance):
+    """Jaro-Winkler, without bounds or a one-to-many kernel."""
+
+    _jw = JaroWinkler()
+
+    def sim(self, src, tar):
+        """Return the Jaro-Winkler similarity of two strings."""
+        return self._jw.sim(src, tar)
+
+
 class SoftTFIDFTestCases(unittest.TestCase):
     """Test SoftTFIDF functions.
 
@@ -120,6 +130,43 @@ class SoftTFIDFTestCases(unittest.TestCase):
         self.assertLess(cmp_q3_03.dist('Colin', 'Coiln'), 0.5)
         self.assertLess(cmp_q3_03.dist('Coiln', 'Colin'), 0.5)
 
+    def test_softtf_idf_pruning(self):
+        """Test abydos.distance.SoftTFIDF pruning & caching."""
+        names = [
+            'Niall Neil',
+            'Nigel Neal',
+            'Colin Coiln',
+            'Martha Marhta Dwayne',
+            'Duane Dixon Dickson',
+            'Dickson Dixon',
+            'Acme Widgets Ltd',
+            'Acme Widget Limited',
+        ]
+        for threshold in (0.5, 0.8, 0.9, 0.95):
+            plain = SoftTFIDF(
+                tokenizer=WhitespaceTokenizer(),
+                metric=_PlainJaroWinkler(),
+                threshold=threshold,
+            )
+            pruned = SoftTFIDF(
+                tokenizer=WhitespaceTokenizer(), threshold=threshold
+            )
+            small_cache = SoftTFIDF(
+                tokenizer=WhitespaceTokenizer(), threshold=threshold
+            )
+            small_cache._metric_cache_size = 3
+            for _ in range(2):
+                for src in names:
+                    for tar in names:
+                        sim = plain.sim(src, tar)
+                        self.assertEqual(pruned.sim(src, tar), sim)
+                        self.assertEqual(small_cache.sim(src, tar), sim)
+            self.assertLessEqual(len(small_cache._metric_cache), 3)
+        self.assertEqual(
+            self.cmp.sim('Nigel', 'Niall'),
+            SoftTFIDF(metric=_PlainJaroWinkler()).sim('Nigel', 'Niall'),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
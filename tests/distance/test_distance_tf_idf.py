@@ -93,6 +93,37 @@ class TFIDFTestCases(unittest.TestCase):
         self.assertAlmostEqual(cmp_q3.dist('Colin', 'Coiln'), 0.885132437)
         self.assertAlmostEqual(cmp_q3.dist('Coiln', 'Colin'), 0.885132437)
 
+    def test_tf_idf_sim_many(self):
+        """Test abydos.distance.TFIDF.sim_many."""
+        targets = ['Niall', 'Neil', 'Nigel', 'Colin', '', 'Neal']
+
+        # Without a corpus, sim_many is sim for each target
+        self.assertEqual(
+            self.cmp.sim_many('Nigel', targets),
+            [self.cmp.sim('Nigel', tar) for tar in targets],
+        )
+
+        q2_corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        for doc in ('Niall Neil Neal', 'Nigel Colin', 'Coiln Niall', 'Neal'):
+            q2_corpus.add_document(doc)
+        cmp_q2 = TFIDF(tokenizer=QGrams(qval=2), corpus=q2_corpus)
+        for src in ('Nigel', 'Niall', 'xyz', ''):
+            self.assertEqual(
+                cmp_q2.sim_many(src, targets),
+                [cmp_q2.sim(src, tar) for tar in targets],
+            )
+
+        # The cached IDFs are discarded when the corpus changes
+        sim = cmp_q2.sim('Nigel', 'Niall')
+        q2_corpus.add_document('Nigel Nigel Nigel')
+        self.assertNotEqual(cmp_q2.sim('Nigel', 'Niall'), sim)
+        self.assertEqual(
+            cmp_q2.sim('Nigel', 'Niall'),
+            TFIDF(tokenizer=QGrams(qval=2), corpus=q2_corpus).sim(
+                'Nigel', 'Niall'
+            ),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,138 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_tf_idf_index.
+
+This module contains unit tests for abydos.distance.TFIDFIndex
+"""
+
+import unittest
+
+from abydos.corpus import UnigramCorpus
+from abydos.distance import TFIDF, TFIDFIndex
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class TFIDFIndexTestCases(unittest.TestCase):
+    """Test TFIDFIndex functions.
+
+    abydos.distance.TFIDFIndex
+    """
+
+    names = [
+        'Acme Holdings Ltd',
+        'Acme Ltd',
+        'Acme Corp',
+        'Apex Holdings',
+        'Apex Ltd',
+        'Niall Neil & Co',
+        'Nigel Colin Ltd',
+        'Colin Neal Inc',
+        'Coiln Nigel',
+        'Acme Ltd',
+        '',
+    ]
+
+    def setUp(self):
+        """Create word & q-gram corpora of the names."""
+        self.corpus = UnigramCorpus()
+        self.q2_corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        for name in self.names:
+            self.corpus.add_document(name)
+            self.q2_corpus.add_document(name)
+
+    def _brute_top_k(self, cmp, names, query, k):
+        sims = [(-cmp.sim(query, name), num) for num, name in enumerate(names)]
+        return [(num, -sim) for sim, num in sorted(sims) if sim < 0][:k]
+
+    def test_tf_idf_index_top_k(self):
+        """Test abydos.distance.TFIDFIndex.top_k."""
+        cmp = TFIDF(tokenizer=WhitespaceTokenizer(), corpus=self.corpus)
+        idx = TFIDFIndex(
+            self.corpus, enumerate(self.names), tokenizer=WhitespaceTokenizer()
+        )
+        self.assertEqual(len(idx), len(self.names))
+        for query in (
+            'Acme',
+            'Acme Ltd',
+            'Apex Holdings Ltd',
+            'Nigel',
+            'Colin Nigel Ltd',
+            'Neal & Co',
+            'Ltd',
+        ):
+            for k in (1, 2, 3, 5, 20):
+                self.assertEqual(
+                    idx.top_k(query, k),
+                    self._brute_top_k(cmp, self.names, query, k),
+                )
+
+        # the duplicate 'Acme Ltd' ties, and ties are in order of addition
+        self.assertEqual(idx.top_k('Acme Ltd', 2), [(1, 1.0), (9, 1.0)])
+
+        # queries with no or unknown tokens match nothing
+        self.assertEqual(idx.top_k(''), [])
+        self.assertEqual(idx.top_k('Xyzzy'), [])
+        self.assertEqual(idx.top_k('Acme Xyzzy'), [])
+        self.assertEqual(idx.top_k('Acme', 0), [])
+
+        words = sorted({word for name in self.names for word in name.split()})
+        cmp = TFIDF(tokenizer=QGrams(qval=2), corpus=self.q2_corpus)
+        idx = TFIDFIndex(
+            self.q2_corpus, enumerate(words), tokenizer=QGrams(qval=2)
+        )
+        for query in ('Acme', 'Nial', 'Colin', 'Coiln', 'Hold', 'Nigel'):
+            for k in (1, 3, 10):
+                self.assertEqual(
+                    idx.top_k(query, k),
+                    self._brute_top_k(cmp, words, query, k),
+                )
+
+    def test_tf_idf_index_update(self):
+        """Test abydos.distance.TFIDFIndex.add & .update."""
+        cmp = TFIDF(tokenizer=QGrams(qval=2), corpus=self.q2_corpus)
+        words = [name.split()[0] for name in self.names if name]
+        idx = TFIDFIndex(self.q2_corpus, tokenizer=QGrams(qval=2))
+        self.assertEqual(idx.top_k('Acme'), [])
+
+        idx.update({num: word for num, word in enumerate(words[:5])})
+        self.assertEqual(
+            idx.top_k('Acme', 20), self._brute_top_k(cmp, words[:5], 'Acme', 5)
+        )
+        for num, word in enumerate(words[5:], 5):
+            idx.add(num, word)
+        self.assertEqual(len(idx), len(words))
+        for query in ('Acme', 'Nigel', 'Colin'):
+            self.assertEqual(
+                idx.top_k(query, 4), self._brute_top_k(cmp, words, query, 4)
+            )
+
+        # the records are reweighted when the corpus changes
+        self.q2_corpus.add_document('Acme Acme Apex')
+        self.assertEqual(
+            idx.top_k('Apex', 4), self._brute_top_k(cmp, words, 'Apex', 4)
+        )
+
+    def test_tf_idf_index_errors(self):
+        """Test abydos.distance.TFIDFIndex errors."""
+        with self.assertRaises(ValueError):
+            TFIDFIndex(None)
+        with self.assertRaises(ValueError):
+            TFIDFIndex(self.corpus, intersection_type='soft')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -64,6 +64,24 @@ class TypoTestCases(unittest.TestCase):
         self.assertEqual(self.cmp_auto.dist_abs('비빔밥', 'Bibimbap'), 11)
 
         self.assertRaises(ValueError, self.cmp.dist_abs, 'asdf', 'Ösdf')
+        self.assertRaises(ValueError, Typo, metric='chebyshev')
+
+    def test_typo_layout_tables(self):
+        """Test abydos.distance.Typo's precomputed layout tables."""
+        index, positions = Typo._layout_keys('QWERTY')
+        self.assertEqual(len(index), 95)
+        self.assertEqual(positions[index['a']], (0, 2, 1))
+        self.assertEqual(positions[index['A']], (1, 2, 1))
+        self.assertEqual(positions[index[' ']], (0, 4, 3))
+
+        index, costs = Typo(metric='manhattan')._layout_sub_costs('QWERTY')
+        self.assertEqual(costs[index['a'], index['s']], 0.5)
+        self.assertEqual(costs[index['a'], index['S']], 0.75)
+        self.assertEqual(costs[index['a'], index['a']], 0.0)
+
+        index, costs = self.cmp_auto._layout_sub_costs('QWERTY')
+        self.assertEqual(costs[index['a'], -1], 2.0)
+        self.assertEqual(costs[-1, -1], 2.0)
 
     def test_typo_sim(self):
         """Test abydos.distance.Typo.sim."""
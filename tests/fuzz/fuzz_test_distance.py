@@ -38,6 +38,7 @@ for name, obj in getmembers(ad):
             'Gotoh',
             'SmithWaterman',
             'NeedlemanWunsch',
+            'TFIDFIndex',
         }:
             continue
 
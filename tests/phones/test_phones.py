@@ -23,12 +23,18 @@ import unittest
 from math import isnan
 
 from abydos.phones import (
+    FeatureComparator,
     cmp_features,
+    cmp_features_matrix,
     get_feature,
     ipa_to_feature_dicts,
     ipa_to_features,
+    ipa_to_features_many,
 )
 
+# noinspection PyProtectedMember
+from abydos.phones._phones import _ipa_segments
+
 
 class PhonesTestCases(unittest.TestCase):
     """Test abydos.phones."""
@@ -121,6 +127,30 @@ class PhonesTestCases(unittest.TestCase):
             [1826957412996131242, -1, 2783233463150095018],
         )
 
+        # multi-character symbols are matched whole, even after another
+        # multi-character symbol
+        self.assertEqual(
+            _ipa_segments('ɲu̯t̟͡θ'), ('ɲ', 'u̯', 't̟͡θ')  # noqa: SF01
+        )
+        self.assertEqual(
+            ipa_to_features('u̯l̴̪'),
+            [2978753018579036586, 2693158446677010854],
+        )
+        # results are memoised, but callers get their own lists
+        feats = ipa_to_features('klø')
+        feats.append(0)
+        self.assertEqual(len(ipa_to_features('klø')), 3)
+
+    def test_phones_ipa_to_features_many(self):
+        """Test abydos.phones.ipa_to_features_many."""
+        self.assertEqual(ipa_to_features_many([]), [])
+        words = ['medçen', 'klø', '', 'i@c', 'klø']
+        feats = ipa_to_features_many(words)
+        self.assertEqual(len(feats), len(words))
+        for word, feat in zip(words, feats):
+            self.assertEqual(feat.dtype.name, 'int64')
+            self.assertEqual(feat.tolist(), ipa_to_features(word))
+
     def test_phones_ipa_to_feature_dicts(self):
         """Test abydos.phones.ipa_to_feature_dicts."""
         self.assertEqual(
@@ -849,6 +879,41 @@ class PhonesTestCases(unittest.TestCase):
         with self.assertRaises(TypeError):
             cmp_features(cced, esh, 10)
 
+    def test_phones_cmp_features_matrix(self):
+        """Test abydos.phones.cmp_features_matrix & FeatureComparator."""
+        feats = ipa_to_features('ʧʃçə@lz') + [0]
+        for weights in (
+            None,
+            [],
+            [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9],
+            {'syllabic': 2, 'consonantal': 0.5, 'voice': 0.25},
+        ):
+            expected = [
+                [cmp_features(f1, f2, weights) for f2 in feats[:5]]
+                for f1 in feats
+            ]
+            matrix = cmp_features_matrix(feats, feats[:5], weights)
+            self.assertEqual(matrix.shape, (len(feats), 5))
+            for row, exp_row in zip(matrix.tolist(), expected):
+                for sim, exp_sim in zip(row, exp_row):
+                    self.assertAlmostEqual(sim, exp_sim)
+
+            cmp = FeatureComparator(weights)
+            self.assertEqual(
+                [cmp.cmp(f1, f2) for f1, f2 in zip(feats, feats[::-1])],
+                [
+                    cmp_features(f1, f2, weights)
+                    for f1, f2 in zip(feats, feats[::-1])
+                ],
+            )
+            self.assertEqual(
+                cmp.cmp_many(feats, feats[::-1]).tolist(),
+                cmp.matrix(feats, feats[::-1]).diagonal().tolist(),
+            )
+
+        self.assertEqual(cmp_features_matrix([], feats).shape, (0, 8))
+        self.assertRaises(TypeError, FeatureComparator, 'weights')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,7 @@ This module contains unit tests for abydos.phonetic._Phonetic
 
 import unittest
 
-from abydos.phonetic import Davidson
+from abydos.phonetic import BeiderMorse, Davidson, Soundex
 
 # noinspection PyProtectedMember
 from abydos.phonetic._phonetic import _Phonetic
@@ -62,6 +62,32 @@ class PhoneticTestCases(unittest.TestCase):
             self.dav.encode_alpha('word'), self.dav.encode('word')
         )
 
+    def test_phonetic_encode_many(self):
+        """Test abydos.phonetic._Phonetic.encode_many."""
+        self.assertEqual(self.pa.encode_many([]), [])
+        self.assertEqual(
+            self.pa.encode_many(['word', 'Word', 'word']),
+            ['word', 'Word', 'word'],
+        )
+
+        words = ['Smith', 'Schmidt', 'Niall', 'Neil', 'Smith', 'Nigel'] * 5
+        for pa in (Soundex(), BeiderMorse(), self.dav):
+            expected = [pa.encode(word) for word in words]
+            self.assertEqual(pa.encode_many(words), expected)
+            self.assertEqual(pa.encode_many(iter(words)), expected)
+            self.assertEqual(
+                pa.encode_many(words, n_jobs=2, chunk_size=2), expected
+            )
+            self.assertEqual(
+                pa.encode_many(words, alpha=True),
+                [pa.encode_alpha(word) for word in words],
+            )
+            array = pa.encode_many(
+                words, n_jobs=0, chunk_size=1, as_array=True
+            )
+            self.assertEqual(array.dtype, object)
+            self.assertEqual(list(array), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,11 +21,13 @@ This module contains unit tests for abydos.phonetic.BeiderMorse
 
 import codecs
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from abydos.phonetic import BeiderMorse
 
 # noinspection PyProtectedMember
 from abydos.phonetic._beider_morse_data import (
+    BMDATA,
     L_ANY,
     L_CYRILLIC,
     L_CZECH,
@@ -798,6 +800,102 @@ class BeiderMorseTestCases(unittest.TestCase):
         self.assertEqual(self.pa._language('ácz', 'gen'), L_ANY)  # noqa: SF01
         self.assertEqual(self.pa._language('átz', 'gen'), L_ANY)  # noqa: SF01
 
+    def test_beider_morse_rule_sets(self):
+        """Test abydos.phonetic.BeiderMorse._rule_sets."""
+        rules, final1, final2 = self.pa._rule_sets(L_GERMAN)  # noqa: SF01
+        self.assertIs(
+            BeiderMorse()._rule_sets(L_GERMAN)[0], rules  # noqa: SF01
+        )
+        self.assertIsNot(
+            BeiderMorse(match_mode='exact')._rule_sets(L_GERMAN)[  # noqa: SF01
+                1
+            ],
+            final1,
+        )
+        self.assertIsNot(
+            BeiderMorse(name_mode='ash')._rule_sets(L_GERMAN)[0],  # noqa: SF01
+            rules,
+        )
+
+        # rules are indexed by the first character of their patterns, in
+        # their original order
+        for char, indexed in rules.items():
+            for pattern, pattern_length, _, _, _ in indexed:
+                self.assertEqual(pattern[:1], char)
+                self.assertEqual(len(pattern), pattern_length)
+        self.assertEqual(
+            [rule[0] for rule in rules['s']][:4], ['ssch', 'sch', 'sp', 'st']
+        )
+
+    def test_beider_morse_language_index(self):
+        """Test abydos.phonetic.BeiderMorse._language_index."""
+        self.assertEqual(self.pa._first_chars('^o'), {'o'})  # noqa: SF01
+        self.assertEqual(
+            self.pa._first_chars('[aeo]tz'), {'a', 'e', 'o'}  # noqa: SF01
+        )
+        self.assertIsNone(self.pa._first_chars('[^aoeiu]rz'))  # noqa: SF01
+        self.assertIsNone(self.pa._first_chars('c?k$'))  # noqa: SF01
+        self.assertIsNone(self.pa._first_chars('(ou|eu)'))  # noqa: SF01
+
+        all_langs, searches, by_char, unindexed = self.pa._language_index(
+            'gen'
+        )  # noqa: SF01
+        self.assertEqual(len(searches), len(BMDATA['gen']['language_rules']))
+        indexed = set(unindexed)
+        for rules in by_char.values():
+            indexed.update(rules)
+        self.assertEqual(indexed, set(range(len(searches))))
+
+        # repeated names are answered from the memo
+        BeiderMorse._language_cache.clear()  # noqa: SF01
+        self.assertEqual(
+            self.pa._language('Renault', 'gen'), L_FRENCH  # noqa: SF01
+        )
+        self.assertIn(
+            ('gen', 'renault'), BeiderMorse._language_cache  # noqa: SF01
+        )
+        self.assertEqual(
+            self.pa._language(' RENAULT', 'gen'), L_FRENCH  # noqa: SF01
+        )
+        self.assertEqual(len(BeiderMorse._language_cache), 1)  # noqa: SF01
+
+        # the memo is shared by threads, even while it evicts names
+        names = ['Renault', 'Schmidt', 'Kowalski', 'Rossi', 'Smith'] * 40
+        expected = [self.pa._language(name, 'gen') for name in names]
+
+        def _detect(_):
+            pa = BeiderMorse()
+            pa._language_cache_size = 2  # noqa: SF01
+            return [pa._language(name, 'gen') for name in names]  # noqa: SF01
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for langs in executor.map(_detect, range(16)):
+                self.assertEqual(langs, expected)
+        BeiderMorse._language_cache.clear()  # noqa: SF01
+
+    def test_beider_morse_phase_times(self):
+        """Test abydos.phonetic.BeiderMorse.get_phase_times."""
+        pa = BeiderMorse()
+        self.assertEqual(
+            pa.get_phase_times(),
+            {
+                'detection': 0.0,
+                'main_rules': 0.0,
+                'final_rules': 0.0,
+                'numbers': 0.0,
+            },
+        )
+        pa.encode('Christopher')
+        times = pa.get_phase_times()
+        self.assertTrue(all(_ > 0.0 for _ in times.values()))
+        pa.reset_phase_times()
+        self.assertEqual(set(pa.get_phase_times().values()), {0.0})
+
+        # a fixed language skips detection
+        pa = BeiderMorse(language_arg='german')
+        pa.encode('Christopher')
+        self.assertEqual(pa.get_phase_times()['detection'], 0.0)
+
     def test_beider_morse_expand_alternates(self):
         """Test abydos.phonetic.BeiderMorse._expand_alternates."""
         self.assertEqual(self.pa._expand_alternates(''), '')  # noqa: SF01
@@ -0,0 +1,161 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic_blocking_index.
+
+This module contains unit tests for abydos.phonetic.BlockingIndex
+"""
+
+import unittest
+from itertools import combinations
+
+from abydos.phonetic import (
+    BeiderMorse,
+    BlockingIndex,
+    DoubleMetaphone,
+    Soundex,
+)
+
+
+class BlockingIndexTestCases(unittest.TestCase):
+    """Test BlockingIndex functions.
+
+    test cases for abydos.phonetic.BlockingIndex
+    """
+
+    names = [
+        'Smith',
+        'Smyth',
+        'Schmidt',
+        'Niall',
+        'Neil',
+        'Nigel',
+        'Knight',
+        'Night',
+        'Thompson',
+        'Tomson',
+    ]
+
+    def test_blocking_index_candidates(self):
+        """Test abydos.phonetic.BlockingIndex.candidates."""
+        idx = BlockingIndex(Soundex, enumerate(self.names))
+        self.assertEqual(idx.candidates('Smith'), {0, 1, 2})
+        self.assertEqual(idx.candidates('Nail'), {3, 4})
+        self.assertEqual(idx.candidates('Night'), {7})
+        self.assertEqual(idx.candidates('Xavier'), set())
+
+        # multi-valued codes place records in several blocks
+        idx = BlockingIndex(DoubleMetaphone(), enumerate(self.names))
+        self.assertEqual(idx.candidates('Schmidt'), {0, 1, 2})
+        self.assertEqual(idx.candidates('Knight'), {6, 7})
+
+        # passes are unioned
+        idx = BlockingIndex(
+            [Soundex(), DoubleMetaphone()], enumerate(self.names)
+        )
+        self.assertEqual(idx.candidates('Night'), {6, 7})
+
+        idx = BlockingIndex(Soundex(), encode_alpha=True)
+        idx.add('a', 'Smith')
+        idx.add('b', 'Schmidt')
+        self.assertEqual(idx.candidates('Smyth'), {'a', 'b'})
+
+        self.assertRaises(TypeError, BlockingIndex, [Soundex(), len])
+
+    def test_blocking_index_candidate_pairs(self):
+        """Test abydos.phonetic.BlockingIndex.candidate_pairs."""
+        for passes in (
+            Soundex(),
+            [Soundex(), DoubleMetaphone()],
+            BeiderMorse(),
+        ):
+            idx = BlockingIndex(passes, enumerate(self.names))
+            pairs = idx.candidate_pairs()
+            # the pairs are exactly those of records sharing a candidate
+            self.assertEqual(
+                pairs,
+                {
+                    (i, j)
+                    for i, j in combinations(range(len(self.names)), 2)
+                    if j in idx.candidates(self.names[i])
+                },
+            )
+        self.assertEqual(BlockingIndex(Soundex()).candidate_pairs(), set())
+
+        # duplicate ids are not paired with themselves
+        idx = BlockingIndex(Soundex(), [(1, 'Smith'), (1, 'Smyth')])
+        self.assertEqual(idx.candidate_pairs(), set())
+
+        # re-added ids are paired in the order they were first added
+        idx = BlockingIndex(
+            Soundex(), {1: 'Smith', 2: 'Schmidt', 3: 'Smyth', 4: 'Jones'}
+        )
+        idx.add(1, 'Smith')
+        idx.add(3, 'Jones')
+        self.assertEqual(
+            idx.candidate_pairs(), {(1, 2), (1, 3), (2, 3), (3, 4)}
+        )
+
+    def test_blocking_index_stats(self):
+        """Test abydos.phonetic.BlockingIndex statistics."""
+        idx = BlockingIndex(Soundex(), enumerate(self.names))
+        self.assertEqual(
+            idx.block_sizes(),
+            {
+                (0, 'S530'): 3,
+                (0, 'N400'): 2,
+                (0, 'N240'): 1,
+                (0, 'K523'): 1,
+                (0, 'N230'): 1,
+                (0, 'T512'): 1,
+                (0, 'T525'): 1,
+            },
+        )
+        self.assertEqual(
+            idx.largest_blocks(2), [(0, 'S530', 3), (0, 'N400', 2)]
+        )
+        stats = idx.block_stats()
+        self.assertEqual(stats['records'], 10)
+        self.assertEqual(stats['blocks'], 7)
+        self.assertEqual(stats['max_size'], 3)
+        self.assertAlmostEqual(stats['mean_size'], 10 / 7)
+        self.assertEqual(stats['comparisons'], 4)
+        self.assertAlmostEqual(stats['reduction_ratio'], 1 - 4 / 45)
+
+        # pairs sharing blocks in several passes, or several codes of one
+        # pass, are compared once
+        records = {1: 'Smith', 2: 'Schmidt', 3: 'Smyth', 4: 'Jones'}
+        for passes in ([Soundex(), DoubleMetaphone()], BeiderMorse()):
+            stats = BlockingIndex(passes, records).block_stats()
+            self.assertEqual(stats['records'], 4)
+            self.assertEqual(stats['comparisons'], 3)
+            self.assertAlmostEqual(stats['reduction_ratio'], 0.5)
+
+        self.assertEqual(
+            BlockingIndex(Soundex()).block_stats(),
+            {
+                'records': 0,
+                'blocks': 0,
+                'max_size': 0,
+                'mean_size': 0.0,
+                'comparisons': 0,
+                'reduction_ratio': 0.0,
+            },
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -112,6 +112,20 @@ class PhonetTestCases(unittest.TestCase):
         self.assertEqual(self.pa_2none.encode('Brückmann'), 'BRUECKMAN')
         self.assertEqual(self.pa_2none.encode('Krauße'), 'KRAUSE')
 
+    def test_phonet_compiled_rules(self):
+        """Test abydos.phonetic.Phonet rule table sharing."""
+        self.assertIs(self.pa_1._phonet_hash, self.pa_2._phonet_hash)
+        self.assertIs(self.pa_1none._alpha_pos, self.pa_2none._alpha_pos)
+        self.assertIsNot(self.pa_1._phonet_hash, self.pa_1none._phonet_hash)
+        self.assertIs(Phonet(lang='fr')._phonet_hash, self.pa._phonet_hash)
+
+        # repeated encoding doesn't alter the shared tables
+        hash_1 = dict(self.pa_1._phonet_hash_1)
+        for _ in range(2):
+            self.assertEqual(self.pa_1.encode('Zedlitz'), 'ZETLIZ')
+            self.assertEqual(self.pa_2.encode('Müller'), 'NILA')
+        self.assertEqual(dict(self.pa_1._phonet_hash_1), hash_1)
+
     def test_phonet_nachnamen(self):
         """Test abydos.phonetic.Phonet (Nachnamen set)."""
         if not ALLOW_RANDOM:
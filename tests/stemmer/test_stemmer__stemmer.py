@@ -21,6 +21,25 @@ This module contains unit tests for abydos.stemmer._Stemmer
 
 import unittest
 
+from abydos.stemmer import (
+    CLEFGerman,
+    CLEFGermanPlus,
+    CLEFSwedish,
+    Caumanns,
+    Lovins,
+    PaiceHusk,
+    Porter,
+    Porter2,
+    SStemmer,
+    Schinke,
+    SnowballDanish,
+    SnowballDutch,
+    SnowballGerman,
+    SnowballNorwegian,
+    SnowballSwedish,
+    UEALite,
+)
+
 # noinspection PyProtectedMember
 from abydos.stemmer._stemmer import _Stemmer
 
@@ -39,6 +58,56 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem(''), '')
         self.assertEqual(self.stmr.stem('word'), 'word')
 
+    stemmers = (
+        Caumanns(),
+        CLEFGerman(),
+        CLEFGermanPlus(),
+        CLEFSwedish(),
+        Lovins(),
+        PaiceHusk(),
+        Porter(),
+        Porter2(),
+        SStemmer(),
+        Schinke(),
+        SnowballDanish(),
+        SnowballDutch(),
+        SnowballGerman(),
+        SnowballNorwegian(),
+        SnowballSwedish(),
+        UEALite(),
+    )
+    tokens = (
+        'the runners were running in the runs and the runner ran '
+        'connections connective Häuser häufig amicitiae'
+    ).split()
+
+    def test__stemmer_stem_many(self):
+        """Test abydos.stemmer._Stemmer.stem_many."""
+        self.assertEqual(self.stmr.stem_many([]), [])
+        self.assertEqual(self.stmr.stem_many(iter(['a', 'b'])), ['a', 'b'])
+        for stmr in self.stemmers:
+            stems = [stmr.stem(token) for token in self.tokens]
+            self.assertEqual(stmr.stem_many(self.tokens), stems)
+        stmr = Porter2()
+        self.assertEqual(
+            stmr.stem_many(self.tokens, n_jobs=2, chunk_size=4),
+            [stmr.stem(token) for token in self.tokens],
+        )
+
+    def test__stemmer_stem_stream(self):
+        """Test abydos.stemmer._Stemmer.stem_stream."""
+        self.assertEqual(list(self.stmr.stem_stream([])), [])
+        for stmr in self.stemmers:
+            stems = [stmr.stem(token) for token in self.tokens]
+            self.assertEqual(
+                list(stmr.stem_stream(iter(self.tokens), chunk_size=3)), stems
+            )
+        stmr = Lovins()
+        self.assertEqual(
+            list(stmr.stem_stream(iter(self.tokens), n_jobs=2, chunk_size=2)),
+            [stmr.stem(token) for token in self.tokens],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,122 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stemmer.test_stemmer_stem_table.
+
+This module contains unit tests for abydos.stemmer.StemTable
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from abydos.stemmer import Lovins, Porter2, SnowballGerman, StemTable
+
+
+class StemTableTestCases(unittest.TestCase):
+    """Test StemTable functions.
+
+    abydos.stemmer.StemTable
+    """
+
+    vocabulary = [
+        'running',
+        'runs',
+        'ran',
+        'connection',
+        'connections',
+        'connective',
+        'Häuser',
+        'häufig',
+        'generously',
+        'running',
+    ]
+
+    def setUp(self):
+        """Create a temporary directory for tables."""
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tempdir)
+
+    def test_stem_table(self):
+        """Test abydos.stemmer.StemTable."""
+        for stemmer in (Porter2(), SnowballGerman(), Lovins()):
+            path = os.path.join(self.tempdir, type(stemmer).__name__)
+            with StemTable.build(stemmer, self.vocabulary, path) as stmr:
+                self.assertEqual(len(stmr), 9)
+                for word in self.vocabulary + ['jumping', 'Bäume', '']:
+                    self.assertEqual(stmr.stem(word), stemmer.stem(word))
+                self.assertIn('Häuser', stmr)
+                self.assertNotIn('jumping', stmr)
+                self.assertNotIn(None, stmr)
+
+    def test_stem_table_build(self):
+        """Test abydos.stemmer.StemTable.build."""
+        stemmer = Porter2()
+        path = os.path.join(self.tempdir, 'parallel')
+        stmr = StemTable.build(
+            stemmer, self.vocabulary, path, n_jobs=2, chunk_size=2
+        )
+        for word in self.vocabulary:
+            self.assertEqual(stmr.stem(word), stemmer.stem(word))
+        stmr.close()
+
+        path = os.path.join(self.tempdir, 'empty')
+        with StemTable.build(stemmer, [], path) as stmr:
+            self.assertEqual(len(stmr), 0)
+            self.assertEqual(stmr.stem('running'), 'run')
+
+    def test_stem_table_open(self):
+        """Test abydos.stemmer.StemTable opening & pickling."""
+        path = os.path.join(self.tempdir, 'porter2')
+        StemTable.build(Porter2(), self.vocabulary, path).close()
+
+        stmr = StemTable(path, Porter2())
+        self.assertEqual(stmr.stem('connections'), 'connect')
+        copy = pickle.loads(pickle.dumps(stmr))
+        self.assertEqual(copy.stem('connections'), 'connect')
+        self.assertEqual(len(copy), 9)
+        copy.close()
+        stmr.close()
+
+        self.assertRaises(ValueError, StemTable, path, Lovins())
+        self.assertRaises(
+            ValueError, StemTable, path, Porter2(early_english=True)
+        )
+
+        path = os.path.join(self.tempdir, 'german')
+        StemTable.build(
+            SnowballGerman(alternate_vowels=True), self.vocabulary, path
+        ).close()
+        self.assertRaises(ValueError, StemTable, path, SnowballGerman())
+        with StemTable(path, SnowballGerman(alternate_vowels=True)) as stmr:
+            self.assertEqual(len(stmr), 9)
+
+        not_a_table = os.path.join(self.tempdir, 'not_a_table')
+        with open(not_a_table, 'wb') as table_file:
+            table_file.write(b'ABSTEM00' + b'\0' * 64)
+        self.assertRaises(ValueError, StemTable, not_a_table, Porter2())
+        with open(not_a_table, 'wb') as table_file:
+            table_file.write(b'short')
+        self.assertRaises(ValueError, StemTable, not_a_table, Porter2())
+
+
+if __name__ == '__main__':
+    unittest.main()
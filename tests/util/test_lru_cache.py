@@ -0,0 +1,93 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_lru_cache.
+
+This module contains unit tests for abydos.util._lru_cache
+"""
+
+import pickle
+import unittest
+
+from abydos.fingerprint import String
+from abydos.phonetic import BeiderMorse, Soundex
+from abydos.stemmer import Porter2
+from abydos.util._lru_cache import _LRUCache
+
+
+class LRUCacheTestCases(unittest.TestCase):
+    """Test cases for abydos.util._lru_cache."""
+
+    def test_lru_cache(self):
+        """Test abydos.util._lru_cache._LRUCache."""
+        stmr = Porter2()
+        cache = _LRUCache(stmr, 'stem', 2)
+        self.assertEqual(cache('running'), 'run')
+        self.assertEqual(cache('runs'), 'run')
+        self.assertEqual(cache('running'), 'run')
+        self.assertEqual(cache('jumps'), 'jump')
+        self.assertEqual(tuple(cache.cache_info()), (1, 3, 1, 2, 2))
+        # 'runs' was least recently used, so it was evicted
+        self.assertEqual(cache('running'), 'run')
+        self.assertEqual(cache('runs'), 'run')
+        self.assertEqual(tuple(cache.cache_info()), (2, 4, 2, 2, 2))
+
+        cache.cache_clear()
+        self.assertEqual(tuple(cache.cache_info()), (0, 0, 0, 2, 0))
+
+        self.assertRaises(ValueError, _LRUCache, stmr, 'stem', 0)
+
+    def test_cacheable(self):
+        """Test abydos.util._lru_cache._Cacheable."""
+        for obj, method, word in (
+            (BeiderMorse(), 'encode', 'Smith'),
+            (Porter2(), 'stem', 'running'),
+            (String(), 'fingerprint', 'The quick brown fox'),
+        ):
+            self.assertIsNone(obj.cache_info())
+            obj.cache_clear()
+            value = getattr(obj, method)(word)
+
+            obj.enable_cache(16)
+            self.assertEqual(getattr(obj, method)(word), value)
+            self.assertEqual(getattr(obj, method)(word), value)
+            self.assertEqual(tuple(obj.cache_info()), (1, 1, 0, 16, 1))
+
+            # pickled copies start with an empty cache
+            copy = pickle.loads(pickle.dumps(obj))
+            self.assertEqual(tuple(copy.cache_info()), (0, 0, 0, 16, 0))
+            self.assertEqual(getattr(copy, method)(word), value)
+            self.assertEqual(tuple(obj.cache_info()), (1, 1, 0, 16, 1))
+
+            obj.cache_clear()
+            self.assertEqual(tuple(obj.cache_info()), (0, 0, 0, 16, 0))
+            obj.disable_cache()
+            self.assertIsNone(obj.cache_info())
+            self.assertEqual(getattr(obj, method)(word), value)
+
+        # differently configured instances & arguments don't share entries
+        pa = Soundex()
+        pa.enable_cache()
+        pa6 = Soundex(max_length=6)
+        pa6.enable_cache()
+        self.assertEqual(pa.encode('Ashcroft'), 'A261')
+        self.assertEqual(pa6.encode('Ashcroft'), 'A26130')
+        self.assertEqual(pa.encode_alpha('Ashcroft'), 'AKRP')
+        self.assertEqual(tuple(pa.cache_info()), (1, 1, 0, 1024, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
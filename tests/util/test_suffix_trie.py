@@ -0,0 +1,59 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_suffix_trie.
+
+This module contains unit tests for abydos.util._suffix_trie
+"""
+
+import unittest
+
+from abydos.util._suffix_trie import _SuffixTrie
+
+
+class SuffixTrieTestCases(unittest.TestCase):
+    """Test cases for abydos.util._suffix_trie."""
+
+    def test_suffix_trie(self):
+        """Test abydos.util._suffix_trie._SuffixTrie."""
+        trie = _SuffixTrie([])
+        self.assertEqual(trie.matches(''), [])
+        self.assertEqual(trie.matches('word'), [])
+
+        trie = _SuffixTrie(
+            [('ness', 'n'), ('iveness', 'iv'), ('s', None), ('ss', 'ss')]
+        )
+        self.assertEqual(trie.matches(''), [])
+        self.assertEqual(
+            trie.matches('elusiveness'),
+            [(7, 'iv'), (4, 'n'), (2, 'ss'), (1, None)],
+        )
+        self.assertEqual(
+            trie.matches('elusiveness', min_stem=5),
+            [(4, 'n'), (2, 'ss'), (1, None)],
+        )
+        self.assertEqual(
+            trie.matches('ness'), [(4, 'n'), (2, 'ss'), (1, None)]
+        )
+        self.assertEqual(
+            trie.matches('ness', min_stem=1), [(2, 'ss'), (1, None)]
+        )
+        self.assertEqual(trie.matches('elusive'), [])
+        self.assertEqual(trie.matches('s', min_stem=1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()